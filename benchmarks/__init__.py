@@ -0,0 +1,8 @@
+"""
+Benchmarks y pruebas de estrés de la capa de datos. No se importan desde la
+app; cada script se corre como módulo desde la raíz del repo:
+
+    python -m benchmarks.suite               # suite completa + comparación con una base
+    python -m benchmarks.datasets --rows N   # solo generar datos sintéticos
+    python -m benchmarks.bench_sidecar       # y el resto de bench_* / stress_*
+"""
@@ -0,0 +1,70 @@
+"""
+Memoria y tiempos de las tablas cargadas: columnas object (como salen de
+read_excel) contra el esquema tipado de util_excel (categorías, Int64,
+float64 y texto Arrow si está pyarrow).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_esquema
+    python -m benchmarks.bench_esquema --rows 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+# La carpeta de trabajo tiene que estar definida antes de importar util_excel
+os.environ.setdefault("APP_EXCEL_DIR", tempfile.mkdtemp(prefix="bench_esquema_"))
+
+from src.data import util_excel as ux  # noqa: E402
+from benchmarks import datasets  # noqa: E402
+
+SCHEMAS = {
+    "clientes": ux._CLIENTES_SCHEMA,
+    "vehiculos": ux._VEHICULOS_SCHEMA,
+    "proveedores": ux._PROVEEDORES_SCHEMA,
+    "facturas": ux._FACTURAS_SCHEMA,
+}
+
+
+def _mb(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True).sum() / 1e6
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, nargs="+", default=[20_000])
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"texto: {ux._TEXT_DTYPE}")
+    print(f"{'filas':>8} | {'tabla':<12} | {'object MB':>9} | {'tipado MB':>9} | {'esquema ms':>10} | {'eq object ms':>12} | {'eq tipado ms':>12}")
+    for n in args.rows:
+        data = datasets.dataset(n)
+        for table, schema in SCHEMAS.items():
+            raw = data[table].astype(object)
+            typed = ux._apply_schema(raw.copy(), schema)
+            col = next((c for c, k in schema.items() if k == "category"), None)
+            eq_raw = eq_typed = float("nan")
+            if col:
+                value = str(raw[col].iat[0])
+                eq_raw = _best(lambda: raw[raw[col] == value], args.repeat)
+                eq_typed = _best(lambda: typed[typed[col] == value], args.repeat)
+            conv = _best(lambda: ux._apply_schema(raw.copy(), schema), args.repeat)
+            print(f"{n:>8} | {table:<12} | {_mb(raw):>9.1f} | {_mb(typed):>9.1f} | {conv:>10.1f} | {eq_raw:>12.2f} | {eq_typed:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
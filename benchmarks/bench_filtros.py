@@ -0,0 +1,105 @@
+"""
+Compara el filtrado de load_vehiculos de antes (un .map(_norm_text) por celda
+en cada filtro y en cada búsqueda) contra el motor de filtros con columnas
+normalizadas precalculadas (util_excel._filter).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_filtros
+    python -m benchmarks.bench_filtros --rows 50000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import pandas as pd
+
+# La carpeta de trabajo tiene que estar definida antes de importar util_excel
+os.environ.setdefault("APP_EXCEL_DIR", tempfile.mkdtemp(prefix="bench_filtros_"))
+
+from src.data import util_excel as ux  # noqa: E402
+
+MARCAS = ["Honda", "Yamaha", "Motomel", "Zanella", "Corven", "Gilera", "Keller", "Bajaj"]
+MODELOS = ["Wave", "Tornado", "Blitz", "Sapucai", "Energy", "Smash", "Rouser", "Dominar"]
+ESTADOS = ["Disponible", "Reservado", "Vendido", "No disponible"]
+
+# Cinco filtros activos, como en VehiculosMain con todos los campos cargados
+FILTROS = {"marca": "honda", "modelo": "wave", "nro_cuadro": "8dyc", "nro_motor": "fmh", "estado": "Disponible"}
+
+
+def _vehiculos(n: int) -> pd.DataFrame:
+    rnd = random.Random(n)
+    rows = []
+    for i in range(1, n + 1):
+        rows.append({
+            "id": i,
+            "marca": rnd.choice(MARCAS),
+            "modelo": f"{rnd.choice(MODELOS)} {rnd.randint(100, 300)}",
+            "anio": rnd.randint(2015, 2025),
+            "nro_cuadro": f"8DYC{rnd.randint(0, 10**10):010d}",
+            "nro_motor": f"ZS152{rnd.choice(['FMH', 'FMI', 'QMJ'])}{i:08d}",
+            "precio": round(rnd.uniform(900_000, 9_000_000), 2),
+            "estado": rnd.choice(ESTADOS),
+        })
+    return pd.DataFrame(rows)
+
+
+def _legacy(df: pd.DataFrame, filters: dict) -> pd.DataFrame:
+    """El filtrado de load_vehiculos antes del motor de filtros."""
+    def contains(col: str, val: str):
+        nonlocal df
+        if not val:
+            return
+        v = ux._norm_text(val)
+        s = df[col].astype(str).map(ux._norm_text)
+        df = df[s.str.contains(v, regex=False, na=False)]
+
+    def by_estado(val: str):
+        nonlocal df
+        if not val:
+            return
+        s = df["estado"].astype(str).map(ux._norm_text)
+        df = df[s.eq(ux._norm_text(val))]
+
+    for col in ("marca", "modelo", "nro_cuadro", "nro_motor"):
+        contains(col, filters.get(col, ""))
+    by_estado(filters.get("estado"))
+    return df.reset_index(drop=True)
+
+
+def _timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=50_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    ux.write_vehiculos_df(_vehiculos(args.rows))
+    df = ux._vehiculos().df
+
+    t_legacy = _timeit(lambda: _legacy(df, FILTROS), args.repeat)
+    t0 = time.perf_counter()
+    nuevo = ux.load_vehiculos(FILTROS)  # primera búsqueda: arma las columnas sombra
+    t_first = time.perf_counter() - t0
+    t_engine = _timeit(lambda: ux.load_vehiculos(FILTROS), args.repeat)
+
+    assert nuevo["id"].tolist() == _legacy(df, FILTROS)["id"].tolist()
+    print(f"filas={args.rows} filtros={len(FILTROS)} resultado={len(nuevo)}")
+    print(f"  antes (map por celda):        {t_legacy * 1000:8.1f} ms")
+    print(f"  motor, primera búsqueda:      {t_first * 1000:8.1f} ms")
+    print(f"  motor, búsquedas siguientes:  {t_engine * 1000:8.1f} ms  ({t_legacy / max(t_engine, 1e-9):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
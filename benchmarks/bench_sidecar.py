@@ -0,0 +1,83 @@
+"""
+Compara la lectura en frío de un .xlsx (pd.read_excel) contra la lectura desde
+el snapshot binario de .cache/ que mantiene util_excel._read_xlsx.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_sidecar
+    python -m benchmarks.bench_sidecar --sizes 1000 10000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# La carpeta de trabajo tiene que estar definida antes de importar util_excel
+os.environ.setdefault("APP_EXCEL_DIR", tempfile.mkdtemp(prefix="bench_sidecar_"))
+
+from src.data import util_excel as ux  # noqa: E402
+
+MARCAS = ["Honda", "Yamaha", "Motomel", "Zanella", "Corven", "Gilera", "Keller", "Bajaj"]
+ESTADOS = ["Disponible", "Reservado", "Vendido", "No disponible"]
+
+
+def _vehiculos(n: int) -> pd.DataFrame:
+    rnd = random.Random(n)
+    rows = []
+    for i in range(1, n + 1):
+        rows.append({
+            "id": i,
+            "marca": rnd.choice(MARCAS),
+            "modelo": f"M{rnd.randint(100, 999)}",
+            "anio": rnd.randint(2015, 2025),
+            "nro_cuadro": f"8DYC{i:010d}TB",
+            "nro_motor": f"ZS152FMH{i:08d}",
+            "precio": round(rnd.uniform(900_000, 9_000_000), 2),
+            "estado": rnd.choice(ESTADOS),
+        })
+    return pd.DataFrame(rows)
+
+
+def _timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    base = Path(os.environ["APP_EXCEL_DIR"])
+    cols = list(_vehiculos(1).columns)
+    print(f"{'filas':>8} | {'xlsx (s)':>10} | {'sidecar (s)':>11} | {'x':>7}")
+    print("-" * 46)
+    for n in args.sizes:
+        path = base / f"bench_{n}.xlsx"
+        ux._write_xlsx(path, _vehiculos(n), "vehiculos")
+
+        t_xlsx = _timeit(lambda: pd.read_excel(path, sheet_name=0, dtype=object), args.repeat)
+
+        ux.clear_cache()
+        ux._read_xlsx(path, cols)  # genera el snapshot
+
+        def _sidecar():
+            ux.clear_cache()  # sin cache en memoria: solo el snapshot de disco
+            ux._read_xlsx(path, cols)
+
+        t_side = _timeit(_sidecar, args.repeat)
+        print(f"{n:>8} | {t_xlsx:>10.3f} | {t_side:>11.4f} | {t_xlsx / max(t_side, 1e-9):>6.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Tiempos de la tabla de vehiculos con el paginador sobre un resultado grande:
+cargar el resultado, pasar de página, ir a la última, cambiar el tamaño de
+página, pintar páginas, ordenar y el scroll infinito ("Todos" + fetchMore).
+Corre sin ventana (QT_QPA_PLATFORM=offscreen si no hay display).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_tabla
+    python -m benchmarks.bench_tabla --rows 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# La carpeta de trabajo tiene que estar definida antes de importar util_excel
+os.environ.setdefault("APP_EXCEL_DIR", tempfile.mkdtemp(prefix="bench_tabla_"))
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from benchmarks import datasets  # noqa: E402
+from src.data import util_excel as ux  # noqa: E402
+from src.ui.pages.vehiculos.vehiculos_tabla import VehiculosTabla  # noqa: E402
+from src.ui.widgets.paginator import ALL_ROWS, TablePaginator  # noqa: E402
+
+
+def _ms(fn, repeat: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        QApplication.processEvents()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    print(f"{'filas':>8} | {'medición':<26} | {'ms':>8}")
+    for n in args.rows:
+        # Con el esquema tipado, como llega de load_vehiculos
+        df = ux._apply_schema(datasets.vehiculos(n), ux._VEHICULOS_SCHEMA)
+        tabla = VehiculosTabla()
+        pag = TablePaginator(tabla)
+        tabla.resize(1200, 700)
+        tabla.show()
+        model = tabla.model
+
+        def row(label: str, ms: float) -> None:
+            print(f"{n:>8} | {label:<26} | {ms:>8.2f}")
+
+        row("set_dataframe", _ms(lambda: pag.set_dataframe(df)))
+        row("página siguiente", _ms(pag.next_page, args.repeat))
+        assert model.get_row_id(0) == int(df["id"].iat[(pag.current_page - 1) * pag.rows_per_page])
+
+        def last_page() -> None:
+            pag.current_page = pag._total_pages()
+            pag._update_table()
+        row("última página", _ms(last_page))
+        assert model.rowCount() == n - (pag.current_page - 1) * pag.rows_per_page
+
+        for size in ("50", "10"):
+            row(f"filas por página {size}", _ms(lambda: pag.cmb_rows.setCurrentText(size)))
+            assert model.rowCount() == min(int(size), n)
+
+        # Pintar: 20 páginas de 50 pintadas de verdad (data() de cada celda visible)
+        pag.cmb_rows.setCurrentText("50")
+
+        def paint_pages() -> None:
+            pag.current_page = 1
+            for _ in range(20):
+                pag.next_page()
+                tabla.view.viewport().grab()
+        row("pintar 20 páginas x50", _ms(paint_pages, args.repeat))
+        row("repintar página", _ms(lambda: tabla.view.viewport().grab(), args.repeat))
+
+        display, align = Qt.DisplayRole, Qt.TextAlignmentRole
+
+        def data_pages() -> None:
+            pag.current_page = 1
+            for _ in range(20):
+                pag.next_page()
+                for r in range(model.rowCount()):
+                    for c in range(model.columnCount()):
+                        index = model.index(r, c)
+                        model.data(index, display)
+                        model.data(index, align)
+        row("data() 20 páginas x50", _ms(data_pages, args.repeat))
+        pag.cmb_rows.setCurrentText("10")
+
+        # Orden sobre el resultado completo: la primera vez calcula la permutación,
+        # después (misma columna y sentido) sale de la caché
+        for column in ("precio", "anio", "estado"):
+            row(f"ordenar {column}", _ms(lambda: pag.sort_by(column)))
+            row(f"ordenar {column} desc", _ms(lambda: pag.sort_by(column, True)))
+        row("reordenar (caché)", _ms(lambda: pag.sort_by("precio"), args.repeat))
+        row("página siguiente (orden)", _ms(pag.next_page, args.repeat))
+        pag.sort_by(None)
+
+        row("scroll infinito", _ms(lambda: pag.cmb_rows.setCurrentText(ALL_ROWS)))
+        row("fetchMore x10", _ms(lambda: [model.fetchMore() for _ in range(10)]))
+        tabla.close()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
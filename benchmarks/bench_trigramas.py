@@ -0,0 +1,92 @@
+"""
+Búsqueda por fragmento de nro_cuadro / nro_motor: recorrido completo de la
+columna normalizada contra los candidatos del índice de trigramas.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_trigramas
+    python -m benchmarks.bench_trigramas --rows 100000 300000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import pandas as pd
+
+# La carpeta de trabajo tiene que estar definida antes de importar util_excel
+os.environ.setdefault("APP_EXCEL_DIR", tempfile.mkdtemp(prefix="bench_trigramas_"))
+
+from src.data import util_excel as ux  # noqa: E402
+
+MARCAS = ["Honda", "Yamaha", "Motomel", "Zanella", "Corven", "Gilera", "Keller", "Bajaj"]
+
+
+def _vehiculos(n: int) -> pd.DataFrame:
+    rnd = random.Random(n)
+    hex_ = "0123456789ABCDEFGHJKLMNPRSTUVWXYZ"
+    return pd.DataFrame({
+        "id": range(1, n + 1),
+        "marca": [rnd.choice(MARCAS) for _ in range(n)],
+        "modelo": [f"M{rnd.randint(100, 999)}" for _ in range(n)],
+        "nro_cuadro": ["".join(rnd.choice(hex_) for _ in range(17)) for _ in range(n)],
+        "nro_motor": [f"{rnd.choice(['ZS152FMH', '1P52FMI', 'JL162FMJ'])}{rnd.randint(0, 10**8):08d}" for _ in range(n)],
+        "estado": "Disponible",
+    })
+
+
+def _timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    rnd = random.Random(0)
+    for n in args.rows:
+        df = _vehiculos(n)
+        ux.clear_cache()
+        ux._state_invalidate(ux.VEHICULOS_XLSX)
+        ux.write_vehiculos_df(df)
+        st = ux._vehiculos()
+        ux._shadow(st, "text", "nro_cuadro")
+        ux._shadow(st, "text", "nro_motor")
+
+        t0 = time.perf_counter()
+        ux._trigram_index(st, "nro_cuadro")
+        ux._trigram_index(st, "nro_motor")
+        t_build = time.perf_counter() - t0
+
+        print(f"filas={n}  armado del índice (2 columnas): {t_build:.2f} s")
+        for col, frag in (("nro_cuadro", df["nro_cuadro"].iloc[rnd.randrange(n)][5:11]),
+                          ("nro_motor", df["nro_motor"].iloc[rnd.randrange(n)][-6:])):
+            scan = ux._filter(st, [("contains", col, frag)])
+            idx = ux._filter(st, [("search", col, frag)])
+            assert scan["id"].tolist() == idx["id"].tolist()
+            t_scan = _timeit(lambda: ux._filter(st, [("contains", col, frag)]), args.repeat)
+            t_idx = _timeit(lambda: ux._filter(st, [("search", col, frag)]), args.repeat)
+            print(f"  {col:<10} '{frag}': {len(idx):>3} filas | recorrido {t_scan * 1000:7.2f} ms"
+                  f" | trigramas {t_idx * 1000:6.2f} ms")
+
+        # Alta incremental: el índice se actualiza sin rearmarse
+        t0 = time.perf_counter()
+        vid = ux.upsert_vehiculo({"marca": "Honda", "modelo": "Wave", "nro_cuadro": "LX8PCJ0A9RE000123",
+                                  "nro_motor": "ZS152FMH99999999", "estado": "Disponible"})
+        found = ux.load_vehiculos({"nro_cuadro": "a9re000"})
+        t_upd = time.perf_counter() - t0
+        assert vid in found["id"].tolist()
+        print(f"  upsert + búsqueda del alta: {t_upd * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Tiempo de parseo y pico de memoria de cada motor de lectura de .xlsx
+(util_excel._XLSX_ENGINES) sobre libros generados de tamaño creciente.
+
+Cada medición corre en un proceso aparte para que el pico de memoria no
+arrastre lo de mediciones anteriores; "base" es la memoria del proceso ya con
+pandas y util_excel importados, antes de parsear.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_xlsx_engines
+    python -m benchmarks.bench_xlsx_engines --sizes 1000 10000 50000 --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# La carpeta de trabajo tiene que estar definida antes de importar util_excel
+os.environ.setdefault("APP_EXCEL_DIR", tempfile.mkdtemp(prefix="bench_engines_"))
+
+from src.data import util_excel as ux  # noqa: E402
+from benchmarks.bench_sidecar import _vehiculos  # noqa: E402
+
+
+def _peak_mb() -> float:
+    # En Linux VmHWM es el pico del proceso actual (ru_maxrss arrastra el del
+    # padre a través del exec); en el resto uso ru_maxrss
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _reset_peak() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")  # reinicia VmHWM
+    except OSError:
+        pass
+
+
+def _child(engine: str, path: str, repeat: int) -> None:
+    import pandas as pd  # noqa: F401  (la base de memoria ya incluye pandas)
+
+    _reset_peak()
+    base = _peak_mb()
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        ux._parse_xlsx(Path(path), engine)
+        best = min(best, time.perf_counter() - t0)
+    print(json.dumps({"seconds": best, "peak_mb": _peak_mb(), "base_mb": base}))
+
+
+def _measure(engine: str, path: Path, repeat: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_xlsx_engines", "--child", engine, str(path), "--repeat", str(repeat)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--child", nargs=2, metavar=("ENGINE", "PATH"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        _child(args.child[0], args.child[1], args.repeat)
+        return
+
+    engines = ux.available_xlsx_engines()
+    print(f"motores instalados: {', '.join(engines)} (auto elige: {ux.xlsx_engine()})")
+    print(f"{'filas':>8} | {'motor':<9} | {'parseo (s)':>10} | {'pico RSS (MB)':>13} | {'base (MB)':>9}")
+    print("-" * 62)
+    base = Path(os.environ["APP_EXCEL_DIR"])
+    for n in args.sizes:
+        path = base / f"bench_{n}.xlsx"
+        ux._write_xlsx(path, _vehiculos(n), "vehiculos")
+        for engine in engines:
+            r = _measure(engine, path, args.repeat)
+            print(f"{n:>8} | {engine:<9} | {r['seconds']:>10.3f} | {r['peak_mb']:>13.1f} | {r['base_mb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Datos sintéticos con forma realista para medir la capa de datos: clientes
+(DNI / CUIT con dígito verificador válido), vehiculos (cuadro y motor únicos,
+certificado, DNRPA, remito), proveedores (CUIT de empresa) y facturas con la
+numeración PPPP-NNNNNNNN sin huecos.
+
+Todo sale de un generador con semilla: la misma (n, seed) da siempre los
+mismos datos, así dos corridas del benchmark miden exactamente lo mismo.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.datasets --rows 10000 --dir /tmp/datos_10k
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+NOMBRES = ["Juan", "María", "Carlos", "Ana", "Jorge", "Lucía", "Martín", "Sofía", "Diego", "Valentina",
+           "Pablo", "Camila", "Sergio", "Florencia", "Matías", "Julieta", "Nicolás", "Agustina", "Héctor", "Rocío"]
+APELLIDOS = ["González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez", "García",
+             "Sánchez", "Romero", "Sosa", "Álvarez", "Torres", "Ruiz", "Ramírez", "Flores", "Benítez", "Acosta", "Medina"]
+CALLES = ["San Martín", "Belgrano", "Rivadavia", "Mitre", "Sarmiento", "Moreno", "Av. Libertador",
+          "Av. Corrientes", "9 de Julio", "Urquiza", "Alsina", "Independencia"]
+MODELOS = {
+    "Honda": ["Wave 110", "CG 150 Titan", "XR 150L", "CB 190R", "XRE 300"],
+    "Yamaha": ["Crypton 110", "YBR 125", "FZ 25", "XTZ 150", "MT-03"],
+    "Motomel": ["Blitz 110", "Skua 150", "Sirius 190", "CG 150 S2"],
+    "Zanella": ["ZB 110", "RX 150", "ZR 250", "Patagonian Eagle"],
+    "Corven": ["Energy 110", "Hunter 150", "Triax 200", "TXR 250"],
+    "Gilera": ["Smash 110", "VC 150", "Sahel 150"],
+    "Bajaj": ["Rouser NS 200", "Dominar 400", "Boxer 150"],
+    "Keller": ["Stratus 150", "Miracle 200"],
+}
+EMPRESAS = ["Motos", "Repuestos", "Distribuidora", "Importadora", "Comercial", "Logística"]
+SUFIJOS = ["S.A.", "S.R.L.", "S.A.S."]
+ESTADOS_PERSONA = ["Activo"] * 9 + ["Inactivo"]
+ESTADOS_VEHICULO = ["Disponible", "Disponible", "Reservado", "Vendido", "Vendido", "No disponible"]
+TIPOS = ["Factura A", "Factura B", "Factura B", "Factura C", "Nota de Crédito B"]
+PAGOS = ["Contado", "Transferencia", "Financiado"]
+PUNTO_VENTA = "0001"
+
+_CUIT_PESOS = np.array([5, 4, 3, 2, 7, 6, 5, 4, 3, 2])
+
+
+def _pick(rng: np.random.Generator, values, n: int) -> np.ndarray:
+    return np.asarray(values, dtype=object)[rng.integers(0, len(values), n)]
+
+
+def _join(*parts) -> np.ndarray:
+    """Concatena columnas de texto elemento a elemento."""
+    out = np.asarray(parts[0]).astype(str).astype(object)
+    for p in parts[1:]:
+        out = out + np.asarray(p).astype(str).astype(object)
+    return out
+
+
+def _digits(values: np.ndarray, width: int) -> np.ndarray:
+    return np.char.zfill(values.astype(str), width).astype(object)
+
+
+def cuit(prefijos: np.ndarray, dnis: np.ndarray) -> np.ndarray:
+    """CUIT/CUIL 'PP-DDDDDDDD-V' con el dígito verificador de AFIP."""
+    pref = prefijos.astype(np.int64).copy()
+    nums = pref * 100_000_000 + dnis.astype(np.int64)
+    cifras = (nums[:, None] // 10 ** np.arange(9, -1, -1)) % 10
+    dv = 11 - (cifras @ _CUIT_PESOS) % 11
+    dv = np.where(dv == 11, 0, dv)
+    # Resto 10: AFIP pasa el prefijo a 23 (o 33 en empresas) con dígito fijo
+    diez = dv == 10
+    pref[diez] = np.where(pref[diez] >= 30, 33, 23)
+    dv[diez] = np.where(prefijos[diez] == 27, 4, 9)
+    return _join(pref, "-", _digits(dnis, 8), "-", dv)
+
+
+def clientes(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ids = np.arange(1, n + 1)
+    nombres = _pick(rng, NOMBRES, n)
+    apellidos = _pick(rng, APELLIDOS, n)
+    # DNI únicos entre 10 y 45 millones
+    dnis = 10_000_000 + rng.choice(35_000_000, n, replace=False)
+    con_cuit = rng.random(n) < 0.3
+    cuits = np.where(con_cuit, cuit(_pick(rng, [20, 27], n), dnis), "")
+    usuarios = np.char.lower(np.char.replace(_join(nombres, ".", apellidos, ids).astype(str), " ", ""))
+    return pd.DataFrame({
+        "id": ids,
+        "cliente_id": ids,
+        "nombre": nombres,
+        "apellido": apellidos,
+        "dni": dnis.astype(str),
+        "cuit": cuits,
+        "email": _join(usuarios, "@", _pick(rng, ["gmail.com", "hotmail.com", "yahoo.com.ar"], n)),
+        "telefono": _join("11", _digits(rng.integers(0, 100_000_000, n), 8)),
+        "direccion": _join(_pick(rng, CALLES, n), " ", rng.integers(1, 5000, n)),
+        "estado": _pick(rng, ESTADOS_PERSONA, n),
+    })
+
+
+def vehiculos(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed + 1)
+    ids = np.arange(1, n + 1)
+    pares = [(marca, modelo) for marca, modelos in MODELOS.items() for modelo in modelos]
+    elegidos = rng.integers(0, len(pares), n)
+    marcas = np.array([m for m, _ in pares], dtype=object)[elegidos]
+    modelos = np.array([m for _, m in pares], dtype=object)[elegidos]
+    anios = rng.integers(2015, 2026, n)
+    estados = _pick(rng, ESTADOS_VEHICULO, n)
+    vendido = estados == "Vendido"
+    return pd.DataFrame({
+        "id": ids,
+        "cliente_id": np.where(vendido, rng.integers(1, max(n, 2), n).astype(str), ""),
+        "marca": marcas,
+        "modelo": modelos,
+        "anio": anios,
+        "nro_certificado": _join("044-", _digits(180_000 + ids, 9), "/", anios),
+        "nro_dnrpa": _join("M-", _digits(546_000 + ids, 10), "/", anios),
+        # Cuadro tipo VIN (17) y motor con prefijo de fábrica: únicos por id
+        "nro_cuadro": _join("8DYC", _digits(ids, 7), _pick(rng, ["TB", "TC", "TD"], n), anios % 100, "40"),
+        "nro_motor": _join(_pick(rng, ["ZS152FMH", "JC162FMJ", "KW167FML"], n), _digits(ids, 8)),
+        "precio": np.round(rng.uniform(900_000, 9_000_000, n), 2),
+        "remito": _join("0007-", _digits(87_000 + ids // 20, 8)),
+        "factura": np.where(vendido, _join("A-", _digits(100_000 + ids, 6)), ""),
+        "estado": estados,
+    })
+
+
+def proveedores(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed + 2)
+    ids = np.arange(1, n + 1)
+    razones = _join(_pick(rng, EMPRESAS, n), " ", _pick(rng, APELLIDOS, n), " ", _pick(rng, SUFIJOS, n))
+    bases = 50_000_000 + rng.choice(49_999_999, n, replace=False)
+    return pd.DataFrame({
+        "id": ids,
+        "proveedor_id": ids,
+        "nombre": razones,
+        "cuit": cuit(_pick(rng, [30, 33], n), bases),
+        "email": _join("ventas", ids, "@proveedor.com.ar"),
+        "telefono": _join("11", _digits(rng.integers(0, 100_000_000, n), 8)),
+        "direccion": _join(_pick(rng, CALLES, n), " ", rng.integers(1, 5000, n)),
+        "estado": _pick(rng, ESTADOS_PERSONA, n),
+    })
+
+
+def facturas(n: int, seed: int = 0, clientes_df: pd.DataFrame | None = None,
+             vehiculos_df: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Facturas correlativas 0001-00000001..n, en orden de fecha."""
+    rng = np.random.default_rng(seed + 3)
+    clientes_df = clientes(min(n, 10_000), seed) if clientes_df is None else clientes_df
+    vehiculos_df = vehiculos(min(n, 10_000), seed) if vehiculos_df is None else vehiculos_df
+    cli = rng.integers(0, len(clientes_df), n)
+    veh = rng.integers(0, len(vehiculos_df), n)
+    subtotal = np.round(rng.uniform(900_000, 9_000_000, n), 2)
+    iva = np.round(subtotal * 0.21, 2)
+    dias = np.sort(rng.integers(0, 3 * 365, n))
+    fechas = pd.Timestamp("2023-01-01") + pd.to_timedelta(dias, unit="D")
+    cuit_cli = clientes_df["cuit"].to_numpy()[cli]
+    return pd.DataFrame({
+        "numero": _join(PUNTO_VENTA, "-", _digits(np.arange(1, n + 1), 8)),
+        "fecha": fechas.strftime("%Y-%m-%d"),
+        "cliente": _join(clientes_df["nombre"].to_numpy()[cli], " ", clientes_df["apellido"].to_numpy()[cli]),
+        "cuit_dni_cliente": np.where(cuit_cli != "", cuit_cli, clientes_df["dni"].to_numpy()[cli]),
+        "vehiculo": _join(vehiculos_df["marca"].to_numpy()[veh], " ", vehiculos_df["modelo"].to_numpy()[veh]),
+        "patente": _join("A", _digits(rng.integers(0, 1000, n), 3), "XYZ"),
+        "tipo": _pick(rng, TIPOS, n),
+        "pago": _pick(rng, PAGOS, n),
+        "subtotal": subtotal,
+        "iva": iva,
+        "total": np.round(subtotal + iva, 2),
+        "cae": _digits(rng.integers(10**13, 10**14, n), 14),
+        "vto_cae": (fechas + pd.Timedelta(days=10)).strftime("%d/%m/%Y"),
+    })
+
+
+def dataset(n: int, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """Las cuatro tablas con n filas cada una (facturas referencia clientes/vehiculos reales)."""
+    cli = clientes(n, seed)
+    veh = vehiculos(n, seed)
+    return {
+        "clientes": cli,
+        "vehiculos": veh,
+        "proveedores": proveedores(n, seed),
+        "facturas": facturas(n, seed, cli, veh),
+    }
+
+
+def write_dataset(n: int, seed: int = 0) -> Dict[str, int]:
+    """Genera y graba las cuatro tablas en la carpeta de util_excel (APP_EXCEL_DIR)."""
+    from src.data import util_excel as ux
+
+    data = dataset(n, seed)
+    ux.write_clientes_df(data["clientes"])
+    ux.write_vehiculos_df(data["vehiculos"])
+    ux.write_proveedores_df(data["proveedores"])
+    ux.write_facturas_df(data["facturas"])
+    return {name: len(df) for name, df in data.items()}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=1_000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--dir", required=True, help="carpeta destino (se usa como APP_EXCEL_DIR)")
+    args = ap.parse_args()
+
+    os.makedirs(args.dir, exist_ok=True)
+    os.environ["APP_EXCEL_DIR"] = os.path.abspath(args.dir)
+    counts = write_dataset(args.rows, args.seed)
+    print(", ".join(f"{k}={v}" for k, v in counts.items()), "->", os.environ["APP_EXCEL_DIR"])
+
+
+if __name__ == "__main__":
+    main()
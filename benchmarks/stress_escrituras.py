@@ -0,0 +1,81 @@
+"""
+Prueba de estrés de escrituras concurrentes: varios procesos (los "puestos")
+sobre la misma carpeta de Excel dando de alta clientes y proveedores a la vez.
+
+Al final verifica que no se haya perdido ninguna fila y que los ids no se
+repitan (dos altas simultáneas no pueden quedarse con el mismo max+1).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.stress_escrituras
+    python -m benchmarks.stress_escrituras --procs 6 --altas 20
+    APP_JOURNAL=0 python -m benchmarks.stress_escrituras   # reescribiendo el Excel
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import sys
+import tempfile
+import time
+
+
+def _worker(idx: int, n: int) -> None:
+    from src.data import util_excel as ux
+
+    rnd = random.Random(idx)
+    for i in range(n):
+        ux.upsert_cliente({"nombre": f"P{idx}", "apellido": f"C{i}", "dni": f"{idx:02d}{i:06d}"})
+        if rnd.random() < 0.5:
+            ux.upsert_proveedor({"nombre": f"P{idx}", "cuit": f"{idx:02d}-{i:08d}-0"})
+        time.sleep(rnd.uniform(0, 0.005))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--procs", type=int, default=4)
+    ap.add_argument("--altas", type=int, default=15, help="clientes por proceso")
+    args = ap.parse_args()
+
+    # Carpeta vacía para no tocar los datos reales; los hijos heredan el entorno
+    os.environ["APP_EXCEL_DIR"] = tempfile.mkdtemp(prefix="stress_escrituras_")
+
+    t0 = time.perf_counter()
+    ctx = mp.get_context("spawn")
+    procs = [ctx.Process(target=_worker, args=(i, args.altas)) for i in range(args.procs)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - t0
+    if any(p.exitcode for p in procs):
+        print("ERROR: algún proceso terminó con error")
+        return 1
+
+    from src.data import util_excel as ux
+
+    ux.compact_journals()
+    clientes = ux.load_clientes()
+    esperados = {f"{i:02d}{j:06d}" for i in range(args.procs) for j in range(args.altas)}
+    ids = clientes["id"].astype(int).tolist()
+    print(f"journal={'sí' if ux.JOURNAL else 'no'} procesos={args.procs} clientes={len(clientes)} "
+          f"proveedores={len(ux.load_proveedores())} en {elapsed:.2f}s")
+    ok = True
+    if set(clientes["dni"].astype(str)) != esperados:
+        print(f"ERROR: faltan clientes ({len(esperados - set(clientes['dni'].astype(str)))})")
+        ok = False
+    if len(ids) != len(set(ids)):
+        print("ERROR: ids de cliente repetidos")
+        ok = False
+    prov_ids = ux.load_proveedores()["id"].astype(int).tolist()
+    if len(prov_ids) != len(set(prov_ids)):
+        print("ERROR: ids de proveedor repetidos")
+        ok = False
+    if ok:
+        print("OK: sin filas perdidas ni ids repetidos")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
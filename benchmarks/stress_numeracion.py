@@ -0,0 +1,88 @@
+"""
+Prueba de estrés de la numeración de facturas con varios procesos a la vez.
+
+Cada proceso reserva un número, a veces "falla" (lo libera y reintenta) y si no
+lo marca autorizado y registra la factura. Al final se verifica que los números
+queden únicos y correlativos (0001-00000001 .. 0001-0000000N), sin huecos.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.stress_numeracion
+    python -m benchmarks.stress_numeracion --procs 8 --facturas 25
+    APP_STORAGE=sqlite python -m benchmarks.stress_numeracion
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import sys
+import tempfile
+import time
+
+PV = "0001"
+
+
+def _worker(idx: int, n: int, fail_rate: float) -> None:
+    from src.data import storage as ux
+
+    rnd = random.Random(idx)
+    hechas = 0
+    while hechas < n:
+        numero = ux.reserve_numero_factura(PV)
+        time.sleep(rnd.uniform(0, 0.01))  # la "llamada a ARCA"
+        if rnd.random() < fail_rate:
+            ux.release_numero_factura(numero)
+            continue
+        ux.authorize_numero_factura(numero)
+        ux.append_factura({
+            "numero": numero,
+            "fecha": "2025-01-01",
+            "cliente": f"Proceso {idx}",
+            "total": 1000.0,
+        })
+        hechas += 1
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--procs", type=int, default=4)
+    ap.add_argument("--facturas", type=int, default=15, help="facturas por proceso")
+    ap.add_argument("--fallas", type=float, default=0.2, help="proporción de emisiones que se liberan")
+    args = ap.parse_args()
+
+    # Carpeta vacía para no tocar los datos reales; los hijos heredan el entorno
+    os.environ["APP_EXCEL_DIR"] = tempfile.mkdtemp(prefix="stress_numeracion_")
+    os.environ.setdefault("APP_SQLITE_PATH", os.path.join(os.environ["APP_EXCEL_DIR"], "gestion.db"))
+
+    t0 = time.perf_counter()
+    ctx = mp.get_context("spawn")
+    procs = [ctx.Process(target=_worker, args=(i, args.facturas, args.fallas)) for i in range(args.procs)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - t0
+    if any(p.exitcode for p in procs):
+        print("ERROR: algún proceso terminó con error")
+        return 1
+
+    from src.data import storage as ux
+
+    numeros = ux.load_facturas()["numero"].astype(str).tolist()
+    total = args.procs * args.facturas
+    esperados = [f"{PV}-{i:08d}" for i in range(1, total + 1)]
+    print(f"backend={ux.BACKEND_NAME} procesos={args.procs} facturas={len(numeros)} en {elapsed:.2f}s")
+    if len(numeros) != len(set(numeros)):
+        print("ERROR: números duplicados")
+        return 1
+    if sorted(numeros) != esperados:
+        faltan = sorted(set(esperados) - set(numeros))[:10]
+        print(f"ERROR: la numeración no es correlativa (faltan {faltan})")
+        return 1
+    print(f"OK: {PV}-00000001 .. {esperados[-1]} sin huecos ni duplicados")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Suite de rendimiento de la capa de datos sobre datos sintéticos
+(benchmarks.datasets) de distintos tamaños.
+
+Mide load_* (en frío, en caliente, con filtros y tecleando), get_*_by_id,
+upsert_* (alta, modificación y por lote), append_factura,
+get_ultimo_numero_factura, write_*_df y compact_journals. Cada tamaño corre en un proceso aparte con su
+propia carpeta temporal. El resultado es un JSON que se puede comparar contra
+una corrida anterior para ver regresiones.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.suite --out base.json
+    python -m benchmarks.suite --sizes 1000 10000 100000 1000000 --out base.json
+    python -m benchmarks.suite --out nuevo.json --baseline base.json
+    python -m benchmarks.suite --compare base.json nuevo.json
+
+Con --baseline / --compare sale con código 1 si alguna medición empeoró más
+que --tolerance (y más de --min-ms en valor absoluto, para no marcar ruido).
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def _log(msg: str) -> None:
+    print(msg, file=sys.stderr, flush=True)
+
+
+def _timeit(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    times: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {
+        "median_ms": round(statistics.median(times) * 1000, 3),
+        "best_ms": round(min(times) * 1000, 3),
+        "runs": len(times),
+    }
+
+
+# ---------- Mediciones (proceso hijo) ----------
+def _child(n: int, repeat: int, seed: int) -> Dict[str, Any]:
+    from src.data import util_excel as ux
+    from benchmarks import datasets
+
+    res: Dict[str, Any] = {}
+
+    def run(label: str, fn: Callable[[], Any], times: int = repeat) -> None:
+        res[label] = _timeit(fn, times)
+        _log(f"  [{n}] {label}: {res[label]['median_ms']:.2f} ms")
+
+    data = datasets.dataset(n, seed)
+    for table in ("clientes", "vehiculos", "proveedores", "facturas"):
+        write = getattr(ux, f"write_{table}_df")
+        run(f"write_{table}_df", lambda: write(data[table]), 1)
+
+    # En frío: sin caché en memoria ni snapshot en .cache/ (se acaba de escribir)
+    ux.clear_cache()
+    for table in ("clientes", "vehiculos", "proveedores", "facturas"):
+        run(f"load_{table}[frio]", getattr(ux, f"load_{table}"), 1)
+    for table in ("clientes", "vehiculos", "proveedores", "facturas"):
+        run(f"load_{table}", getattr(ux, f"load_{table}"))
+
+    cli, veh, prov = data["clientes"], data["vehiculos"], data["proveedores"]
+    mid = n // 2
+    filtros = {
+        "clientes": [
+            {"nombre": "mart"},
+            {"dni": str(cli["dni"].iat[mid])[:5]},
+            {"estado": "Activo"},
+            {"apellido": "gonz", "estado": "Activo"},
+        ],
+        "vehiculos": [
+            {"marca": "honda", "estado": "Disponible"},
+            {"nro_cuadro": str(veh["nro_cuadro"].iat[mid])[4:11]},
+            {"anio": "2020"},
+        ],
+        "proveedores": [
+            {"cuit": str(prov["cuit"].iat[mid])[:7]},
+            {"nombre": "motos", "estado": "Activo"},
+        ],
+        "facturas": [
+            {"cliente": "perez"},
+        ],
+    }
+    for table, casos in filtros.items():
+        load = getattr(ux, f"load_{table}")
+        for f in casos:
+            label = ",".join(f"{k}={v}" for k, v in f.items())
+            run(f"load_{table}[{label}]", lambda load=load, f=f: load(f))
+
+    # Búsqueda mientras se escribe: cada tecla estrecha la consulta anterior y
+    # se resuelve refinando ese resultado (un cuadro distinto en cada repetición)
+    cuadros = itertools.cycle(range(mid, n, max(1, (n - mid) // repeat)))
+
+    def tecleo() -> None:
+        frag = str(veh["nro_cuadro"].iat[next(cuadros)])[4:11]
+        for i in range(1, len(frag) + 1):
+            ux.load_vehiculos({"estado": "Disponible", "nro_cuadro": frag[:i]})
+    run("load_vehiculos[tecleo x7]", tecleo)
+
+    # Lecturas puntuales: un id distinto en cada repetición
+    for name in ("get_cliente_by_id", "get_vehiculo_by_id", "get_proveedor_by_id"):
+        ids = itertools.cycle(range(1, n + 1, max(1, n // repeat)))
+        run(name, lambda getter=getattr(ux, name), ids=ids: getter(next(ids)))
+
+    # Escrituras (con journal activo, cada una agrega al journal)
+    altas = itertools.count(n + 1)
+    mods = itertools.cycle(range(1, n + 1, max(1, n // repeat)))
+    run("upsert_cliente[alta]", lambda: ux.upsert_cliente(
+        {"nombre": "Bench", "apellido": "Alta", "dni": str(90_000_000 + next(altas))}))
+    run("upsert_cliente[modificacion]", lambda: ux.upsert_cliente(
+        {"id": next(mods), "telefono": "1100000000"}))
+    run("upsert_vehiculo[alta]", lambda: ux.upsert_vehiculo(
+        {"marca": "Honda", "modelo": "Wave 110", "nro_cuadro": f"BENCH{next(altas):012d}", "estado": "Disponible"}))
+    run("upsert_vehiculo[modificacion]", lambda: ux.upsert_vehiculo(
+        {"id": next(mods), "estado": "Reservado"}))
+    run("upsert_proveedor[alta]", lambda: ux.upsert_proveedor(
+        {"nombre": "Bench S.A.", "cuit": f"30-{next(altas):08d}-0"}))
+    run("upsert_proveedor[modificacion]", lambda: ux.upsert_proveedor(
+        {"id": next(mods), "telefono": "1100000000"}))
+    lote = lambda: [{"nombre": "Lote", "apellido": str(i), "dni": str(95_000_000 + next(altas))} for i in range(100)]
+    run("upsert_clientes_many[100]", lambda: ux.upsert_clientes_many(lote()))
+    lote_v = lambda: [{"marca": "Yamaha", "nro_motor": f"BENCH{next(altas):010d}"} for _ in range(100)]
+    run("upsert_vehiculos_many[100]", lambda: ux.upsert_vehiculos_many(lote_v()))
+
+    run("get_ultimo_numero_factura", ux.get_ultimo_numero_factura)
+
+    def append() -> None:
+        ux.append_factura({"numero": ux.get_ultimo_numero_factura(), "fecha": "2025-01-01",
+                           "cliente": "Bench", "tipo": "Factura B", "subtotal": 1000, "iva": 210, "total": 1210})
+    run("append_factura", append)
+
+    run("compact_journals", ux.compact_journals, 1)
+    return res
+
+
+# ---------- Orquestación ----------
+def _measure(n: int, repeat: int, seed: int) -> Dict[str, Any]:
+    env = dict(os.environ, APP_EXCEL_DIR=tempfile.mkdtemp(prefix=f"bench_suite_{n}_"))
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--child", str(n), "--repeat", str(repeat), "--seed", str(seed)],
+        stdout=subprocess.PIPE, text=True, check=True, env=env,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _meta(repeat: int, seed: int) -> Dict[str, Any]:
+    import pandas as pd
+    from src.data import util_excel as ux
+
+    return {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "plataforma": platform.platform(),
+        "motor_xlsx": ux.xlsx_engine(),
+        "journal": ux.JOURNAL,
+        "sidecar": ux.XLSX_SIDECAR,
+        "repeat": repeat,
+        "seed": seed,
+    }
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], tolerance: float, min_ms: float) -> int:
+    """Imprime la comparación por tamaño y medición; devuelve la cantidad de regresiones."""
+    regresiones = 0
+    print(f"{'filas':>8} | {'medición':<46} | {'base (ms)':>10} | {'nuevo (ms)':>10} | {'x':>5}")
+    print("-" * 92)
+    for size, ops in new["sizes"].items():
+        base_ops = base.get("sizes", {}).get(size, {})
+        for op, r in ops.items():
+            if op not in base_ops:
+                continue
+            b, m = base_ops[op]["median_ms"], r["median_ms"]
+            ratio = m / b if b else float("inf")
+            mark = ""
+            if ratio > 1 + tolerance and m - b > min_ms:
+                mark = "  REGRESIÓN"
+                regresiones += 1
+            elif ratio < 1 / (1 + tolerance) and b - m > min_ms:
+                mark = "  mejora"
+            print(f"{size:>8} | {op[:46]:<46} | {b:>10.2f} | {m:>10.2f} | {ratio:>5.2f}{mark}")
+    print(f"\n{regresiones} regresión(es) (tolerancia {tolerance:.0%}, mínimo {min_ms} ms)")
+    return regresiones
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", help="archivo JSON con los resultados")
+    ap.add_argument("--baseline", help="JSON de una corrida anterior para comparar")
+    ap.add_argument("--compare", nargs=2, metavar=("BASE", "NUEVO"), help="solo compara dos JSON ya generados")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="empeoramiento aceptado (0.25 = 25%%)")
+    ap.add_argument("--min-ms", type=float, default=0.5, help="diferencia mínima en ms para marcar")
+    ap.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.child, args.repeat, args.seed)))
+        return 0
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            new = json.load(f)
+        return 1 if compare(base, new, args.tolerance, args.min_ms) else 0
+
+    results = {"meta": _meta(args.repeat, args.seed), "sizes": {}}
+    for n in args.sizes:
+        _log(f"{n} filas por tabla...")
+        results["sizes"][str(n)] = _measure(n, args.repeat, args.seed)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        _log(f"resultados en {args.out}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            base = json.load(f)
+        return 1 if compare(base, results, args.tolerance, args.min_ms) else 0
+    if not args.out:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
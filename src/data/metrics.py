@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict
+
+# ============================================================================
+# Métricas de tiempos de la capa de datos
+# ============================================================================
+# @timed envuelve una función y acumula, por nombre: llamadas, errores, tiempos
+# (percentiles sobre las últimas WINDOW llamadas), filas que entran / salen y
+# bytes leídos / escritos. Los tiempos son inclusivos: upsert_cliente incluye
+# el upsert_clientes_many que llama por dentro.
+#
+# Apagado (APP_METRICS=0, por defecto) el envoltorio solo chequea una bandera.
+#
+#     metrics.snapshot()["load_clientes"]["p90_ms"]
+#     metrics.dump()   # agrega el snapshot al log rotativo (METRICS_LOG)
+
+WINDOW = 2048
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUPS = 5
+
+def _setting(name: str, default: Any) -> Any:
+    try:
+        from src.data import settings as app_settings
+        return getattr(app_settings, name, default)
+    except Exception:
+        return default
+
+_ENABLED: bool = bool(_setting("METRICS", False))
+LOG_PATH = Path(_setting("METRICS_LOG", Path(__file__).resolve().parent / "excel" / ".metrics" / "metrics.log"))
+
+class _Stat:
+    __slots__ = ("calls", "errors", "total", "max", "times", "rows_in", "rows_out", "bytes_read", "bytes_written")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.times: Deque[float] = deque(maxlen=WINDOW)
+        self.rows_in = 0
+        self.rows_out = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+_REGISTRY: Dict[str, _Stat] = {}
+_LOCK = threading.Lock()
+
+def enabled() -> bool:
+    return _ENABLED
+
+def enable(on: bool = True) -> None:
+    global _ENABLED
+    _ENABLED = bool(on)
+
+def reset() -> None:
+    with _LOCK:
+        _REGISTRY.clear()
+
+# ---------- Registro ----------
+def _stat(name: str) -> _Stat:
+    st = _REGISTRY.get(name)
+    if st is None:
+        st = _REGISTRY[name] = _Stat()
+    return st
+
+def count(name: str, rows_in: int = 0, rows_out: int = 0, bytes_read: int = 0, bytes_written: int = 0) -> None:
+    """Suma filas/bytes a 'name' sin contar una llamada (para lo que se sabe adentro de la función)."""
+    if not _ENABLED:
+        return
+    with _LOCK:
+        st = _stat(name)
+        st.rows_in += rows_in
+        st.rows_out += rows_out
+        st.bytes_read += bytes_read
+        st.bytes_written += bytes_written
+
+def _record(name: str, elapsed: float, error: bool = False, rows_in: int = 0, rows_out: int = 0,
+            bytes_read: int = 0, bytes_written: int = 0) -> None:
+    with _LOCK:
+        st = _stat(name)
+        st.calls += 1
+        st.errors += error
+        st.total += elapsed
+        st.max = max(st.max, elapsed)
+        st.times.append(elapsed)
+        st.rows_in += rows_in
+        st.rows_out += rows_out
+        st.bytes_read += bytes_read
+        st.bytes_written += bytes_written
+
+# ---------- Contadores por defecto ----------
+Counter = Callable[[tuple, dict, Any], int]
+
+def _rows(x: Any) -> int:
+    if isinstance(x, (list, tuple)) or hasattr(x, "shape"):
+        return len(x)
+    return 1 if isinstance(x, dict) else 0
+
+def rows_arg(i: int = 0) -> Counter:
+    """Filas del argumento posicional i (lista o DataFrame)."""
+    return lambda args, kwargs, result: _rows(args[i]) if len(args) > i else 0
+
+def single_row(args: tuple, kwargs: dict, result: Any) -> int:
+    return 1
+
+def rows_result(args: tuple, kwargs: dict, result: Any) -> int:
+    return _rows(result)
+
+def file_size(i: int = 0) -> Counter:
+    """Tamaño del archivo del argumento i después de la llamada."""
+    def size(args: tuple, kwargs: dict, result: Any) -> int:
+        try:
+            return os.path.getsize(args[i])
+        except (OSError, IndexError, TypeError):
+            return 0
+    return size
+
+def timed(fn: Callable | None = None, *, name: str | None = None,
+          rows_in: Counter | None = None, rows_out: Counter | None = rows_result,
+          bytes_read: Counter | None = None, bytes_written: Counter | None = None) -> Callable:
+    """Decorador de métricas; @timed o @timed(rows_in=rows_arg(0), ...)."""
+    def deco(f: Callable) -> Callable:
+        key = name or f.__name__
+
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _ENABLED:
+                return f(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                result = f(*args, **kwargs)
+            except BaseException:
+                _record(key, time.perf_counter() - t0, error=True)
+                raise
+            elapsed = time.perf_counter() - t0
+            try:
+                _record(
+                    key, elapsed,
+                    rows_in=rows_in(args, kwargs, result) if rows_in else 0,
+                    rows_out=rows_out(args, kwargs, result) if rows_out else 0,
+                    bytes_read=bytes_read(args, kwargs, result) if bytes_read else 0,
+                    bytes_written=bytes_written(args, kwargs, result) if bytes_written else 0,
+                )
+            except Exception:
+                pass  # una métrica rota nunca corta la operación
+            return result
+        return wrapper
+    return deco(fn) if fn is not None else deco
+
+# ---------- Exportación ----------
+def _pct(sorted_times: list, q: float) -> float:
+    if not sorted_times:
+        return 0.0
+    idx = min(len(sorted_times) - 1, max(0, int(round(q * (len(sorted_times) - 1)))))
+    return sorted_times[idx]
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """{nombre: {calls, errors, total_ms, mean_ms, p50_ms, p90_ms, p99_ms, max_ms, rows_in, rows_out, bytes_read, bytes_written}}."""
+    with _LOCK:
+        items = [(k, st, sorted(st.times)) for k, st in _REGISTRY.items()]
+        out: Dict[str, Dict[str, Any]] = {}
+        for k, st, times in items:
+            out[k] = {
+                "calls": st.calls,
+                "errors": st.errors,
+                "total_ms": round(st.total * 1000, 3),
+                "mean_ms": round(st.total * 1000 / st.calls, 3) if st.calls else 0.0,
+                "p50_ms": round(_pct(times, 0.50) * 1000, 3),
+                "p90_ms": round(_pct(times, 0.90) * 1000, 3),
+                "p99_ms": round(_pct(times, 0.99) * 1000, 3),
+                "max_ms": round(st.max * 1000, 3),
+                "rows_in": st.rows_in,
+                "rows_out": st.rows_out,
+                "bytes_read": st.bytes_read,
+                "bytes_written": st.bytes_written,
+            }
+    return out
+
+_LOGGER: logging.Logger | None = None
+
+def _logger() -> logging.Logger:
+    global _LOGGER
+    if _LOGGER is None:
+        LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        logger = logging.getLogger("gestion.metrics")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = RotatingFileHandler(LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        _LOGGER = logger
+    return _LOGGER
+
+def dump() -> bool:
+    """Agrega el snapshot como una línea JSON al log rotativo. False si no hay nada que grabar."""
+    snap = snapshot()
+    if not snap:
+        return False
+    try:
+        line = json.dumps({"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "pid": os.getpid(), "metrics": snap})
+        _logger().info(line)
+        return True
+    except Exception:
+        return False
+
+@atexit.register
+def _dump_at_exit() -> None:
+    if _ENABLED:
+        dump()
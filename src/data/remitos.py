@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import csv
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import pandas as pd
+
+from src.data import storage as ux
+
+# ============================================================================
+# Importación de remitos de proveedor (xlsx / csv) a vehiculos
+# ============================================================================
+# El archivo se lee fila a fila (openpyxl en modo read_only o csv por bloques),
+# así que la memoria no depende del largo del remito. Las unidades se validan,
+# se descartan las que ya existen por nro_cuadro / nro_motor y se graban en
+# lotes con upsert_vehiculos_many.
+#
+#     res = importar_remito("remito_0001.xlsx", progress=lambda hechas, total: ...)
+#     res["altas"], res["duplicadas"], res["invalidas"], res["errores"]
+
+BATCH_SIZE = 500
+CSV_CHUNK = 2_000
+
+# Encabezados que aceptamos para cada columna (ya normalizados con _header)
+_ALIASES: Dict[str, List[str]] = {
+    "marca": ["marca"],
+    "modelo": ["modelo", "descripcion", "descripcion modelo"],
+    "anio": ["anio", "ano", "año", "modelo anio", "ano modelo"],
+    "nro_cuadro": ["cuadro", "nro cuadro", "chasis", "nro chasis", "vin"],
+    "nro_motor": ["motor", "nro motor"],
+    "nro_certificado": ["certificado", "nro certificado", "certificado fabricacion"],
+    "nro_dnrpa": ["dnrpa", "nro dnrpa"],
+    "precio": ["precio", "importe", "costo", "precio unitario"],
+    "remito": ["remito", "nro remito"],
+}
+
+def _header(val: Any) -> str:
+    """Encabezado comparable: 'Nº de Cuadro' -> 'nro cuadro'."""
+    s = ux._norm_text(val)
+    for sep in (".", ":", "_", "-", "/", "°", "º"):
+        s = s.replace(sep, " ")
+    words = [w for w in s.split() if w not in ("de", "del")]
+    if words and words[0] in ("n", "no", "num", "numero", "nro"):
+        words[0] = "nro"
+    return " ".join(words)
+
+def map_columns(headers: List[Any]) -> Dict[int, str]:
+    """{posición en el archivo: columna de vehiculos} para los encabezados reconocidos."""
+    lookup = {alias: col for col, aliases in _ALIASES.items() for alias in aliases}
+    mapping: Dict[int, str] = {}
+    for i, h in enumerate(headers):
+        col = lookup.get(_header(h))
+        if col and col not in mapping.values():
+            mapping[i] = col
+    return mapping
+
+def _unit_key(val: Any) -> str:
+    """Clave de cuadro/motor: mayúsculas, sin espacios ni guiones."""
+    if val is None:
+        return ""
+    s = str(val).strip().upper()
+    if s in ("", "NAN", "NONE"):
+        return ""
+    return "".join(ch for ch in s if ch.isalnum())
+
+# ---------- Lectura en streaming ----------
+def _iter_xlsx(path: Path) -> Tuple[Iterator[Tuple[Any, ...]], int]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    ws = wb.worksheets[0]
+    total = max((ws.max_row or 1) - 1, 0)
+
+    def rows() -> Iterator[Tuple[Any, ...]]:
+        try:
+            yield from ws.iter_rows(values_only=True)
+        finally:
+            wb.close()
+    return rows(), total
+
+def _iter_csv(path: Path) -> Tuple[Iterator[Tuple[Any, ...]], int]:
+    with open(path, "rb") as fh:
+        total = max(sum(chunk.count(b"\n") for chunk in iter(lambda: fh.read(1 << 20), b"")) - 1, 0)
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        sample = fh.read(4096)
+    try:
+        sep = csv.Sniffer().sniff(sample, delimiters=",;\t").delimiter
+    except csv.Error:
+        sep = ","
+
+    def rows() -> Iterator[Tuple[Any, ...]]:
+        reader = pd.read_csv(path, sep=sep, dtype=str, header=None, keep_default_na=False,
+                             encoding="utf-8-sig", chunksize=CSV_CHUNK)
+        for chunk in reader:
+            yield from chunk.itertuples(index=False, name=None)
+    return rows(), total
+
+def _iter_rows(path: Path) -> Tuple[Iterator[Tuple[Any, ...]], int]:
+    if path.suffix.lower() in (".xlsx", ".xlsm"):
+        return _iter_xlsx(path)
+    if path.suffix.lower() in (".csv", ".txt"):
+        return _iter_csv(path)
+    raise ValueError(f"Formato no soportado: {path.suffix}")
+
+# ---------- Validación ----------
+_MILES_RE = re.compile(r"^\d{1,3}(\.\d{3})+$")  # 1.500.000
+
+def _precio(val: Any) -> float | None:
+    """Precio del remito (1.500.000 / 1500000,50 / 1500000.5); None si no se entiende."""
+    if val is None or str(val).strip() == "":
+        return 0.0
+    if isinstance(val, (int, float)):
+        return float(val)
+    s = str(val).replace("$", "").replace(" ", "")
+    if "," in s or _MILES_RE.match(s):
+        s = s.replace(".", "").replace(",", ".")
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+def _vehiculo(raw: Dict[str, Any], remito: str | None) -> Tuple[Dict[str, Any] | None, str]:
+    """Fila del archivo -> datos para upsert_vehiculo, o (None, motivo)."""
+    d = {col: ("" if val is None else str(val).strip()) for col, val in raw.items()}
+    if not (_unit_key(d.get("nro_cuadro")) or _unit_key(d.get("nro_motor"))):
+        return None, "sin nº de cuadro ni de motor"
+    precio = _precio(raw.get("precio"))
+    if precio is None:
+        return None, f"precio inválido: {d.get('precio')}"
+    anio = d.get("anio", "")
+    if anio and ux._to_int(anio.split(".")[0]) is None:
+        return None, f"año inválido: {anio}"
+    d["anio"] = ux._to_int(anio.split(".")[0]) if anio else ""
+    d["precio"] = precio
+    if remito and not d.get("remito"):
+        d["remito"] = remito
+    d["estado"] = "Disponible"
+    return d, ""
+
+def _existing_keys() -> Tuple[set, set]:
+    df = ux.load_vehiculos()
+    cuadros = {k for k in map(_unit_key, df["nro_cuadro"].tolist()) if k}
+    motores = {k for k in map(_unit_key, df["nro_motor"].tolist()) if k}
+    return cuadros, motores
+
+# ---------- Importación ----------
+def importar_remito(path: str | Path, remito: str | None = None,
+                    batch_size: int = BATCH_SIZE,
+                    progress: Callable[[int, int], Any] | None = None) -> Dict[str, Any]:
+    """
+    Importa las unidades del remito a vehiculos.
+    progress(procesadas, total) se llama después de cada lote; si devuelve
+    False la importación se corta (lo ya grabado queda grabado).
+    Devuelve {"leidas", "altas", "duplicadas", "invalidas", "errores": [(linea, motivo)], "cancelado"}.
+    """
+    path = Path(path)
+    rows, total = _iter_rows(path)
+    res: Dict[str, Any] = {"leidas": 0, "altas": 0, "duplicadas": 0, "invalidas": 0,
+                           "errores": [], "cancelado": False}
+
+    mapping: Dict[int, str] = {}
+    header_line = 0
+    for header_line, headers in enumerate(rows, start=1):
+        if any(v not in (None, "") for v in headers):
+            mapping = map_columns(list(headers))
+            break
+    if not ({"nro_cuadro", "nro_motor"} & set(mapping.values())):
+        rows.close()
+        raise ValueError("El archivo no tiene columnas de Nº de cuadro ni de Nº de motor.")
+
+    cuadros, motores = _existing_keys()
+    batch: List[Dict[str, Any]] = []
+    lineas: List[int] = []
+
+    def flush() -> bool:
+        if batch:
+            for out in ux.upsert_vehiculos_many(batch):
+                if out["resultado"] == "error":
+                    res["errores"].append((lineas[out["fila"]], out["error"]))
+                else:
+                    res["altas"] += 1
+            batch.clear()
+            lineas.clear()
+        return progress is None or progress(res["leidas"], total) is not False
+
+    for linea, values in enumerate(rows, start=header_line + 1):
+        raw = {col: values[i] for i, col in mapping.items() if i < len(values)}
+        if all(v in (None, "") for v in raw.values()):
+            continue
+        res["leidas"] += 1
+        d, motivo = _vehiculo(raw, remito)
+        cuadro = _unit_key(d.get("nro_cuadro")) if d else ""
+        motor = _unit_key(d.get("nro_motor")) if d else ""
+        if d is None:
+            res["invalidas"] += 1
+            res["errores"].append((linea, motivo))
+        elif (cuadro and cuadro in cuadros) or (motor and motor in motores):
+            res["duplicadas"] += 1
+        else:
+            if cuadro:
+                cuadros.add(cuadro)
+            if motor:
+                motores.add(motor)
+            batch.append(d)
+            lineas.append(linea)
+        # Grabo el lote lleno y aviso el avance también si todo eran repetidas
+        if (len(batch) >= batch_size or res["leidas"] % batch_size == 0) and not flush():
+            res["cancelado"] = True
+            rows.close()
+            return res
+    flush()
+    return res
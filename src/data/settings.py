@@ -15,6 +15,44 @@ VEHICULOS_XLSX   = EXCEL_DIR / "vehiculos.xlsx"
 PROVEEDORES_XLSX = EXCEL_DIR / "proveedores.xlsx"
 FACTURAS_XLSX    = EXCEL_DIR / "facturas.xlsx"
 
+# ================== Almacenamiento ==================
+# "excel" (por defecto) o "sqlite". Con sqlite los datos viven en SQLITE_PATH;
+# para migrar: python -m src.data.storage_sqlite import (y "export" para volver).
+STORAGE: str = os.getenv("APP_STORAGE", "excel").strip().lower()
+SQLITE_PATH = Path(os.getenv("APP_SQLITE_PATH", EXCEL_DIR / "gestion.db"))
+
+# ================== Rendimiento ==================
+# Snapshot binario de cada Excel en <EXCEL_DIR>/.cache/ para no reparsear el
+# .xlsx mientras no cambie. APP_XLSX_SIDECAR=0 lo desactiva.
+XLSX_SIDECAR: bool = os.getenv("APP_XLSX_SIDECAR", "1").strip().lower() not in ("0", "false", "no", "off")
+
+# Las altas/modificaciones se agregan a <EXCEL_DIR>/.journal/<tabla>.jsonl en
+# vez de reescribir todo el Excel; se vuelcan al Excel al salir o con la app
+# ociosa. APP_JOURNAL=0 vuelve a reescribir el Excel en cada guardado.
+JOURNAL: bool = os.getenv("APP_JOURNAL", "1").strip().lower() not in ("0", "false", "no", "off")
+# Milisegundos sin actividad antes de volcar los journals
+try:
+    JOURNAL_IDLE_MS: int = int(os.getenv("APP_JOURNAL_IDLE_MS", "60000"))
+except Exception:
+    JOURNAL_IDLE_MS = 60000
+
+# Motor para leer los .xlsx: "auto" usa el más rápido instalado (calamine si
+# está python-calamine, si no openpyxl); "calamine" u "openpyxl" lo fuerzan.
+XLSX_ENGINE: str = os.getenv("APP_XLSX_ENGINE", "auto").strip().lower()
+
+# Cantidad de búsquedas (tabla + filtros) cuyo resultado se recuerda mientras
+# la tabla no cambie. APP_RESULT_CACHE_SIZE=0 lo desactiva.
+try:
+    RESULT_CACHE_SIZE: int = int(os.getenv("APP_RESULT_CACHE_SIZE", "64"))
+except Exception:
+    RESULT_CACHE_SIZE = 64
+
+# Métricas de tiempos de la capa de datos (src/data/metrics.py). Con
+# APP_METRICS=1 se acumulan por función y se agregan a METRICS_LOG (rotativo)
+# al salir y con la app ociosa.
+METRICS: bool = os.getenv("APP_METRICS", "0").strip().lower() in ("1", "true", "yes", "on")
+METRICS_LOG = Path(os.getenv("APP_METRICS_LOG", EXCEL_DIR / ".metrics" / "metrics.log"))
+
 # ================== Negocio ==================
 # Punto de venta para la numeración “PPPP-NNNNNNNN”
 PUNTO_VENTA: str = os.getenv("APP_PUNTO_VENTA", "0001").zfill(4)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+from types import ModuleType
+from typing import Any, Dict
+
+from src.data.write_behind import WriteBehind
+
+# ============================================================================
+# Punto de entrada único a los datos.
+# Según settings.STORAGE delega en util_excel (por defecto) o en storage_sqlite
+# (APP_STORAGE=sqlite). La UI lo importa como `ux`, igual que a util_excel:
+#     from src.data import storage as ux
+#     ux.load_clientes({...})
+# ============================================================================
+def _resolve_backend() -> tuple[str, ModuleType]:
+    try:
+        from src.data import settings as app_settings
+        name = str(getattr(app_settings, "STORAGE", "excel")).strip().lower()
+    except Exception:
+        name = "excel"
+    if name == "sqlite":
+        from src.data import storage_sqlite as backend
+        return "sqlite", backend
+    from src.data import util_excel as backend
+    return "excel", backend
+
+BACKEND_NAME, BACKEND = _resolve_backend()
+
+# ============================================================================
+# Escritura diferida (ver write_behind.py)
+# ============================================================================
+_WRITER: WriteBehind | None = None
+_WRITER_LOCK = threading.Lock()
+
+def write_behind() -> WriteBehind:
+    """Cola de escritura del backend activo (se crea la primera vez)."""
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = WriteBehind(BACKEND)
+        return _WRITER
+
+# Lecturas que esperan a que se grabe lo encolado para su tabla
+_READS: Dict[str, str] = {
+    "load_clientes": "clientes", "get_cliente_by_id": "clientes",
+    "load_vehiculos": "vehiculos", "get_vehiculo_by_id": "vehiculos",
+    "load_proveedores": "proveedores", "get_proveedor_by_id": "proveedores",
+    "load_facturas": "facturas", "get_ultimo_numero_factura": "facturas",
+}
+
+def __getattr__(name: str) -> Any:
+    # ux.load_vehiculos, ux.upsert_cliente, ... se resuelven en el backend activo
+    fn = getattr(BACKEND, name)
+    table = _READS.get(name)
+    if table is None:
+        return fn
+
+    def read(*args: Any, **kwargs: Any) -> Any:
+        writer = _WRITER
+        if writer is not None and writer.pending(table):
+            writer.flush(table)
+        return fn(*args, **kwargs)
+    return read
@@ -0,0 +1,571 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import pandas as pd
+
+from src.data import util_excel as ux
+
+# ============================================================================
+# Backend SQLite con la misma API pública que util_excel.
+# Se activa con APP_STORAGE=sqlite (ver settings.py). La base se crea sola;
+# para pasar los datos de los Excel a la base y volver:
+#     python -m src.data.storage_sqlite import
+#     python -m src.data.storage_sqlite export
+# ============================================================================
+def _resolve_db_path() -> Path:
+    try:
+        from src.data import settings as app_settings
+        return Path(getattr(app_settings, "SQLITE_PATH", ux.EXCEL_DIR / "gestion.db"))
+    except Exception:
+        return ux.EXCEL_DIR / "gestion.db"
+
+DB_PATH = _resolve_db_path()
+
+# Mismas columnas que los Excel. Las columnas extra que pueda traer un payload
+# (p. ej. 'vin') no se guardan: la base tiene esquema fijo.
+_TABLES: Dict[str, List[str]] = {
+    "clientes": ux._CLIENTES_BASE_COLS,
+    "vehiculos": ux._VEHICULOS_BASE_COLS,
+    "proveedores": ux._PROVEEDORES_BASE_COLS,
+    "facturas": ux._FACTURAS_BASE_COLS,
+}
+
+def _digits_key(val: Any) -> str:
+    return re.sub(r"\D+", "", ux._cell_text(val))
+
+def _text_key(val: Any) -> str:
+    return ux._norm_text(ux._cell_text(val))
+
+# Columnas de búsqueda exacta: cada una tiene una columna "<col>_key" con el
+# valor ya normalizado (solo dígitos para DNI / CUIT, texto normalizado para
+# cuadro / motor) y su índice. instr(norm(...)) no puede usar índices, así que
+# queda solo para los fragmentos; un documento o número completo va por
+# igualdad sobre la columna key. Las keys las completa Python al escribir.
+_KEYS: Dict[str, Dict[str, Callable[[Any], str]]] = {
+    "clientes": {"dni": _digits_key, "cuit": _digits_key},
+    "vehiculos": {"nro_cuadro": _text_key, "nro_motor": _text_key},
+    "proveedores": {"cuit": _digits_key},
+}
+
+_INDEXES: List[Tuple[str, str]] = [
+    ("clientes", "dni_key"),
+    ("clientes", "cuit_key"),
+    ("vehiculos", "nro_cuadro_key"),
+    ("vehiculos", "nro_motor_key"),
+    ("proveedores", "cuit_key"),
+    ("facturas", "numero"),
+    ("facturas", "fecha"),
+]
+
+def _key_values(table: str, d: Dict[str, Any]) -> Dict[str, str]:
+    """Columnas key de las columnas de búsqueda que vienen en d."""
+    return {f"{col}_key": fn(d[col]) for col, fn in _KEYS.get(table, {}).items() if col in d}
+
+def _add_key_columns(conn: sqlite3.Connection, table: str) -> None:
+    """Bases creadas antes de las columnas key: se agregan y se completan una vez."""
+    have = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    missing = [col for col in _KEYS.get(table, {}) if f"{col}_key" not in have]
+    for col in missing:
+        conn.execute(f'ALTER TABLE {table} ADD COLUMN "{col}_key" TEXT')
+    if missing:
+        fns = _KEYS[table]
+        names = ", ".join(f'"{c}"' for c in missing)
+        rows = conn.execute(f"SELECT rowid, {names} FROM {table}").fetchall()
+        sets = ", ".join(f'"{c}_key" = ?' for c in missing)
+        conn.executemany(
+            f"UPDATE {table} SET {sets} WHERE rowid = ?",
+            [tuple(fns[c](v) for c, v in zip(missing, r[1:])) + (r[0],) for r in rows],
+        )
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    for table, cols in _TABLES.items():
+        keys = [f'"{c}_key" TEXT' for c in _KEYS.get(table, {})]
+        if "id" in cols:
+            # id INTEGER PRIMARY KEY: es el rowid, el índice por id viene gratis
+            defs = ["id INTEGER PRIMARY KEY"] + [f'"{c}"' for c in cols if c != "id"] + keys
+        else:
+            defs = [f'"{c}"' for c in cols] + keys
+        conn.execute(f'CREATE TABLE IF NOT EXISTS {table} ({", ".join(defs)})')
+        _add_key_columns(conn, table)
+    # Índices sobre el valor crudo de versiones anteriores: ningún filtro los usaba
+    for table, cols in _KEYS.items():
+        for col in cols:
+            conn.execute(f"DROP INDEX IF EXISTS ix_{table}_{col}")
+    for table, col in _INDEXES:
+        conn.execute(f'CREATE INDEX IF NOT EXISTS ix_{table}_{col} ON {table} ("{col}")')
+    # Números de factura reservados o liberados (los confirmados están en facturas)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS numeracion ("
+        "numero TEXT PRIMARY KEY, pv TEXT NOT NULL, estado TEXT NOT NULL, ts REAL NOT NULL)"
+    )
+
+# Una conexión por hilo (sqlite3 no comparte conexiones entre hilos)
+_local = threading.local()
+
+def _conn() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Misma normalización que los filtros de util_excel
+        conn.create_function("norm", 1, ux._norm_text, deterministic=True)
+        with conn:
+            _create_schema(conn)
+        _local.conn = conn
+    return conn
+
+def _py(val: Any) -> Any:
+    """Convierte valores de pandas/numpy a tipos que sqlite3 sabe guardar."""
+    if val is None:
+        return None
+    try:
+        if pd.isna(val):
+            return None
+    except (TypeError, ValueError):
+        pass
+    if isinstance(val, pd.Timestamp):
+        return val.isoformat()
+    if hasattr(val, "item"):
+        return val.item()
+    if isinstance(val, (int, float, str, bytes)):
+        return val
+    return str(val)
+
+def _select(table: str, where: List[str], params: List[Any]) -> pd.DataFrame:
+    cols = ", ".join(f'"{c}"' for c in _TABLES[table])
+    sql = f"SELECT {cols} FROM {table}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY rowid"
+    return pd.read_sql_query(sql, _conn(), params=params)
+
+def _contains(where: List[str], params: List[Any], col: str, val: Any) -> None:
+    if not val:
+        return
+    where.append(f'instr(norm("{col}"), ?) > 0')
+    params.append(ux._norm_text(val))
+
+def _by_doc(where: List[str], params: List[Any], col: str, val: Any) -> None:
+    """DNI / CUIT: completo, por igualdad de dígitos (usa el índice); si no, fragmento."""
+    if not val:
+        return
+    needle = ux._norm_text(val)
+    if ux._doc_exact(col, needle):
+        where.append(f'"{col}_key" = ?')
+        params.append(_digits_key(needle))
+    else:
+        _contains(where, params, col, val)
+
+def _by_code(where: List[str], params: List[Any], table: str, col: str, val: Any) -> None:
+    """Nro de cuadro / motor: si es uno completo que existe, por igualdad (índice); si no, fragmento."""
+    if not val:
+        return
+    key = _text_key(val)
+    exists = lambda k: _conn().execute(f'SELECT 1 FROM {table} WHERE "{col}_key" = ? LIMIT 1', [k]).fetchone() is not None
+    if ux._code_exact(exists, key):
+        where.append(f'"{col}_key" = ?')
+        params.append(key)
+    else:
+        _contains(where, params, col, val)
+
+def _by_estado(where: List[str], params: List[Any], val: Any) -> None:
+    if not val:
+        return
+    where.append('norm("estado") = ?')
+    params.append(ux._norm_text(val))
+
+def _replace_table(table: str, df: pd.DataFrame) -> None:
+    base = _TABLES[table]
+    d = ux._ensure_cols(df, base)[base]
+    rows = [tuple(_py(v) for v in r) for r in d.itertuples(index=False, name=None)]
+    if "id" in base:
+        pos = base.index("id")
+        rows = [r[:pos] + (ux._to_int(r[pos]),) + r[pos + 1:] for r in rows]
+    keyed = [(base.index(col), fn) for col, fn in _KEYS.get(table, {}).items()]
+    if keyed:
+        rows = [r + tuple(fn(r[pos]) for pos, fn in keyed) for r in rows]
+    cols = base + [f"{col}_key" for col in _KEYS.get(table, {})]
+    marks = ", ".join("?" for _ in cols)
+    names = ", ".join(f'"{c}"' for c in cols)
+    conn = _conn()
+    with conn:
+        conn.execute(f"DELETE FROM {table}")
+        conn.executemany(f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({marks})", rows)
+
+def _get_by_id(table: str, key: Any, alias: str | None = None) -> Dict[str, Any]:
+    key_int = ux._to_int(key)
+    value = key_int if key_int is not None else str(key)
+    df = _select(table, ['"id" = ?'], [value])
+    if df.empty and alias:
+        df = _select(table, [f'"{alias}" = ?'], [value])
+    return {} if df.empty else df.iloc[0].to_dict()
+
+def _next_id(table: str) -> int:
+    row = _conn().execute(f'SELECT MAX("id") FROM {table}').fetchone()
+    return int(row[0] or 0) + 1
+
+def _tx(conn: sqlite3.Connection):
+    # Dentro de un lote (_upsert_many) la transacción la maneja el lote
+    return nullcontext() if getattr(_local, "batch", False) else conn
+
+def _insert(table: str, d: Dict[str, Any]) -> None:
+    d = {**d, **_key_values(table, d)}
+    cols = [c for c in _TABLES[table] if c in d] + list(_key_values(table, d))
+    names = ", ".join(f'"{c}"' for c in cols)
+    marks = ", ".join("?" for _ in cols)
+    conn = _conn()
+    with _tx(conn):
+        conn.execute(f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({marks})", [_py(d[c]) for c in cols])
+
+def _update(table: str, where: str, params: List[Any], d: Dict[str, Any]) -> int:
+    if not d:
+        return 0
+    d = {**d, **_key_values(table, d)}
+    sets = ", ".join(f'"{c}" = ?' for c in d)
+    conn = _conn()
+    with _tx(conn):
+        cur = conn.execute(f"UPDATE {table} SET {sets} WHERE {where}", [_py(v) for v in d.values()] + params)
+    return cur.rowcount
+
+def _exists(table: str, key: Any, alias: str | None = None) -> bool:
+    key_int = ux._to_int(key)
+    value = key_int if key_int is not None else str(key)
+    where = '"id" = ?' + (f' OR "{alias}" = ?' if alias else "")
+    params = [value, value] if alias else [value]
+    return _conn().execute(f"SELECT 1 FROM {table} WHERE {where} LIMIT 1", params).fetchone() is not None
+
+def _upsert_many(table: str, alias: str | None, upsert: Callable[[Dict[str, Any]], int],
+                 rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Lote en una sola transacción; mismo resultado por fila que util_excel."""
+    conn = _conn()
+    outcomes: List[Dict[str, Any]] = []
+    _local.batch = True
+    try:
+        with conn:
+            for fila, data in enumerate(rows):
+                try:
+                    data = dict(data)
+                    key = data.get("id") or (data.get(alias) if alias else None)
+                    existed = key not in (None, "", 0) and _exists(table, key, alias)
+                    rid = upsert(data)
+                except Exception as e:
+                    outcomes.append({"fila": fila, "id": None, "resultado": "error", "error": str(e)})
+                    continue
+                resultado = "modificacion" if existed else "alta"
+                outcomes.append({"fila": fila, "id": int(rid), "resultado": resultado, "error": ""})
+    finally:
+        _local.batch = False
+    return outcomes
+
+# ============================================================================
+# CLIENTES
+# ============================================================================
+def load_clientes(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
+    filters = filters or {}
+    where: List[str] = []
+    params: List[Any] = []
+    for col in ("nombre", "apellido", "email"):
+        _contains(where, params, col, filters.get(col, ""))
+    for col in ("dni", "cuit"):
+        _by_doc(where, params, col, filters.get(col, ""))
+    if filters.get("estado") is not None:
+        _by_estado(where, params, filters["estado"])
+    df = _select("clientes", where, params)
+    df["cliente_id"] = df["cliente_id"].where(df["cliente_id"].notna(), df["id"])
+    df["estado"] = df["estado"].where(df["estado"].notna() & (df["estado"].astype(str).str.strip() != ""), "Activo")
+    return df
+
+def write_clientes_df(df: pd.DataFrame) -> None:
+    _replace_table("clientes", df)
+
+def get_cliente_by_id(cid: Any) -> Dict[str, Any]:
+    return _get_by_id("clientes", cid, alias="cliente_id")
+
+def upsert_cliente(data: Dict[str, Any]) -> int:
+    """Misma semántica que util_excel.upsert_cliente, escribiendo una sola fila."""
+    d = {k: data.get(k, "") for k in ux._CLIENTES_BASE_COLS}
+    cid = ux._to_int(d.get("id") or d.get("cliente_id"))
+
+    if cid is not None:
+        changes = {k: v for k, v in d.items() if k not in ("id", "cliente_id") and v != ""}
+        changes["cliente_id"] = cid
+        if _update("clientes", '"id" = ? OR "cliente_id" = ?', [cid, cid], changes):
+            return cid
+    else:
+        cid = _next_id("clientes")
+    d["id"] = cid
+    d["cliente_id"] = cid
+    if not str(d.get("estado", "")).strip():
+        d["estado"] = "Activo"
+    _insert("clientes", d)
+    return int(cid)
+
+def upsert_clientes_many(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return _upsert_many("clientes", "cliente_id", upsert_cliente, rows)
+
+def save_cliente(data: Dict[str, Any]) -> int:
+    """Alias de upsert_cliente para compatibilidad con la UI."""
+    return upsert_cliente(data)
+
+# ============================================================================
+# VEHICULOS
+# ============================================================================
+def load_vehiculos(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
+    filters = filters or {}
+    where: List[str] = []
+    params: List[Any] = []
+    _contains(where, params, "marca", filters.get("marca", ""))
+    _contains(where, params, "modelo", filters.get("modelo", ""))
+    an = ux._to_int(filters.get("anio")) if filters.get("anio") not in (None, "") else None
+    if an is not None:
+        where.append('CAST("anio" AS INTEGER) = ?')
+        params.append(an)
+    _by_code(where, params, "vehiculos", "nro_cuadro", filters.get("nro_cuadro", ""))
+    _by_code(where, params, "vehiculos", "nro_motor", filters.get("nro_motor", ""))
+    if filters.get("estado") is not None:
+        _by_estado(where, params, filters["estado"])
+    df = _select("vehiculos", where, params)
+    df["precio"] = df["precio"].apply(ux._to_float)
+    return df
+
+def write_vehiculos_df(df: pd.DataFrame) -> None:
+    d = df.copy()
+    if "precio" in d.columns:
+        d["precio"] = d["precio"].apply(ux._to_float)
+    _replace_table("vehiculos", d)
+
+def get_vehiculo_by_id(vid: Any) -> Dict[str, Any]:
+    return _get_by_id("vehiculos", vid)
+
+def upsert_vehiculo(data: Dict[str, Any]) -> int:
+    """Misma semántica que util_excel.upsert_vehiculo (pisa todas las columnas base)."""
+    d = {k: data.get(k, "") for k in ux._VEHICULOS_BASE_COLS}
+    d["precio"] = ux._to_float(d["precio"])
+    if d["id"] in (None, "", 0):
+        d["id"] = _next_id("vehiculos")
+    else:
+        d["id"] = ux._to_int(d["id"]) or 0
+    _insert("vehiculos", d)
+    return int(d["id"])
+
+def upsert_vehiculos_many(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return _upsert_many("vehiculos", None, upsert_vehiculo, rows)
+
+# ============================================================================
+# PROVEEDORES
+# ============================================================================
+def load_proveedores(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
+    filters = filters or {}
+    where: List[str] = []
+    params: List[Any] = []
+    for col in ("nombre", "email"):
+        _contains(where, params, col, filters.get(col, ""))
+    _by_doc(where, params, "cuit", filters.get("cuit", ""))
+    if filters.get("estado") is not None:
+        _by_estado(where, params, filters["estado"])
+    df = _select("proveedores", where, params)
+    df["proveedor_id"] = df["proveedor_id"].where(df["proveedor_id"].notna(), df["id"])
+    df["estado"] = df["estado"].where(df["estado"].notna() & (df["estado"].astype(str).str.strip() != ""), "Activo")
+    return df
+
+def write_proveedores_df(df: pd.DataFrame) -> None:
+    _replace_table("proveedores", df)
+
+def get_proveedor_by_id(pid: Any) -> Dict[str, Any]:
+    return _get_by_id("proveedores", pid, alias="proveedor_id")
+
+def upsert_proveedor(data: Dict[str, Any]) -> int:
+    """Misma semántica que util_excel.upsert_proveedor, escribiendo una sola fila."""
+    d = {k: data.get(k, "") for k in ux._PROVEEDORES_BASE_COLS}
+    pid = ux._to_int(d.get("id") or d.get("proveedor_id"))
+
+    if pid is None:
+        pid = _next_id("proveedores")
+        d["estado"] = "Activo"
+    else:
+        changes = {k: v for k, v in d.items() if k not in ("id", "proveedor_id") and v != ""}
+        changes["proveedor_id"] = pid
+        if _update("proveedores", '"id" = ? OR "proveedor_id" = ?', [pid, pid], changes):
+            return pid
+        if not str(d.get("estado", "")).strip():
+            d["estado"] = "Activo"
+    d["id"] = pid
+    d["proveedor_id"] = pid
+    _insert("proveedores", d)
+    return int(pid)
+
+def upsert_proveedores_many(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return _upsert_many("proveedores", "proveedor_id", upsert_proveedor, rows)
+
+def save_proveedor(data: Dict[str, Any]) -> int:
+    """Alias de upsert_proveedor para compatibilidad con la UI."""
+    return upsert_proveedor(data)
+
+# ============================================================================
+# FACTURAS
+# ============================================================================
+def load_facturas(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
+    filters = filters or {}
+    where: List[str] = []
+    params: List[Any] = []
+    _contains(where, params, "cliente", filters.get("cliente", ""))
+    _contains(where, params, "vehiculo", filters.get("vehiculo", ""))
+    df = _select("facturas", where, params)
+    for col in ["subtotal", "iva", "total"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
+    return df
+
+def write_facturas_df(df: pd.DataFrame) -> None:
+    d = df.copy()
+    for col in ["subtotal", "iva", "total"]:
+        if col in d.columns:
+            d[col] = d[col].apply(ux._to_float)
+    _replace_table("facturas", d)
+
+def append_factura(data: Dict[str, Any]) -> None:
+    """Inserta una factura (claves case-insensitive, como en util_excel)."""
+    normalized = {str(k).lower(): v for k, v in data.items()}
+    for k in ("subtotal", "iva", "total"):
+        if k in normalized:
+            normalized[k] = ux._to_float(normalized[k])
+    _insert("facturas", {col: normalized.get(col, None) for col in ux._FACTURAS_BASE_COLS})
+    if normalized.get("numero"):
+        commit_numero_factura(str(normalized["numero"]))
+
+# ---------- Numeración (misma API que util_excel) ----------
+# numeracion.estado: 'reservado' (vence a los ux._SEQ_TTL_S), 'autorizado' (con
+# CAE: no vence ni se libera) o 'liberado'. Al registrar la factura la fila se borra.
+def _next_numero(conn: sqlite3.Connection, pv: str) -> int:
+    row = conn.execute(
+        "SELECT MIN(CAST(substr(numero, 6) AS INTEGER)) FROM numeracion WHERE pv = ? AND estado = 'liberado'",
+        [pv],
+    ).fetchone()
+    if row[0] is not None:
+        return int(row[0])
+    top = conn.execute(
+        'SELECT MAX(CAST(substr("numero", 6) AS INTEGER)) FROM facturas '
+        'WHERE "numero" LIKE ? AND length("numero") = 13',
+        [f"{pv}-%"],
+    ).fetchone()[0]
+    reserved = conn.execute(
+        "SELECT MAX(CAST(substr(numero, 6) AS INTEGER)) FROM numeracion WHERE pv = ?", [pv]
+    ).fetchone()[0]
+    return max(int(top or 0), int(reserved or 0)) + 1
+
+def reserve_numero_factura(punto_venta: str = "0001") -> str:
+    """Reserva el próximo número (BEGIN IMMEDIATE serializa a los puestos que emiten)."""
+    pv = str(punto_venta).zfill(4)
+    conn = _conn()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(
+            "UPDATE numeracion SET estado = 'liberado' WHERE estado = 'reservado' AND ts < ?",
+            [time.time() - ux._SEQ_TTL_S],
+        )
+        numero = ux._fmt_numero(pv, _next_numero(conn, pv))
+        conn.execute(
+            "INSERT OR REPLACE INTO numeracion (numero, pv, estado, ts) VALUES (?, ?, 'reservado', ?)",
+            [numero, pv, time.time()],
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return numero
+
+def commit_numero_factura(numero: str) -> None:
+    conn = _conn()
+    with conn:
+        conn.execute("DELETE FROM numeracion WHERE numero = ?", [str(numero)])
+
+def authorize_numero_factura(numero: str) -> None:
+    """Con CAE: el número queda tomado hasta que append_factura lo confirme."""
+    parsed = ux._parse_numero(numero)
+    if not parsed:
+        return
+    conn = _conn()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO numeracion (numero, pv, estado, ts) VALUES (?, ?, 'autorizado', ?)",
+            [str(numero).strip(), parsed[0], time.time()],
+        )
+
+def authorized_numeros_factura(punto_venta: str = "0001") -> List[str]:
+    """Números autorizados por ARCA que todavía no se registraron (para conciliar a mano)."""
+    pv = str(punto_venta).zfill(4)
+    rows = _conn().execute(
+        "SELECT numero FROM numeracion WHERE pv = ? AND estado = 'autorizado' ORDER BY numero", [pv]
+    ).fetchall()
+    return [r[0] for r in rows]
+
+def release_numero_factura(numero: str) -> None:
+    conn = _conn()
+    with conn:
+        conn.execute(
+            "UPDATE numeracion SET estado = 'liberado' WHERE numero = ? AND estado = 'reservado'",
+            [str(numero)],
+        )
+
+def get_ultimo_numero_factura(punto_venta: str = "0001") -> str:
+    """Próximo número 'PPPP-NNNNNNNN' para el punto de venta, sin reservarlo."""
+    pv = str(punto_venta).zfill(4)
+    return ux._fmt_numero(pv, _next_numero(_conn(), pv))
+
+# SQLite ya escribe fila a fila: no hay journal que volcar
+def journal_pending() -> Dict[str, int]:
+    return {}
+
+def compact_journals() -> Dict[str, int]:
+    return {}
+
+# ============================================================================
+# Importación / exportación Excel <-> SQLite
+# ============================================================================
+_EXCEL_IO = {
+    "clientes": (ux.load_clientes, ux.write_clientes_df, write_clientes_df),
+    "vehiculos": (ux.load_vehiculos, ux.write_vehiculos_df, write_vehiculos_df),
+    "proveedores": (ux.load_proveedores, ux.write_proveedores_df, write_proveedores_df),
+    "facturas": (ux.load_facturas, ux.write_facturas_df, write_facturas_df),
+}
+
+def import_from_excel() -> Dict[str, int]:
+    """Reemplaza el contenido de la base con el de los Excel. Devuelve filas por tabla."""
+    counts = {}
+    for table, (load_xlsx, _, write_db) in _EXCEL_IO.items():
+        df = load_xlsx({})
+        write_db(df)
+        counts[table] = len(df)
+    return counts
+
+def export_to_excel() -> Dict[str, int]:
+    """Vuelca cada tabla de la base a su Excel. Devuelve filas por tabla."""
+    counts = {}
+    loaders = {
+        "clientes": load_clientes, "vehiculos": load_vehiculos,
+        "proveedores": load_proveedores, "facturas": load_facturas,
+    }
+    for table, (_, write_xlsx, _) in _EXCEL_IO.items():
+        df = loaders[table]({})
+        write_xlsx(df)
+        counts[table] = len(df)
+    return counts
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else ""
+    if cmd == "import":
+        print(f"Excel -> {DB_PATH}: {import_from_excel()}")
+    elif cmd == "export":
+        print(f"{DB_PATH} -> Excel: {export_to_excel()}")
+    else:
+        print("Uso: python -m src.data.storage_sqlite [import|export]")
+        sys.exit(2)
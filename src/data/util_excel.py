@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import importlib.util
+import json
 import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+from src.data import metrics
+from src.data.metrics import file_size, rows_arg, single_row, timed
+
 # ============================================================================
 # Rutas: intenta usar settings.py; si falla, usa /src/data/excel/
 # ============================================================================
@@ -27,13 +40,42 @@ def _resolve_paths() -> Tuple[Path, Path, Path, Path, Path]:
 
 EXCEL_DIR, CLIENTES_XLSX, VEHICULOS_XLSX, PROVEEDORES_XLSX, FACTURAS_XLSX = _resolve_paths()
 
+def _setting(name: str, default: Any) -> Any:
+    try:
+        from src.data import settings as app_settings
+        return getattr(app_settings, name, default)
+    except Exception:
+        return default
+
+# Snapshot binario junto a cada .xlsx (ver settings.XLSX_SIDECAR)
+XLSX_SIDECAR: bool = bool(_setting("XLSX_SIDECAR", True))
+# Journal de cambios por tabla en vez de reescribir el Excel (ver settings.JOURNAL)
+JOURNAL: bool = bool(_setting("JOURNAL", True))
+# Motor de lectura de .xlsx: auto | calamine | openpyxl (ver settings.XLSX_ENGINE)
+XLSX_ENGINE: str = str(_setting("XLSX_ENGINE", "auto")).strip().lower()
+# Búsquedas recientes que se recuerdan (ver settings.RESULT_CACHE_SIZE); 0 lo apaga
+RESULT_CACHE_SIZE: int = int(_setting("RESULT_CACHE_SIZE", 64))
+
 # ============================================================================
 # Helpers generales
 # ============================================================================
+# Marcas diacríticas que quedan sueltas después de NFKD ("José" -> "Jose")
+_DIACRITICS_RE = re.compile("[\u0300-\u036f]")
+
 def _norm_text(x: Any) -> str:
     if x is None:
         return ""
-    return " ".join(str(x).strip().lower().split())
+    s = _DIACRITICS_RE.sub("", unicodedata.normalize("NFKD", str(x)))
+    return " ".join(s.lower().split())
+
+def _norm_series(s: pd.Series) -> pd.Series:
+    """_norm_text aplicado a toda una columna con los métodos .str de pandas."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # Se normalizan solo las categorías y se expanden por código
+        cats = _norm_series(pd.Series(s.cat.categories, dtype=object)).to_numpy(dtype=object)
+        return pd.Series(np.append(cats, "")[s.cat.codes.to_numpy()], index=s.index)
+    t = s.astype(str).str.normalize("NFKD").str.replace(_DIACRITICS_RE, "", regex=True)
+    return t.str.lower().str.split().str.join(" ")
 
 def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -48,33 +90,263 @@ def _ensure_cols(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
     extras = [c for c in d.columns if c not in cols]
     return d[cols + extras]
 
+# ============================================================================
+# Cache de tablas en memoria (clave: ruta + mtime/tamaño del archivo)
+# ============================================================================
+# Cada entrada guarda el DF tal cual lo parseó pandas. Se entregan copias, así
+# que quien recibe el DF puede modificarlo sin ensuciar el cache.
+_CACHE_LOCK = threading.RLock()
+_TABLE_CACHE: Dict[str, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0, "invalidations": 0}
+
+def _file_stamp(path: Path) -> Tuple[int, int] | None:
+    """(mtime_ns, tamaño) del archivo, o None si no existe."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _cache_get(path: Path) -> pd.DataFrame | None:
+    stamp = _file_stamp(path)
+    with _CACHE_LOCK:
+        entry = _TABLE_CACHE.get(str(path))
+        if entry is not None and stamp is not None and entry[0] == stamp:
+            _CACHE_STATS["hits"] += 1
+            return entry[1]
+        _CACHE_STATS["misses"] += 1
+        return None
+
+def _cache_put(path: Path, stamp: Tuple[int, int], df: pd.DataFrame) -> None:
+    with _CACHE_LOCK:
+        _TABLE_CACHE[str(path)] = (stamp, df)
+
+def _cache_invalidate(path: Path) -> None:
+    with _CACHE_LOCK:
+        if _TABLE_CACHE.pop(str(path), None) is not None:
+            _CACHE_STATS["invalidations"] += 1
+
+def cache_stats() -> Dict[str, int]:
+    """Contadores del cache de tablas (hits/misses/invalidations/entries)."""
+    with _CACHE_LOCK:
+        return {**_CACHE_STATS, "entries": len(_TABLE_CACHE)}
+
+def clear_cache() -> None:
+    """Vacía el cache de tablas y el de resultados (los contadores se conservan)."""
+    with _CACHE_LOCK:
+        _TABLE_CACHE.clear()
+        _RESULTS.clear()
+
+# ============================================================================
+# Snapshot binario (sidecar) en <carpeta del Excel>/.cache/
+# ============================================================================
+# El nombre lleva el stamp del .xlsx de origen (<tabla>.<mtime_ns>-<size>.npz):
+# si el Excel cambia, el snapshot viejo deja de coincidir y se regenera.
+# La carpeta puede ser compartida entre puestos, así que el formato no puede
+# ejecutar código al leerse (nada de pickle): es un .npz de numpy que se abre
+# con allow_pickle=False. Como las columnas son object con tipos mezclados
+# (int/str en la misma columna), cada una se guarda como el tipo de cada celda
+# (k<i>) más un array por tipo con sus valores (v<i>_<tipo>). Si aparece un
+# tipo que no está acá, esa tabla no tiene snapshot y se lee del Excel.
+_SIDE_NONE, _SIDE_STR, _SIDE_INT, _SIDE_FLOAT, _SIDE_BOOL, _SIDE_DATETIME, _SIDE_TIMESTAMP = range(7)
+_SIDE_KINDS: Dict[type, int] = {
+    type(None): _SIDE_NONE, str: _SIDE_STR, int: _SIDE_INT, float: _SIDE_FLOAT, bool: _SIDE_BOOL,
+    np.int64: _SIDE_INT, np.float64: _SIDE_FLOAT, np.bool_: _SIDE_BOOL,
+    datetime: _SIDE_DATETIME, pd.Timestamp: _SIDE_TIMESTAMP,
+}
+
+def _side_pack(kind: int, values: np.ndarray) -> np.ndarray:
+    if kind == _SIDE_STR:
+        arr = np.array(values.tolist(), dtype=str)
+        # numpy recorta los "\x00" del final: esos textos no entran en el formato
+        if not np.array_equal(np.char.str_len(arr), np.fromiter(map(len, values), dtype=np.int64, count=len(values))):
+            raise ValueError("texto no representable")
+        return arr
+    if kind in (_SIDE_DATETIME, _SIDE_TIMESTAMP):
+        return pd.DatetimeIndex(values.tolist()).to_numpy("datetime64[ns]")
+    return np.array(values.tolist(), dtype={_SIDE_INT: np.int64, _SIDE_FLOAT: np.float64, _SIDE_BOOL: bool}[kind])
+
+def _side_unpack(kind: int, arr: np.ndarray) -> np.ndarray:
+    if kind == _SIDE_DATETIME:
+        return arr.astype("datetime64[us]").astype(object)
+    if kind == _SIDE_TIMESTAMP:
+        return pd.Series(arr).astype(object).to_numpy()
+    return arr.astype(object)
+
+def _sidecar_encode(df: pd.DataFrame) -> Dict[str, np.ndarray] | None:
+    arrays = {"columns": np.array([str(c) for c in df.columns], dtype=str)}
+    try:
+        for i in range(df.shape[1]):
+            values = df.iloc[:, i].to_numpy(dtype=object)
+            kinds = np.fromiter((_SIDE_KINDS.get(type(v), -1) for v in values), dtype=np.int8, count=len(values))
+            if (kinds < 0).any():
+                return None
+            arrays[f"k{i}"] = kinds
+            for kind in np.unique(kinds):
+                if kind != _SIDE_NONE:
+                    arrays[f"v{i}_{kind}"] = _side_pack(int(kind), values[kinds == kind])
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return arrays
+
+def _sidecar_decode(z) -> pd.DataFrame:
+    columns = z["columns"].tolist()
+    data: Dict[int, np.ndarray] = {}
+    for i in range(len(columns)):
+        kinds = z[f"k{i}"]
+        present = np.unique(kinds)
+        if len(present) == 1 and present[0] != _SIDE_NONE:
+            # Columna de un solo tipo (lo habitual): sin máscaras
+            data[i] = _side_unpack(int(present[0]), z[f"v{i}_{present[0]}"])
+            continue
+        out = np.full(len(kinds), None, dtype=object)
+        for kind in present:
+            if kind != _SIDE_NONE:
+                out[kinds == kind] = _side_unpack(int(kind), z[f"v{i}_{kind}"])
+        data[i] = out
+    df = pd.DataFrame(data, copy=False)
+    df.columns = columns
+    return df
+
+def _sidecar_dir(path: Path) -> Path:
+    return path.parent / ".cache"
+
+def _sidecar_path(path: Path, stamp: Tuple[int, int]) -> Path:
+    return _sidecar_dir(path) / f"{path.stem}.{stamp[0]}-{stamp[1]}.npz"
+
+def _sidecar_read(path: Path, stamp: Tuple[int, int]) -> pd.DataFrame | None:
+    side = _sidecar_path(path, stamp)
+    if not side.exists():
+        return None
+    try:
+        with np.load(side, allow_pickle=False) as z:
+            return _sidecar_decode(z)
+    except Exception:
+        side.unlink(missing_ok=True)
+        return None
+
+def _sidecar_write(path: Path, stamp: Tuple[int, int], df: pd.DataFrame) -> None:
+    side = _sidecar_path(path, stamp)
+    try:
+        side.parent.mkdir(parents=True, exist_ok=True)
+        # Borro snapshots viejos de la misma tabla (también los .pkl de versiones anteriores)
+        for old in side.parent.glob(f"{path.stem}.*"):
+            if old != side and old.suffix in (".npz", ".pkl"):
+                old.unlink(missing_ok=True)
+        arrays = _sidecar_encode(df)
+        if arrays is None:
+            return
+        tmp = side.with_name(f"{side.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, side)
+    except Exception:
+        # El snapshot es solo una optimización: si falla, seguimos con el Excel
+        pass
+
+# ============================================================================
+# Motores de lectura de .xlsx
+# ============================================================================
+# Nombre para pd.read_excel -> módulo que tiene que estar instalado, del más
+# rápido al más lento. openpyxl viene siempre (requirements.txt).
+_XLSX_ENGINES: Dict[str, str] = {"calamine": "python_calamine", "openpyxl": "openpyxl"}
+_ENGINE_CHOICE: Dict[str, str] = {}
+
+def available_xlsx_engines() -> List[str]:
+    return [name for name, module in _XLSX_ENGINES.items() if importlib.util.find_spec(module) is not None]
+
+def xlsx_engine() -> str:
+    """Motor efectivo: el de settings si está instalado; si no, el más rápido disponible."""
+    if XLSX_ENGINE not in _ENGINE_CHOICE:
+        available = available_xlsx_engines()
+        if XLSX_ENGINE in available:
+            _ENGINE_CHOICE[XLSX_ENGINE] = XLSX_ENGINE
+        else:
+            _ENGINE_CHOICE[XLSX_ENGINE] = available[0] if available else "openpyxl"
+    return _ENGINE_CHOICE[XLSX_ENGINE]
+
+def _parse_xlsx(path: Path, engine: str | None = None) -> pd.DataFrame:
+    """Primera hoja como dtype=object; si el motor rápido falla, reintenta con openpyxl."""
+    engine = engine or xlsx_engine()
+    try:
+        return pd.read_excel(path, sheet_name=0, dtype=object, engine=engine)
+    except Exception:
+        if engine == "openpyxl":
+            raise
+        return pd.read_excel(path, sheet_name=0, dtype=object, engine="openpyxl")
+
+@timed
 def _read_xlsx(path: Path, base_cols: Iterable[str]) -> pd.DataFrame:
     """
     Lee un Excel como dtype=object. Si no existe, devuelve DF vacío con columnas base.
-    Si existe pero faltan columnas, las agrega.
+    El parseo se cachea por (mtime, tamaño): primero en memoria y después en el
+    snapshot binario de .cache/; solo se parsea el .xlsx si ninguno coincide.
+    Devuelve el DF del cache tal cual (sin copiar): no modificarlo. Las columnas
+    faltantes las agrega la migración (_migrated), que trabaja sobre una copia.
     """
     _ensure_parent(path)
     if not path.exists():
         return pd.DataFrame(columns=list(base_cols))
+    df = _cache_get(path)
+    if df is None:
+        stamp = _file_stamp(path)
+        if XLSX_SIDECAR and stamp is not None:
+            df = _sidecar_read(path, stamp)
+        if df is None:
+            try:
+                df = _parse_xlsx(path)
+                metrics.count("_read_xlsx", bytes_read=stamp[1] if stamp else 0)
+            except Exception:
+                # En caso de corrupción o error de engine, devuelvo vacío consistente
+                return pd.DataFrame(columns=list(base_cols))
+            # Normalizo nombres
+            df.columns = [str(c).strip() for c in df.columns]
+            if XLSX_SIDECAR and stamp is not None and stamp == _file_stamp(path):
+                _sidecar_write(path, stamp, df)
+        # Si el archivo cambió mientras lo leíamos, no lo cacheo
+        if stamp is not None and stamp == _file_stamp(path):
+            _cache_put(path, stamp, df)
+    return df
+
+def _fsync_dir(folder: Path) -> None:
+    # Que el rename sobreviva a un corte de luz (en Windows no hace falta/no se puede)
+    if os.name == "nt":
+        return
+    fd = os.open(folder, os.O_RDONLY)
     try:
-        df = pd.read_excel(path, sheet_name=0, dtype=object)
-    except Exception:
-        # En caso de corrupción o error de engine, devuelvo vacío consistente
-        return pd.DataFrame(columns=list(base_cols))
-    # Normalizo nombres
-    df.columns = [str(c).strip() for c in df.columns]
-    return _ensure_cols(df, list(base_cols))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
-def _write_xlsx(path: Path, df: pd.DataFrame, sheet_name: str) -> None:
-    """Escritura atómica y limpia."""
+@timed(rows_in=rows_arg(1), rows_out=None, bytes_written=file_size(0))
+def _write_xlsx(path: Path, df: pd.DataFrame, sheet_name: str,
+                schema_version: int | None = None, keep_journal: bool = False) -> None:
+    """
+    Escritura atómica: temporal en la misma carpeta + fsync + os.replace, así
+    nunca queda un momento sin archivo ni un Excel a medio escribir. Se hace con
+    el lock de la tabla tomado (ver _file_lock).
+    Con schema_version, el libro queda anotado como migrado a esa versión.
+    keep_journal es para la migración: el DF escrito no incluye el journal.
+    """
     _ensure_parent(path)
-    # write to temp and replace to reduce risk of corruption
-    tmp = path.with_suffix(".tmp.xlsx")
-    with pd.ExcelWriter(tmp, engine="xlsxwriter") as w:
-        df.to_excel(w, index=False, sheet_name=sheet_name)
-    if path.exists():
-        path.unlink(missing_ok=True)
-    tmp.rename(path)
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.xlsx")
+    with _file_lock(path):
+        try:
+            with pd.ExcelWriter(tmp, engine="xlsxwriter") as w:
+                df.to_excel(w, index=False, sheet_name=sheet_name)
+            with open(tmp, "rb+") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        _fsync_dir(path.parent)
+        _cache_invalidate(path)
+        _state_invalidate(path)
+        if schema_version is not None:
+            _schema_stamp(path, schema_version)
+        if not keep_journal:
+            # El DF escrito ya incluye lo que hubiera en el journal
+            _journal_path(path).unlink(missing_ok=True)
 
 def _to_int(val) -> int | None:
     try:
@@ -96,6 +368,1038 @@ def _to_float(val) -> float:
     except Exception:
         return 0.0
 
+# ============================================================================
+# Bloqueo entre procesos (dos instancias sobre la misma carpeta de Excel)
+# ============================================================================
+# Un lock por archivo (por tabla), no uno global: dos puestos pueden guardar a la
+# vez en tablas distintas. Dentro del proceso es reentrante, así que una función
+# que ya lo tiene puede llamar a otra que también lo pide (_commit -> _write_xlsx).
+# Los archivos de lock van en la subcarpeta .lock/ junto al archivo bloqueado,
+# como los demás auxiliares (.cache/, .journal/, .seq/).
+_LOCKS_GUARD = threading.Lock()
+_PROCESS_LOCKS: Dict[str, threading.RLock] = {}
+_LOCK_FDS: Dict[str, Tuple[int, int]] = {}  # ruta -> (fd del .lock, profundidad)
+
+def _os_lock(fd: int, target: Path, deadline: float) -> None:
+    while True:
+        try:
+            if os.name == "nt":
+                import msvcrt
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No se pudo bloquear {target} (¿otra instancia escribiendo?)")
+            time.sleep(0.01)
+
+def _os_unlock(fd: int) -> None:
+    if os.name == "nt":
+        import msvcrt
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+@contextmanager
+def _file_lock(target: Path, timeout: float = 30.0) -> Iterator[None]:
+    """Lock exclusivo asociado a 'target' (usa el archivo '.lock/<target>.lock' de su carpeta)."""
+    key = str(target)
+    with _LOCKS_GUARD:
+        rlock = _PROCESS_LOCKS.setdefault(key, threading.RLock())
+    deadline = time.monotonic() + timeout
+    if not rlock.acquire(timeout=timeout):
+        raise TimeoutError(f"No se pudo bloquear {target} (otro hilo escribiendo)")
+    try:
+        fd, depth = _LOCK_FDS.get(key, (-1, 0))
+        if depth == 0:
+            lock_path = target.parent / ".lock" / f"{target.name}.lock"
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _os_lock(fd, target, deadline)
+            except BaseException:
+                os.close(fd)
+                raise
+        _LOCK_FDS[key] = (fd, depth + 1)
+        try:
+            yield
+        finally:
+            fd, depth = _LOCK_FDS.pop(key)
+            if depth > 1:
+                _LOCK_FDS[key] = (fd, depth - 1)
+            else:
+                try:
+                    _os_unlock(fd)
+                finally:
+                    os.close(fd)
+    finally:
+        rlock.release()
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+# ============================================================================
+# Journal de cambios: <carpeta del Excel>/.journal/<tabla>.jsonl
+# ============================================================================
+# Cada alta/modificación se agrega como una línea JSON en vez de reescribir el
+# .xlsx. Al leer, los registros se aplican sobre el Excel; compact_journals()
+# los vuelca al Excel (al salir o con la app ociosa) y borra el journal.
+# Registros:
+#   {"op": "upsert", "id": 5, "set": {...}}  -> pisa 'set' en las filas con ese
+#                                              id (o alias); si no hay, agrega
+#   {"op": "append", "unique": "numero", "set": {...}}
+#                                           -> agrega la fila salvo que ya
+#                                              exista ese valor en 'unique'
+# Aplicarlos dos veces da lo mismo, así que si se corta entre escribir el Excel
+# y borrar el journal, el replay no duplica nada.
+def _journal_path(path: Path) -> Path:
+    return path.parent / ".journal" / f"{path.stem}.jsonl"
+
+def _json_value(val: Any) -> Any:
+    if val is None:
+        return None
+    try:
+        if pd.isna(val):
+            return None
+    except (TypeError, ValueError):
+        pass
+    if isinstance(val, (datetime, date)):
+        return val.isoformat()
+    if hasattr(val, "item"):
+        return val.item()
+    if isinstance(val, (bool, int, float, str)):
+        return val
+    return str(val)
+
+@timed(rows_in=rows_arg(1), rows_out=None)
+def _journal_append(path: Path, records: List[Dict[str, Any]]) -> None:
+    jpath = _journal_path(path)
+    jpath.parent.mkdir(parents=True, exist_ok=True)
+    lines = []
+    for rec in records:
+        rec = {**rec, "set": {k: _json_value(v) for k, v in rec.get("set", {}).items()}}
+        lines.append(json.dumps(rec, ensure_ascii=False) + "\n")
+    data = "".join(lines).encode("utf-8")
+    with open(jpath, "a+b") as f:
+        # Si una escritura anterior quedó cortada, arranco en línea nueva
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    metrics.count("_journal_append", bytes_written=len(data))
+
+@timed(rows_out=lambda args, kwargs, result: len(result[0]))
+def _journal_read(path: Path, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Registros completos desde 'offset' y el offset hasta donde se leyó."""
+    try:
+        with open(_journal_path(path), "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except OSError:
+        return [], 0
+    metrics.count("_journal_read", bytes_read=len(data))
+    end = data.rfind(b"\n") + 1  # una línea sin \n es una escritura en curso
+    records = []
+    for line in data[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue  # línea dañada por un corte: se ignora
+    return records, offset + end
+
+def _journal_size(path: Path) -> int:
+    if not JOURNAL:
+        return 0
+    stamp = _file_stamp(_journal_path(path))
+    return stamp[1] if stamp else 0
+
+# ============================================================================
+# Migraciones de esquema: <carpeta del Excel>/.schema/<tabla>.json
+# ============================================================================
+# Los arreglos de compatibilidad (alias de id, estado por defecto, importes
+# como número, columnas faltantes) se aplican una sola vez por libro: se
+# migra, se regraba el .xlsx y se anota {"version", "stamp"} del archivo
+# grabado. Mientras el stamp coincida y la versión sea la vigente, la carga
+# usa el DF leído tal cual. Si el Excel se edita a mano cambia el stamp y la
+# migración (idempotente) vuelve a correr. write_*_df siempre graba migrado.
+def _schema_path(path: Path) -> Path:
+    return path.parent / ".schema" / f"{path.stem}.json"
+
+def _schema_current(path: Path, stamp: Tuple[int, int], version: int) -> bool:
+    try:
+        with open(_schema_path(path), encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get("version") == version and tuple(data.get("stamp") or ()) == tuple(stamp)
+    except (OSError, ValueError, AttributeError):
+        return False
+
+def _schema_stamp(path: Path, version: int) -> None:
+    stamp = _file_stamp(path)
+    try:
+        if stamp is None:
+            _schema_path(path).unlink(missing_ok=True)
+        else:
+            _write_json_atomic(_schema_path(path), {"version": version, "stamp": list(stamp)})
+    except OSError:
+        pass  # sin la marca, la próxima lectura vuelve a migrar
+
+def _blank(s: pd.Series) -> pd.Series:
+    return s.isna() | s.astype(str).str.strip().isin(["", "nan", "none", "None", "<NA>"])
+
+@timed(rows_out=None)
+def _migrated(path: Path, base_cols: List[str], migrate: Callable[[pd.DataFrame], pd.DataFrame],
+              version: int, sheet_name: str) -> pd.DataFrame:
+    """
+    DF crudo del libro con el esquema vigente. Si el libro está al día es el
+    DF del cache (no modificarlo); si no, se migra y se intenta regrabar.
+    """
+    df = _read_xlsx(path, base_cols)
+    stamp = _file_stamp(path)
+    if stamp is None or _schema_current(path, stamp, version):
+        return df
+    df = migrate(df)
+    try:
+        # Sin esperar: si alguien está escribiendo la tabla, se migra en otra lectura
+        with _file_lock(path, timeout=0):
+            if _file_stamp(path) == stamp:  # nadie lo cambió mientras leíamos
+                _write_xlsx(path, df, sheet_name, schema_version=version, keep_journal=True)
+                # Lo grabado es este mismo DF: queda como lectura del libro nuevo
+                # (memoria y snapshot) para no volver a parsear lo que acabamos de escribir
+                written = _file_stamp(path)
+                if written is not None:
+                    _cache_put(path, written, df)
+                    if XLSX_SIDECAR:
+                        _sidecar_write(path, written, df)
+    except Exception:
+        pass  # libro abierto en Excel, sin permisos...: seguimos con el DF migrado en memoria
+    return df
+
+# ============================================================================
+# Estado por tabla: DF ya normalizado + estructuras derivadas (índices, ...)
+# ============================================================================
+# La versión de datos es (stamp del Excel, tamaño del journal). Si solo creció
+# el journal, el estado nuevo sale del anterior aplicando los registros nuevos
+# y las estructuras derivadas se actualizan solo para las filas tocadas.
+class _TableState:
+    def __init__(self, version: Tuple, df: pd.DataFrame, id_cols: List[str], offset: int = 0, pending: int = 0,
+                 key: str = "", defaults: Dict[str, Any] | None = None):
+        self.key = key          # ruta del Excel (identifica la tabla)
+        self.version = version
+        self.df = df  # no se modifica: quien necesite cambiarlo, copia
+        self.id_cols = id_cols
+        self.defaults = defaults or {}  # columna -> valor para vacíos (lo mismo que hace la migración)
+        self.offset = offset    # bytes del journal ya aplicados
+        self.pending = pending  # registros del journal aplicados sobre el Excel
+        self.derived: Dict[str, Any] = {}
+
+_STATES: Dict[str, _TableState] = {}
+_BUILD_LOCKS: Dict[str, threading.Lock] = {}  # ruta -> lock de construcción de esa tabla
+
+def _table_version(path: Path) -> Tuple:
+    return (_file_stamp(path), _journal_size(path))
+
+def _table(path: Path, build: Callable[[], pd.DataFrame], id_cols: List[str],
+           defaults: Dict[str, Any] | None = None) -> _TableState:
+    """
+    Estado vigente de la tabla en 'path'; 'build' arma el DF normalizado del Excel.
+    'defaults' rellena los vacíos de los registros del journal igual que la migración.
+    """
+    key = str(path)
+    version = _table_version(path)
+    with _CACHE_LOCK:
+        st = _STATES.get(key)
+        if st is not None and st.version == version:
+            return st
+        building = _BUILD_LOCKS.setdefault(key, threading.Lock())
+    # La construcción (parseo, migración, replay) va con el lock de esta tabla
+    # solamente: las lecturas de las demás tablas siguen sirviéndose del cache
+    with building:
+        with _CACHE_LOCK:
+            st = _STATES.get(key)
+        if st is not None and st.version == version:
+            return st  # la armó otro hilo mientras esperábamos
+        if st is not None and JOURNAL and st.version[0] == version[0] and st.offset <= version[1]:
+            # Mismo Excel, journal más largo: aplico solo lo nuevo
+            records, offset = _journal_read(path, st.offset)
+            df, touched = _replay(st.df, records, id_cols, _derived(st, "pk", _build_pk_index), defaults)
+            new = _TableState(version, df, id_cols, offset, st.pending + len(records), key, defaults)
+            _carry_derived(st, new, touched)
+        else:
+            df = build()
+            records, offset = _journal_read(path, 0) if JOURNAL else ([], 0)
+            if records:
+                df, _ = _replay(df, records, id_cols, _build_pk_index(df, id_cols), defaults)
+            new = _TableState(version, df, id_cols, offset, len(records), key, defaults)
+        with _CACHE_LOCK:
+            _STATES[key] = new
+            _results_invalidate(key)
+        return new
+
+def _state_invalidate(path: Path) -> None:
+    with _CACHE_LOCK:
+        _STATES.pop(str(path), None)
+        _results_invalidate(str(path))
+
+def _memo(store: Dict[Any, Any], key: Any, build: Callable[[], Any]) -> Any:
+    """
+    store[key], armándolo si falta. Se arma fuera de _CACHE_LOCK para no frenar
+    al resto de las tablas; si dos hilos lo arman a la vez, queda el primero.
+    """
+    with _CACHE_LOCK:
+        if key in store:
+            return store[key]
+    value = build()
+    with _CACHE_LOCK:
+        return store.setdefault(key, value)
+
+def _derived(st: _TableState, name: str, build: Callable[..., Any]) -> Any:
+    """Estructura derivada del DF, calculada una vez por versión de datos."""
+    return _memo(st.derived, name, lambda: build(st.df, st.id_cols))
+
+# Actualizadores incrementales: (valor viejo, estado viejo, estado nuevo,
+# posiciones tocadas) -> valor nuevo. Lo que no tenga uno se recalcula a demanda.
+_DERIVED_UPDATERS: Dict[str, Callable[[Any, _TableState, _TableState, List[int]], Any]] = {}
+
+def _carry_derived(old: _TableState, new: _TableState, touched: List[int]) -> None:
+    # Copia: otros hilos pueden seguir agregando estructuras al estado viejo
+    with _CACHE_LOCK:
+        derived = [(name, dict(value) if isinstance(value, dict) else value) for name, value in old.derived.items()]
+    for name, value in derived:
+        updater = _DERIVED_UPDATERS.get(name)
+        if updater is not None:
+            new.derived[name] = updater(value, old, new, touched)
+
+# ---------- Índice por clave primaria (id y alias) ----------
+def _pk_key(val: Any) -> int | None:
+    """Clave entera del índice (misma regla que pd.to_numeric: 5, 5.0 y "5")."""
+    try:
+        f = float(val)
+    except (TypeError, ValueError):
+        return None
+    if f != f or f % 1:
+        return None
+    return int(f)
+
+def _build_pk_index(df: pd.DataFrame, cols: List[str]) -> Dict[str, Dict[int, List[int]]]:
+    """{columna: {id: [posiciones]}} para cada columna de id que exista en el DF."""
+    index: Dict[str, Dict[int, List[int]]] = {}
+    for col in cols:
+        if col not in df.columns:
+            continue
+        nums = pd.to_numeric(df[col], errors="coerce")
+        valid = (nums.notna() & (nums % 1 == 0)).to_numpy()
+        positions: Dict[int, List[int]] = {}
+        for pos, key in zip(valid.nonzero()[0].tolist(), nums.to_numpy()[valid].astype("int64").tolist()):
+            positions.setdefault(key, []).append(pos)
+        index[col] = positions
+    return index
+
+def _update_pk_index(index, old: _TableState, new: _TableState, touched: List[int]):
+    # Copio los dicts (las listas se reemplazan, nunca se mutan) para no tocar
+    # el índice del estado anterior, que otro hilo puede estar usando
+    index = {col: dict(positions) for col, positions in index.items()}
+    n_old = len(old.df)
+    for col in new.id_cols:
+        if col not in new.df.columns:
+            continue
+        positions = index.setdefault(col, {})
+        for pos in touched:
+            if pos < n_old and col in old.df.columns:
+                prev = _pk_key(old.df[col].iat[pos])
+                if prev is not None and pos in positions.get(prev, []):
+                    positions[prev] = [p for p in positions[prev] if p != pos]
+            key = _pk_key(new.df[col].iat[pos])
+            if key is not None:
+                positions[key] = sorted(positions.get(key, []) + [pos])
+    return index
+
+_DERIVED_UPDATERS["pk"] = _update_pk_index
+
+def _pk_positions(st: _TableState, key: Any, first_match: bool) -> List[int]:
+    """
+    Posiciones de las filas con ese id (o alias).
+    first_match=True: devuelve las de la primera columna con coincidencias
+    (lookup); False: la unión de todas (upsert, que actualiza id y alias).
+    """
+    key_int = _to_int(key)
+    if key_int is None:
+        # Ids no numéricos: comparación como texto (caso raro, sin índice)
+        found: List[int] = []
+        for col in st.id_cols:
+            if col in st.df.columns:
+                hits = (st.df[col].astype(str) == str(key)).to_numpy().nonzero()[0].tolist()
+                if hits and first_match:
+                    return hits
+                found.extend(hits)
+        return sorted(set(found))
+    index = _derived(st, "pk", _build_pk_index)
+    found = []
+    for col in st.id_cols:
+        hits = index.get(col, {}).get(key_int, [])
+        if hits and first_match:
+            return hits
+        found.extend(hits)
+    return sorted(set(found))
+
+def _max_id(df: pd.DataFrame) -> int:
+    top = pd.to_numeric(df["id"], errors="coerce").max()
+    return 0 if pd.isna(top) else int(top)
+
+def _next_id(st: _TableState) -> int:
+    return _derived(st, "max_id", lambda df, cols: _max_id(df)) + 1
+
+_DERIVED_UPDATERS["max_id"] = lambda top, old, new, touched: max(
+    [top] + [_pk_key(new.df["id"].iat[p]) or 0 for p in touched]
+)
+
+def _row_dict(st: _TableState, positions: List[int]) -> Dict[str, Any]:
+    if not positions:
+        return {}
+    return {k: _plain(v) for k, v in st.df.iloc[positions[0]].items()}
+
+# ---------- Esquema tipado ----------
+# Cada tabla declara el tipo en memoria de sus columnas y se convierte una sola
+# vez, al armar el estado desde el Excel (no en cada load_*):
+#   "category": pocos valores distintos (estado, marca, modelo, tipo de factura)
+#   "Int64":    ids y año; admite vacíos (pd.NA)
+#   "float64":  importes
+#   "text":     texto libre (string de pandas; respaldado por Arrow si está pyarrow)
+# En texto y categorías el vacío es "" (como en el resto del módulo); solo las
+# numéricas usan pd.NA. Las columnas que no están en el esquema quedan object.
+_TEXT_DTYPE = "string[pyarrow]" if importlib.util.find_spec("pyarrow") else "string"
+
+def _cell_text(val: Any) -> str:
+    if val is None or val is pd.NA or val is pd.NaT:
+        return ""
+    if isinstance(val, float):
+        if val != val:
+            return ""
+        if val.is_integer():
+            return str(int(val))  # 30123456.0 que vino del Excel -> "30123456"
+    return str(val)
+
+def _texts(s: pd.Series) -> np.ndarray:
+    """_cell_text de toda la columna, convirtiendo cada valor distinto una sola vez."""
+    codes, uniques = pd.factorize(s)
+    texts = np.array([_cell_text(u) for u in uniques] + [""], dtype=object)
+    return texts[codes]  # el código -1 (vacío) cae en el "" del final
+
+def _typed_column(s: pd.Series, kind: str) -> pd.Series:
+    if kind == "category":
+        return pd.Series(pd.Categorical(_texts(s)), index=s.index)
+    if kind == "text":
+        return pd.Series(pd.array(_texts(s), dtype=_TEXT_DTYPE), index=s.index)
+    if kind == "float64":
+        return pd.to_numeric(s, errors="coerce").astype("float64")
+    if kind == "Int64":
+        raw = s.astype(object)
+        blank = (raw.isna() | (raw.astype(str).str.strip() == "")).to_numpy()
+        nums = pd.to_numeric(raw.where(~blank), errors="coerce")
+        bad = (nums.isna().to_numpy() & ~blank) | (nums.fillna(0) % 1 != 0).to_numpy()
+        if bad.any():
+            return s  # ids/años que no son enteros: la columna queda como vino
+        return nums.astype("Int64")
+    return s
+
+def _apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """DF nuevo con las columnas del esquema convertidas; 'df' (puede ser el del cache) queda intacto."""
+    cols = {c: _typed_column(df[c], schema[c]) if c in schema else df[c] for c in df.columns}
+    out = pd.DataFrame(cols, copy=False)
+    out.index = pd.RangeIndex(len(out))
+    return out
+
+def _fit_values(df: pd.DataFrame, col: str, values: List[Any]) -> List[Any]:
+    """
+    Adapta valores nuevos (del journal o de un upsert) al dtype de la columna.
+    Agrega las categorías que falten; si un valor no entra en una columna
+    numérica, la columna pasa a object antes que perder el dato.
+    """
+    dtype = df[col].dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        values = [_cell_text(v) for v in values]
+        missing = sorted(set(values) - set(dtype.categories))
+        if missing:
+            df[col] = df[col].cat.add_categories(missing)
+        return values
+    if isinstance(dtype, pd.StringDtype):
+        return [_cell_text(v) for v in values]
+    if dtype == "Int64" or dtype == "float64":
+        out: List[Any] = []
+        for v in values:
+            if _cell_text(v).strip() == "":
+                out.append(pd.NA if dtype == "Int64" else np.nan)
+                continue
+            num = _pk_key(v) if dtype == "Int64" else _float_or_none(v)
+            if num is None:
+                df[col] = df[col].astype(object)
+                return values
+            out.append(num)
+        return out
+    return values
+
+def _float_or_none(val: Any) -> float | None:
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return None
+
+def _plain(val: Any) -> Any:
+    """Escalar de pandas/numpy -> valor Python (pd.NA -> None)."""
+    if val is pd.NA or val is None:
+        return None
+    if isinstance(val, float) and val != val:
+        return None
+    return val.item() if isinstance(val, np.generic) else val
+
+# ---------- Aplicación de registros ----------
+def _with_defaults(values: Dict[str, Any], defaults: Dict[str, Any], new_row: bool) -> Dict[str, Any]:
+    """
+    Copia de 'values' con los vacíos de las columnas de 'defaults' rellenados.
+    En una modificación solo se tocan las columnas que vienen (las demás no cambian).
+    """
+    values = dict(values)
+    for col, default in defaults.items():
+        if (new_row or col in values) and _cell_text(values.get(col)).strip() == "":
+            values[col] = default
+    return values
+
+def _replay(df: pd.DataFrame, records: List[Dict[str, Any]], id_cols: List[str],
+            index: Dict[str, Dict[int, List[int]]],
+            defaults: Dict[str, Any] | None = None) -> Tuple[pd.DataFrame, List[int]]:
+    """Aplica registros sobre una copia de df. Devuelve (df, posiciones tocadas)."""
+    if not records:
+        return df, []
+    df = df.copy()
+    n = len(df)
+    appended: List[Dict[str, Any]] = []
+    added_keys: Dict[Tuple[str, int], List[int]] = {}  # ids de filas agregadas acá
+    uniques: Dict[str, set] = {}
+    changes: Dict[str, Dict[int, Any]] = {}
+    touched = set()
+    for rec in records:
+        values = rec.get("set") or {}
+        if defaults:
+            values = _with_defaults(values, defaults, rec.get("op") == "append")
+        if rec.get("op") == "append":
+            ucol = rec.get("unique")
+            uval = values.get(ucol) if ucol else None
+            if uval not in (None, ""):
+                if ucol not in uniques:
+                    uniques[ucol] = set(df[ucol].astype(str)) if ucol in df.columns else set()
+                if str(uval) in uniques[ucol]:
+                    continue
+                uniques[ucol].add(str(uval))
+            appended.append(dict(values))
+            continue
+
+        key = _pk_key(rec.get("id"))
+        hits = set()
+        for col in id_cols:
+            hits.update(index.get(col, {}).get(key, []))
+            hits.update(added_keys.get((col, key), []))
+        if not hits:
+            pos = n + len(appended)
+            appended.append(dict(values))
+            for col in id_cols:
+                k = _pk_key(values.get(col))
+                if k is not None:
+                    added_keys.setdefault((col, k), []).append(pos)
+            continue
+        for pos in hits:
+            if pos >= n:
+                appended[pos - n].update(values)
+                continue
+            for col, val in values.items():
+                changes.setdefault(col, {})[pos] = val  # el último registro gana
+            touched.add(pos)
+    # Una asignación por columna para todas las filas modificadas
+    for col, by_pos in changes.items():
+        if col not in df.columns:
+            df[col] = None
+        positions = list(by_pos)
+        values = _fit_values(df, col, list(by_pos.values()))
+        # Los planes mandan la fila entera: solo asigno si algo cambió (asignar
+        # en columnas tipadas cuesta bastante más que comparar)
+        current = [_plain(v) for v in df[col].iloc[positions].tolist()]
+        if current == [_plain(v) for v in values]:
+            continue
+        df.iloc[positions, df.columns.get_loc(col)] = values
+    if appended:
+        added = pd.DataFrame(appended)
+        # Mismo dtype (y mismas categorías) que la tabla, así concat no cae a object
+        for col in df.columns:
+            if df[col].dtype != object:
+                raw = added[col].tolist() if col in added.columns else [None] * len(added)
+                values = _fit_values(df, col, raw)
+                added[col] = pd.Series(pd.array(values, dtype=df[col].dtype), index=added.index)
+        df = pd.concat([df, added], ignore_index=True)
+        touched.update(range(n, len(df)))
+    return df, sorted(touched)
+
+def _commit(path: Path, st: _TableState, records: List[Dict[str, Any]],
+            write: Callable[[pd.DataFrame], None]) -> None:
+    """Persiste registros: al journal si está activo; si no, reescribe el Excel."""
+    if JOURNAL:
+        _journal_append(path, records)
+    else:
+        df, _ = _replay(st.df, records, st.id_cols, _derived(st, "pk", _build_pk_index), st.defaults)
+        write(df)
+
+# ---------- Control optimista de versión ----------
+# Los registros se arman sin lock sobre la versión que tenemos en memoria y se
+# graban con el lock de la tabla solo si nadie escribió en el medio (mismo stamp
+# del Excel y mismo largo del journal). Si otro puesto escribió, se vuelven a
+# armar sobre el estado nuevo: así sus filas quedan y los ids no se pisan.
+_WRITE_RETRIES = 3
+_WRITE_STATS: Dict[str, int] = {"commits": 0, "conflicts": 0}
+
+def write_stats() -> Dict[str, int]:
+    """Escrituras confirmadas y conflictos con otros puestos (reintentos)."""
+    with _CACHE_LOCK:
+        return dict(_WRITE_STATS)
+
+def _transact(path: Path, state: Callable[[], _TableState],
+              plan: Callable[[_TableState], Tuple[List[Dict[str, Any]], Any]],
+              write: Callable[[pd.DataFrame], None],
+              committed: Callable[[Tuple, Tuple], None] | None = None) -> Any:
+    """
+    plan(st) -> (registros, resultado). Reintenta ante conflicto; después de
+    _WRITE_RETRIES conflictos lee, arma y graba sin soltar el lock.
+    committed(antes, después) recibe, todavía con el lock, la versión de la
+    tabla justo antes y justo después de esta escritura.
+    """
+    for attempt in range(_WRITE_RETRIES + 1):
+        last = attempt == _WRITE_RETRIES
+        if not last:
+            st = state()
+            records, result = plan(st)
+        with _file_lock(path):
+            if last:
+                st = state()
+                records, result = plan(st)
+            elif _table_version(path) != st.version:
+                with _CACHE_LOCK:
+                    _WRITE_STATS["conflicts"] += 1
+                continue
+            if records:
+                _commit(path, st, records, write)
+            if committed is not None:
+                committed(st.version, _table_version(path))
+            with _CACHE_LOCK:
+                _WRITE_STATS["commits"] += 1
+            return result
+
+# ---------- Altas/modificaciones en lote ----------
+# plan(st, data, exists, new_id) -> (id, cambios) decide qué se escribe para una
+# fila; exists(id) ve también las altas anteriores del mismo lote y new_id()
+# reparte ids correlativos. Todo el lote se persiste con un solo _commit.
+def _plan_batch(st: _TableState, rows: List[Any],
+                plan: Callable[..., Tuple[int, Dict[str, Any]]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    outcomes: List[Dict[str, Any]] = []
+    records: List[Dict[str, Any]] = []
+    added: set = set()
+    top = _next_id(st) - 1
+
+    def exists(key: Any) -> bool:
+        return _pk_key(key) in added or bool(_pk_positions(st, key, first_match=False))
+
+    def new_id() -> int:
+        return top + 1
+
+    for fila, data in enumerate(rows):
+        try:
+            rid, changes = plan(st, dict(data), exists, new_id)
+            resultado = "modificacion" if exists(rid) else "alta"
+        except Exception as e:
+            outcomes.append({"fila": fila, "id": None, "resultado": "error", "error": str(e)})
+            continue
+        records.append({"op": "upsert", "id": rid, "set": changes})
+        added.add(_pk_key(rid))
+        top = max(top, _pk_key(rid) or 0)
+        outcomes.append({"fila": fila, "id": int(rid), "resultado": resultado, "error": ""})
+    return records, outcomes
+
+def _upsert_batch(path: Path, state: Callable[[], _TableState], rows: Iterable[Dict[str, Any]],
+                  plan: Callable[..., Tuple[int, Dict[str, Any]]],
+                  write: Callable[[pd.DataFrame], None]) -> List[Dict[str, Any]]:
+    rows = list(rows)  # ante un conflicto se vuelve a armar
+    return _transact(path, state, lambda st: _plan_batch(st, rows, plan), write)
+
+def _single(outcomes: List[Dict[str, Any]]) -> int:
+    res = outcomes[0]
+    if res["resultado"] == "error":
+        raise ValueError(res["error"])
+    return res["id"]
+
+# ============================================================================
+# Motor de filtros
+# ============================================================================
+# Columnas "sombra" por versión de datos: el texto normalizado (minúsculas,
+# espacios colapsados, sin tildes) y los números ya convertidos. Se calculan
+# una sola vez y todos los filtros se evalúan como una única máscara booleana.
+_SHADOW_BUILDERS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    "text": _norm_series,
+    "num": lambda s: pd.to_numeric(s, errors="coerce").astype("float64"),
+    # Solo los dígitos (DNI / CUIT con o sin guiones y puntos)
+    "digits": lambda s: s.astype(str).str.replace(r"\D+", "", regex=True),
+}
+
+def _shadow(st: _TableState, kind: str, col: str) -> pd.Series:
+    shadows = _derived(st, "shadow", lambda df, cols: {})
+    return _memo(shadows, (kind, col), lambda: _SHADOW_BUILDERS[kind](st.df[col]).reset_index(drop=True))
+
+def _update_shadows(shadows, old: _TableState, new: _TableState, touched: List[int]):
+    updated = {}
+    for (kind, col), values in shadows.items():
+        if col not in new.df.columns:
+            continue  # se recalcula a demanda
+        values = values.reindex(range(len(new.df)))
+        if touched:
+            fresh = _SHADOW_BUILDERS[kind](new.df[col].iloc[touched])
+            values.iloc[touched] = fresh.to_numpy()
+        updated[(kind, col)] = values
+    return updated
+
+_DERIVED_UPDATERS["shadow"] = _update_shadows
+
+# ---------- Índice de trigramas (búsqueda por fragmento) ----------
+# {trigrama: posiciones} por columna, sobre el texto normalizado. Las filas que
+# cambian después de armarlo van a un "delta" aparte; las posiciones viejas que
+# quedan en la base no molestan porque todo candidato se verifica igual.
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _build_trigram_index(values: np.ndarray) -> Dict[str, np.ndarray]:
+    keys: List[str] = []
+    rows: List[int] = []
+    for pos, text in enumerate(values):
+        grams = _trigrams(text)
+        keys.extend(grams)
+        rows.extend([pos] * len(grams))
+    if not keys:
+        return {}
+    codes, uniques = pd.factorize(np.array(keys, dtype=object))
+    order = np.argsort(codes, kind="stable")
+    ordered = np.asarray(rows, dtype=np.int64)[order]
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return {gram: ordered[bounds[i]:bounds[i + 1]] for i, gram in enumerate(uniques)}
+
+def _trigram_index(st: _TableState, col: str) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    indexes = _derived(st, "trigram", lambda df, cols: {})
+    return _memo(indexes, col, lambda: (_build_trigram_index(_shadow(st, "text", col).to_numpy()), {}))
+
+def _update_trigram_index(indexes, old: _TableState, new: _TableState, touched: List[int]):
+    updated = {}
+    for col, (base, delta) in indexes.items():
+        if col not in new.df.columns:
+            continue
+        delta = dict(delta)  # el estado anterior conserva el suyo
+        if touched:
+            texts = _norm_series(new.df[col].iloc[touched]).tolist()
+            for pos, text in zip(touched, texts):
+                for gram in _trigrams(text):
+                    delta[gram] = np.union1d(delta.get(gram, np.empty(0, dtype=np.int64)), [pos])
+        updated[col] = (base, delta)
+    return updated
+
+_DERIVED_UPDATERS["trigram"] = _update_trigram_index
+
+def _trigram_candidates(st: _TableState, col: str, needle: str) -> np.ndarray | None:
+    """Posiciones que tienen todos los trigramas de 'needle' (None si es muy corto)."""
+    grams = _trigrams(needle)
+    if not grams:
+        return None
+    base, delta = _trigram_index(st, col)
+    postings = []
+    for gram in grams:
+        hits = base.get(gram)
+        extra = delta.get(gram)
+        if extra is not None:
+            hits = extra if hits is None else np.union1d(hits, extra)
+        if hits is None:
+            return np.empty(0, dtype=np.int64)
+        postings.append(hits)
+    postings.sort(key=len)
+    found = postings[0]
+    for hits in postings[1:]:
+        if len(found) * 16 < len(hits):
+            # Pocos candidatos contra una lista larga: búsqueda binaria (las listas están ordenadas)
+            idx = np.minimum(np.searchsorted(hits, found), len(hits) - 1)
+            found = found[hits[idx] == found]
+        else:
+            found = np.intersect1d(found, hits, assume_unique=True)
+        if not len(found):
+            break
+    return found
+
+# ---------- Índice por valor (igualdades) ----------
+# {valor: posiciones} sobre una columna sombra ("text", "num" o "digits"). Da
+# las filas de una igualdad sin recorrer la columna y, por el tamaño de cada
+# grupo, cuántas filas va a dejar (lo que usa el planificador). Igual que en
+# los trigramas, las filas tocadas después de armarlo van a un delta y todo
+# candidato se verifica contra la sombra.
+def _build_value_index(values: np.ndarray) -> Dict[Any, np.ndarray]:
+    codes, uniques = pd.factorize(values)  # NaN queda con código -1 y no entra
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return {val: order[bounds[i]:bounds[i + 1]] for i, val in enumerate(uniques)}
+
+def _value_index(st: _TableState, kind: str, col: str) -> Tuple[Dict[Any, np.ndarray], np.ndarray]:
+    indexes = _derived(st, "values", lambda df, cols: {})
+    return _memo(indexes, (kind, col),
+                 lambda: (_build_value_index(_shadow(st, kind, col).to_numpy()), np.empty(0, dtype=np.int64)))
+
+def _update_value_indexes(indexes, old: _TableState, new: _TableState, touched: List[int]):
+    return {
+        (kind, col): (base, np.union1d(delta, touched).astype(np.int64) if touched else delta)
+        for (kind, col), (base, delta) in indexes.items() if col in new.df.columns
+    }
+
+_DERIVED_UPDATERS["values"] = _update_value_indexes
+
+def _value_candidates(st: _TableState, kind: str, col: str, value: Any) -> np.ndarray:
+    base, delta = _value_index(st, kind, col)
+    hits = base.get(value)
+    if hits is None:
+        return delta
+    return np.union1d(hits, delta) if len(delta) else hits
+
+def _value_estimate(st: _TableState, kind: str, col: str, value: Any) -> int:
+    base, delta = _value_index(st, kind, col)
+    hits = base.get(value)
+    return (0 if hits is None else len(hits)) + len(delta)
+
+def _trigram_estimate(st: _TableState, col: str, needle: str) -> float:
+    """Tope de filas de una búsqueda por fragmento: la lista de trigrama más corta."""
+    grams = _trigrams(needle)
+    if not grams:
+        return float("inf")
+    base, delta = _trigram_index(st, col)
+    return min(len(base.get(g, ())) + len(delta.get(g, ())) for g in grams)
+
+# ---------- Cache de resultados (LRU) ----------
+# Las búsquedas se repiten mucho ("Disponible", una marca, el DNI de un
+# cliente). Por (tabla, versión de datos, filtros normalizados) se guardan las
+# posiciones encontradas, no el DF: cada load_* igual entrega su propia copia.
+# Cuando la tabla cambia (guardado, journal, Excel editado) se descartan las
+# entradas de esa tabla y nada más.
+# Una búsqueda que estrecha otra que ya está en el cache ("hon" -> "hond", un
+# filtro más) solo verifica sus filtros sobre esas posiciones: es lo que pasa
+# en cada tecla de la búsqueda mientras se escribe.
+_RESULTS: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+_RESULT_STATS: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "refines": 0}
+
+def _spec_key(specs: List[Tuple[str, str, Any]]) -> Tuple:
+    """Filtros que aplican, normalizados y ordenados: {"marca": " Honda"} == {"marca": "honda"}."""
+    key = []
+    for kind, col, val in specs:
+        if val in (None, ""):
+            continue
+        if kind == "int":
+            num = _to_int(val)
+            if num is not None:
+                key.append((kind, col, num))
+        else:
+            key.append((kind, col, _norm_text(val)))
+    return tuple(sorted(key))
+
+def _results_get(key: Tuple) -> np.ndarray | None:
+    with _CACHE_LOCK:
+        positions = _RESULTS.get(key)
+        if positions is None:
+            _RESULT_STATS["misses"] += 1
+            return None
+        _RESULTS.move_to_end(key)
+        _RESULT_STATS["hits"] += 1
+        return positions
+
+def _results_put(key: Tuple, positions: np.ndarray) -> None:
+    with _CACHE_LOCK:
+        _RESULTS[key] = positions
+        _RESULTS.move_to_end(key)
+        while len(_RESULTS) > RESULT_CACHE_SIZE:
+            _RESULTS.popitem(last=False)
+            _RESULT_STATS["evictions"] += 1
+
+def _results_invalidate(table: str) -> None:
+    with _CACHE_LOCK:
+        stale = [k for k in _RESULTS if k[0] == table]
+        for k in stale:
+            del _RESULTS[k]
+        _RESULT_STATS["invalidations"] += len(stale)
+
+def _narrows(old: Tuple[str, str, Any], new: Tuple[str, str, Any]) -> bool:
+    """True si el filtro normalizado 'new' (misma columna) deja un subconjunto de lo que deja 'old'."""
+    kind, col, val = old
+    if kind in ("eq", "int", "code_eq") or val == new[2]:
+        return val == new[2]
+    if kind == "doc" and (_doc_exact(col, val) or _doc_exact(col, new[2])):
+        return False  # DNI / CUIT completo: exacto por dígitos, no por fragmento
+    return val in new[2]
+
+def _results_base(key: Tuple) -> Tuple[Tuple, np.ndarray] | None:
+    """(filtros, posiciones) del resultado en cache más chico que 'key' estrecha, o None."""
+    table, version, spec = key
+    wanted = {(kind, col): (kind, col, val) for kind, col, val in spec}
+    best = None
+    with _CACHE_LOCK:
+        for (t, v, old), positions in _RESULTS.items():
+            if t != table or v != version or not old or (best is not None and len(positions) >= len(best[1])):
+                continue
+            if all(f[:2] in wanted and _narrows(f, wanted[f[:2]]) for f in old):
+                best = (old, positions)
+        if best is not None:
+            _RESULT_STATS["refines"] += 1
+    return best
+
+def result_cache_stats() -> Dict[str, int]:
+    """Contadores del cache de resultados de load_* (hits/misses/evictions/invalidations/refines/entries)."""
+    with _CACHE_LOCK:
+        return {**_RESULT_STATS, "entries": len(_RESULTS)}
+
+def _filter(st: _TableState, specs: List[Tuple[str, str, Any]]) -> pd.DataFrame:
+    """
+    st.df filtrado por specs, pasando por el cache de resultados.
+    Devuelve un DF propio (el llamador puede modificarlo) con índice 0..n-1.
+    """
+    specs = _resolve_codes(st, specs)
+    spec_key = _spec_key(specs)
+    if not spec_key:
+        return st.df.copy()
+    key = (st.key, st.version, spec_key)
+    positions = _results_get(key) if RESULT_CACHE_SIZE > 0 else None
+    if positions is None:
+        base = _results_base(key) if RESULT_CACHE_SIZE > 0 else None
+        if base is None:
+            positions = _filter_positions(st, specs)
+        else:
+            old, positions = base
+            positions = _filter_positions(st, [f for f in spec_key if f not in old], positions)
+        if RESULT_CACHE_SIZE > 0:
+            _results_put(key, positions)
+    out = st.df.take(positions)
+    out.index = pd.RangeIndex(len(out))
+    return out
+
+# ---------- Planificador ----------
+# Cada filtro se estima en filas que deja (tamaño del grupo en el índice por
+# valor, lista de trigramas más corta; el recorrido sin índice, infinito) y se
+# aplican del más selectivo al menos: el primero da los candidatos y los
+# demás solo se verifican sobre las filas que siguen en pie, sin máscaras de
+# toda la tabla ni DataFrames intermedios.
+# Un DNI / CUIT completo ("doc") se busca exacto por sus dígitos: tipear el
+# CUIT entero con o sin guiones encuentra esa persona y nada más.
+_DOC_DIGITS: Dict[str, Tuple[int, ...]] = {"dni": (7, 8), "cuit": (11,)}
+_DOC_RE = re.compile(r"^[\d.\- ]+$")
+
+# Un Nº de cuadro / motor ("code") tipeado entero y que existe en la tabla se
+# busca exacto ("code_eq"); si no, es un fragmento más. storage_sqlite usa la
+# misma regla (igualdad sobre <col>_key) para que los dos backends den lo mismo.
+
+# La estimación se calcula recién al planificar (puede construir un índice);
+# al refinar un resultado anterior solo se usa la verificación.
+Predicate = Tuple[Callable[[], float], Callable[[], np.ndarray | None], Callable[[np.ndarray], np.ndarray]]
+
+def _doc_exact(col: str, needle: str) -> bool:
+    """DNI / CUIT completo (solo dígitos, puntos, guiones): se busca exacto por dígitos."""
+    return bool(_DOC_RE.match(needle)) and len(re.sub(r"\D", "", needle)) in _DOC_DIGITS.get(col, ())
+
+def _code_exact(exists: Callable[[str], bool], needle: str) -> bool:
+    """Regla de "code" para los dos backends: 'needle' (normalizado) es un número completo existente."""
+    return needle != "" and exists(needle)
+
+def _resolve_codes(st: _TableState, specs: List[Tuple[str, str, Any]]) -> List[Tuple[str, str, Any]]:
+    """Cada filtro "code" pasa a "code_eq" (exacto) o "search" (fragmento) según la tabla."""
+    out = []
+    for kind, col, val in specs:
+        if kind == "code" and val not in (None, ""):
+            texts = _shadow(st, "text", col).to_numpy()
+            # Los candidatos del índice incluyen filas tocadas después de armarlo: se verifican
+            exists = lambda needle: bool((texts[_value_candidates(st, "text", col, needle)] == needle).any())
+            kind = "code_eq" if _code_exact(exists, _norm_text(val)) else "search"
+        out.append((kind, col, val))
+    return out
+
+def _predicate(st: _TableState, kind: str, col: str, val: Any) -> Predicate | None:
+    """(filas estimadas, candidatos, verificación sobre posiciones) o None si no aplica."""
+    if kind == "int":
+        num = _to_int(val)
+        if num is None:
+            return None
+        values = _shadow(st, "num", col).to_numpy()
+        return (lambda: _value_estimate(st, "num", col, float(num)),
+                lambda: _value_candidates(st, "num", col, float(num)),
+                lambda pos: values[pos] == num)
+    needle = _norm_text(val)
+    if kind in ("eq", "code_eq"):
+        values = _shadow(st, "text", col).to_numpy()
+        return (lambda: _value_estimate(st, "text", col, needle),
+                lambda: _value_candidates(st, "text", col, needle),
+                lambda pos: values[pos] == needle)
+    if kind == "doc":
+        if _doc_exact(col, needle):
+            digits = re.sub(r"\D", "", needle)
+            values = _shadow(st, "digits", col).to_numpy()
+            return (lambda: _value_estimate(st, "digits", col, digits),
+                    lambda: _value_candidates(st, "digits", col, digits),
+                    lambda pos: values[pos] == digits)
+        kind = "search"  # fragmento: como cualquier búsqueda
+    if isinstance(st.df[col].dtype, pd.CategoricalDtype):
+        # Pocas categorías: el fragmento se busca en ellas y se expande por código
+        cat = st.df[col].cat
+        names = _norm_series(pd.Series(cat.categories, dtype=object)).tolist()
+        match = np.array([i for i, name in enumerate(names) if needle in name], dtype=np.int64)
+        codes = cat.codes.to_numpy()
+        return (lambda: int(np.bincount(codes[codes >= 0], minlength=len(names))[match].sum()),
+                lambda: np.isin(codes, match).nonzero()[0],
+                lambda pos: np.isin(codes[pos], match))
+    texts = _shadow(st, "text", col).to_numpy()
+    check = lambda pos: np.fromiter((needle in v for v in texts[pos]), dtype=bool, count=len(pos))
+    if kind == "search":
+        return (lambda: _trigram_estimate(st, col, needle), lambda: _trigram_candidates(st, col, needle), check)
+    return (lambda: float("inf"), lambda: None, check)
+
+def _filter_positions(st: _TableState, specs: List[Tuple[str, str, Any]],
+                      within: np.ndarray | None = None) -> np.ndarray:
+    """
+    Posiciones de st.df que cumplen specs (tipo, columna, valor); los de valor vacío no aplican.
+    Con 'within' (un resultado anterior que ya cumple el resto) solo se verifica sobre esas.
+    - "contains": la columna normalizada contiene el valor normalizado
+    - "search":   igual que contains, con candidatos del índice de trigramas
+    - "doc":      DNI / CUIT: exacto por dígitos si está completo; si no, "search"
+    - "eq":       la columna normalizada es igual al valor normalizado
+    - "int":      la columna numérica es igual al valor entero
+    """
+    preds = [_predicate(st, kind, col, val) for kind, col, val in specs if val not in (None, "")]
+    preds = [p for p in preds if p is not None]
+    positions = within
+    if within is None:
+        preds.sort(key=lambda p: p[0]())
+    for estimate, candidates, check in preds:
+        if positions is None:
+            positions = candidates()
+            if positions is None:
+                positions = np.arange(len(st.df))
+        if not len(positions):
+            break
+        positions = positions[check(positions)]
+    return np.arange(len(st.df)) if positions is None else positions
+
 # ============================================================================
 # CLIENTES
 # ============================================================================
@@ -105,122 +1409,104 @@ _CLIENTES_BASE_COLS: List[str] = [
     "email", "telefono", "direccion", "estado"
 ]
 
-def load_clientes(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
-    filters = filters or {}
-    df = _read_xlsx(CLIENTES_XLSX, _CLIENTES_BASE_COLS)
+_CLIENTES_ID_COLS: List[str] = ["id", "cliente_id"]
+
+_CLIENTES_SCHEMA: Dict[str, str] = {
+    "id": "Int64", "cliente_id": "Int64",
+    "nombre": "text", "apellido": "text", "dni": "text", "cuit": "text",
+    "email": "text", "telefono": "text", "direccion": "text",
+    "estado": "category",
+}
 
+# Subir si cambia _migrate_clientes: los libros ya migrados se vuelven a migrar
+_CLIENTES_SCHEMA_VERSION = 1
+
+def _migrate_clientes(df: pd.DataFrame) -> pd.DataFrame:
     # Compatibilidad: si viene 'cliente_id' y no 'id', renombro
     if "cliente_id" in df.columns and "id" not in df.columns:
         df = df.rename(columns={"cliente_id": "id"})
+    df = _ensure_cols(df, _CLIENTES_BASE_COLS).astype(object)
     # Sincronizo alias (si falta cliente_id, lo lleno con id)
     try:
-        empties = df["cliente_id"].isna() | (df["cliente_id"].astype(str).str.strip() == "")
+        empties = _blank(df["cliente_id"])
         df.loc[empties, "cliente_id"] = df.loc[empties, "id"]
     except Exception:
         df["cliente_id"] = df.get("id", "")
 
     # Estado por defecto
     try:
-        s = df["estado"].astype(str)
-        df.loc[s.str.strip().isin(["", "nan", "none", "None"]), "estado"] = "Activo"
+        df.loc[_blank(df["estado"]), "estado"] = "Activo"
     except Exception:
         df["estado"] = "Activo"
+    return df
 
-    # Filtros
-    def contains(col: str, val: str):
-        nonlocal df
-        if not val:
-            return
-        v = _norm_text(val)
-        s = df[col].astype(str).map(_norm_text)
-        df = df[s.str.contains(v, regex=False, na=False)]
-
-    def by_estado(val: str):
-        nonlocal df
-        if not val:
-            return
-        tgt = _norm_text(val)
-        s = df["estado"].astype(str).map(_norm_text)
-        df = df[s.eq(tgt)]
+def _clientes_base() -> pd.DataFrame:
+    df = _migrated(CLIENTES_XLSX, _CLIENTES_BASE_COLS, _migrate_clientes, _CLIENTES_SCHEMA_VERSION, "clientes")
+    return _apply_schema(df, _CLIENTES_SCHEMA)
 
-    contains("nombre", filters.get("nombre", ""))
-    contains("apellido", filters.get("apellido", ""))
-    contains("dni", filters.get("dni", ""))
-    contains("cuit", filters.get("cuit", ""))
-    contains("email", filters.get("email", ""))
-    if filters.get("estado") is not None:
-        by_estado(filters["estado"])
-
-    return _ensure_cols(df, _CLIENTES_BASE_COLS).reset_index(drop=True)
+def _clientes() -> _TableState:
+    return _table(CLIENTES_XLSX, _clientes_base, _CLIENTES_ID_COLS)
 
+@timed
+def load_clientes(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
+    filters = filters or {}
+    return _filter(_clientes(), [
+        ("search", "nombre", filters.get("nombre", "")),
+        ("search", "apellido", filters.get("apellido", "")),
+        ("doc", "dni", filters.get("dni", "")),
+        ("doc", "cuit", filters.get("cuit", "")),
+        ("search", "email", filters.get("email", "")),
+        ("eq", "estado", filters.get("estado")),
+    ])
+
+@timed(rows_in=rows_arg(0))
 def write_clientes_df(df: pd.DataFrame) -> None:
-    d = df.copy()
-    # Garantizo alias
-    if "cliente_id" in d.columns and "id" in d.columns:
-        empties = d["cliente_id"].isna() | (d["cliente_id"].astype(str).str.strip() == "")
-        d.loc[empties, "cliente_id"] = d.loc[empties, "id"]
-    d = _ensure_cols(d, _CLIENTES_BASE_COLS)
-    _write_xlsx(CLIENTES_XLSX, d, "clientes")
+    _write_xlsx(CLIENTES_XLSX, _migrate_clientes(df), "clientes", schema_version=_CLIENTES_SCHEMA_VERSION)
 
+@timed
 def get_cliente_by_id(cid: Any) -> Dict[str, Any]:
-    df = load_clientes({})
-    cid_int = _to_int(cid)
-    # Busco por id o cliente_id (compat)
-    idx = (
-        (pd.to_numeric(df["id"], errors="coerce") == cid_int)
-        if cid_int is not None else (df["id"].astype(str) == str(cid))
-    )
-    row = df.loc[idx]
-    if row.empty and "cliente_id" in df.columns:
-        idx2 = (
-            (pd.to_numeric(df["cliente_id"], errors="coerce") == cid_int)
-            if cid_int is not None else (df["cliente_id"].astype(str) == str(cid))
-        )
-        row = df.loc[idx2]
-    return {} if row.empty else row.iloc[0].to_dict()
+    # Busco por id o cliente_id (compat), en el índice por clave
+    st = _clientes()
+    return _row_dict(st, _pk_positions(st, cid, first_match=True))
 
-def upsert_cliente(data: Dict[str, Any]) -> int:
-    """
-    Inserta/actualiza un cliente.
-    - Si no trae id/cliente_id => asigna uno nuevo (max+1).
-    - Actualiza por coincidencia en id o cliente_id.
-    Devuelve el id (int).
-    """
-    df = load_clientes({})
+def _plan_cliente(st: _TableState, data: Dict[str, Any], exists, new_id) -> Tuple[int, Dict[str, Any]]:
     d = {k: data.get(k, "") for k in _CLIENTES_BASE_COLS}
 
     raw_id = d.get("id") or d.get("cliente_id")
     cid = _to_int(raw_id)
 
-    if cid is None:
-        new_id = int(pd.to_numeric(df["id"], errors="coerce").max() or 0) + 1
-        d["id"] = new_id
-        d["cliente_id"] = new_id
-        if not str(d.get("estado", "")).strip():
-            d["estado"] = "Activo"
-        df = pd.concat([df, pd.DataFrame([d])], ignore_index=True)
-        cid = new_id
+    if cid is not None and exists(cid):
+        # Actualizo solo lo que vino con valor
+        changes = {col: d[col] for col in _CLIENTES_BASE_COLS if d[col] != ""}
     else:
-        idx = df.index[
-            (pd.to_numeric(df["id"], errors="coerce") == cid) |
-            (pd.to_numeric(df.get("cliente_id", pd.Series([None]*len(df))), errors="coerce") == cid)
-        ]
-        if len(idx):
-            for col in _CLIENTES_BASE_COLS:
-                if col in d and d[col] != "":
-                    df.loc[idx, col] = d[col]
-            df.loc[idx, "id"] = cid
-            df.loc[idx, "cliente_id"] = cid
-        else:
-            d["id"] = cid
-            d["cliente_id"] = cid
-            if not str(d.get("estado", "")).strip():
-                d["estado"] = "Activo"
-            df = pd.concat([df, pd.DataFrame([d])], ignore_index=True)
+        if cid is None:
+            cid = new_id()
+        changes = d
+        if not str(d.get("estado", "")).strip():
+            changes["estado"] = "Activo"
+    changes["id"] = cid
+    changes["cliente_id"] = cid
+    return cid, changes
 
-    write_clientes_df(df)
-    return int(cid)
+@timed(rows_in=rows_arg(0))
+def upsert_clientes_many(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    upsert_cliente para muchas filas con una sola escritura.
+    Devuelve por fila {"fila", "id", "resultado": alta|modificacion|error, "error"}.
+    """
+    return _upsert_batch(CLIENTES_XLSX, _clientes, rows, _plan_cliente, write_clientes_df)
+
+@timed(rows_in=single_row)
+def upsert_cliente(data: Dict[str, Any]) -> int:
+    """
+    Inserta/actualiza un cliente.
+    - Si no trae id/cliente_id => asigna uno nuevo (max+1).
+    - Actualiza por coincidencia en id o cliente_id.
+    Devuelve el id (int).
+    """
+    return _single(upsert_clientes_many([data]))
 
+@timed(rows_in=single_row)
 def save_cliente(data: Dict[str, Any]) -> int:
     """Alias de upsert_cliente para compatibilidad con la UI."""
     return upsert_cliente(data)
@@ -236,92 +1522,82 @@ _VEHICULOS_BASE_COLS: List[str] = [
     "precio", "remito", "factura", "estado"
 ]
 
-def load_vehiculos(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
-    filters = filters or {}
-    df = _read_xlsx(VEHICULOS_XLSX, _VEHICULOS_BASE_COLS)
+_VEHICULOS_ID_COLS: List[str] = ["id"]
 
+_VEHICULOS_SCHEMA: Dict[str, str] = {
+    "id": "Int64", "cliente_id": "Int64",
+    "marca": "category", "modelo": "category", "anio": "Int64",
+    "nro_certificado": "text", "nro_dnrpa": "text", "nro_cuadro": "text", "nro_motor": "text",
+    "precio": "float64", "remito": "text", "factura": "text",
+    "estado": "category",
+}
+
+_VEHICULOS_SCHEMA_VERSION = 1
+
+def _migrate_vehiculos(df: pd.DataFrame) -> pd.DataFrame:
     # Compat: si viniera 'vehiculo_id'
     if "vehiculo_id" in df.columns and "id" not in df.columns:
         df = df.rename(columns={"vehiculo_id": "id"})
-
+    df = _ensure_cols(df, _VEHICULOS_BASE_COLS)
     # precio a float tolerante
-    if "precio" in df.columns:
-        df["precio"] = df["precio"].apply(_to_float)
-
-    # Filtros
-    def contains(col: str, val: str):
-        nonlocal df
-        if not val:
-            return
-        v = _norm_text(val)
-        s = df[col].astype(str).map(_norm_text)
-        df = df[s.str.contains(v, regex=False, na=False)]
-
-    def by_anio(val: Any):
-        nonlocal df
-        if val in (None, ""):
-            return
-        an = _to_int(val)
-        if an is None:
-            return
-        col = pd.to_numeric(df["anio"], errors="coerce")
-        df = df[col.eq(an)]
+    df["precio"] = df["precio"].apply(_to_float)
+    return df
 
-    def by_estado(val: str):
-        nonlocal df
-        if not val:
-            return
-        tgt = _norm_text(val)
-        s = df["estado"].astype(str).map(_norm_text)
-        df = df[s.eq(tgt)]
-
-    contains("marca", filters.get("marca", ""))
-    contains("modelo", filters.get("modelo", ""))
-    by_anio(filters.get("anio", ""))
-    contains("nro_cuadro", filters.get("nro_cuadro", ""))
-    contains("nro_motor", filters.get("nro_motor", ""))
-    if filters.get("estado") is not None:
-        by_estado(filters["estado"])
+def _vehiculos_base() -> pd.DataFrame:
+    df = _migrated(VEHICULOS_XLSX, _VEHICULOS_BASE_COLS, _migrate_vehiculos, _VEHICULOS_SCHEMA_VERSION, "vehiculos")
+    return _apply_schema(df, _VEHICULOS_SCHEMA)
 
-    return _ensure_cols(df, _VEHICULOS_BASE_COLS).reset_index(drop=True)
+def _vehiculos() -> _TableState:
+    return _table(VEHICULOS_XLSX, _vehiculos_base, _VEHICULOS_ID_COLS)
 
+@timed
+def load_vehiculos(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
+    filters = filters or {}
+    return _filter(_vehiculos(), [
+        ("search", "marca", filters.get("marca", "")),
+        ("search", "modelo", filters.get("modelo", "")),
+        ("int", "anio", filters.get("anio", "")),
+        ("code", "nro_cuadro", filters.get("nro_cuadro", "")),
+        ("code", "nro_motor", filters.get("nro_motor", "")),
+        ("eq", "estado", filters.get("estado")),
+    ])
+
+@timed(rows_in=rows_arg(0))
 def write_vehiculos_df(df: pd.DataFrame) -> None:
-    d = _ensure_cols(df, _VEHICULOS_BASE_COLS).copy()
-    # precio como número
-    if "precio" in d.columns:
-        d["precio"] = d["precio"].apply(_to_float)
-    _write_xlsx(VEHICULOS_XLSX, d, "vehiculos")
+    _write_xlsx(VEHICULOS_XLSX, _migrate_vehiculos(df), "vehiculos", schema_version=_VEHICULOS_SCHEMA_VERSION)
 
+@timed
 def get_vehiculo_by_id(vid: Any) -> Dict[str, Any]:
-    df = load_vehiculos({})
-    vid_int = _to_int(vid)
-    idx = (
-        (pd.to_numeric(df["id"], errors="coerce") == vid_int)
-        if vid_int is not None else (df["id"].astype(str) == str(vid))
-    )
-    row = df.loc[idx]
-    return {} if row.empty else row.iloc[0].to_dict()
+    st = _vehiculos()
+    return _row_dict(st, _pk_positions(st, vid, first_match=True))
+
+def _plan_vehiculo(st: _TableState, data: Dict[str, Any], exists, new_id) -> Tuple[int, Dict[str, Any]]:
+    d = dict(data)
+    for col in _VEHICULOS_BASE_COLS:
+        d.setdefault(col, "")
+    # precio como número (igual que write_vehiculos_df)
+    d["precio"] = _to_float(d["precio"])
+
+    if d["id"] in (None, "", 0):
+        vid = new_id()
+        d["id"] = vid
+        return vid, d
+    vid = _to_int(d["id"]) or 0
+    if exists(vid):
+        return vid, {k: v for k, v in d.items() if k in st.df.columns}
+    return vid, d
+
+@timed(rows_in=rows_arg(0))
+def upsert_vehiculos_many(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    upsert_vehiculo para muchas filas (p. ej. un remito) con una sola escritura.
+    Devuelve por fila {"fila", "id", "resultado": alta|modificacion|error, "error"}.
+    """
+    return _upsert_batch(VEHICULOS_XLSX, _vehiculos, rows, _plan_vehiculo, write_vehiculos_df)
 
+@timed(rows_in=single_row)
 def upsert_vehiculo(data: Dict[str, Any]) -> int:
-    df = load_vehiculos({})
-    d = _ensure_cols(pd.DataFrame([data]), _VEHICULOS_BASE_COLS).iloc[0].to_dict()
-
-    if "id" not in d or d["id"] in (None, "", 0):
-        new_id = int(pd.to_numeric(df["id"], errors="coerce").max() or 0) + 1
-        d["id"] = new_id
-        df = pd.concat([df, pd.DataFrame([d])], ignore_index=True)
-        vid = new_id
-    else:
-        vid = _to_int(d["id"]) or 0
-        idx = df.index[pd.to_numeric(df["id"], errors="coerce") == vid]
-        if len(idx):
-            for k, v in d.items():
-                if k in df.columns:
-                    df.loc[idx, k] = v
-        else:
-            df = pd.concat([df, pd.DataFrame([d])], ignore_index=True)
-    write_vehiculos_df(df)
-    return int(vid)
+    return _single(upsert_vehiculos_many([data]))
 
 # ============================================================================
 # PROVEEDORES
@@ -331,112 +1607,93 @@ _PROVEEDORES_BASE_COLS: List[str] = [
     "id", "proveedor_id", "nombre", "cuit", "email", "telefono", "direccion", "estado"
 ]
 
-def load_proveedores(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
-    filters = filters or {}
-    df = _read_xlsx(PROVEEDORES_XLSX, _PROVEEDORES_BASE_COLS)
+_PROVEEDORES_ID_COLS: List[str] = ["id", "proveedor_id"]
 
+_PROVEEDORES_SCHEMA: Dict[str, str] = {
+    "id": "Int64", "proveedor_id": "Int64",
+    "nombre": "text", "cuit": "text", "email": "text", "telefono": "text", "direccion": "text",
+    "estado": "category",
+}
+
+_PROVEEDORES_SCHEMA_VERSION = 1
+
+def _migrate_proveedores(df: pd.DataFrame) -> pd.DataFrame:
     # Compat: si viene 'proveedor_id' y no 'id', renombro
     if "proveedor_id" in df.columns and "id" not in df.columns:
         df = df.rename(columns={"proveedor_id": "id"})
-
+    df = _ensure_cols(df, _PROVEEDORES_BASE_COLS).astype(object)
     # Alias proveedor_id
     try:
-        empties = df["proveedor_id"].isna() | (df["proveedor_id"].astype(str).str.strip() == "")
+        empties = _blank(df["proveedor_id"])
         df.loc[empties, "proveedor_id"] = df.loc[empties, "id"]
     except Exception:
         df["proveedor_id"] = df.get("id", "")
 
     # Estado por defecto
     try:
-        s = df["estado"].astype(str)
-        df.loc[s.str.strip().isin(["", "nan", "none", "None"]), "estado"] = "Activo"
+        df.loc[_blank(df["estado"]), "estado"] = "Activo"
     except Exception:
         df["estado"] = "Activo"
+    return df
 
-    # Filtros
-    def contains(col: str, val: str):
-        nonlocal df
-        if not val:
-            return
-        v = _norm_text(val)
-        s = df[col].astype(str).map(_norm_text)
-        df = df[s.str.contains(v, regex=False, na=False)]
-
-    def by_estado(val: str):
-        nonlocal df
-        if not val:
-            return
-        tgt = _norm_text(val)
-        s = df["estado"].astype(str).map(_norm_text)
-        df = df[s.eq(tgt)]
-
-    contains("nombre", filters.get("nombre", ""))
-    contains("cuit", filters.get("cuit", ""))
-    contains("email", filters.get("email", ""))
-    if filters.get("estado") is not None:
-        by_estado(filters["estado"])
+def _proveedores_base() -> pd.DataFrame:
+    df = _migrated(PROVEEDORES_XLSX, _PROVEEDORES_BASE_COLS, _migrate_proveedores,
+                   _PROVEEDORES_SCHEMA_VERSION, "proveedores")
+    return _apply_schema(df, _PROVEEDORES_SCHEMA)
 
-    return _ensure_cols(df, _PROVEEDORES_BASE_COLS).reset_index(drop=True)
+def _proveedores() -> _TableState:
+    return _table(PROVEEDORES_XLSX, _proveedores_base, _PROVEEDORES_ID_COLS)
 
+@timed
+def load_proveedores(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
+    filters = filters or {}
+    return _filter(_proveedores(), [
+        ("search", "nombre", filters.get("nombre", "")),
+        ("doc", "cuit", filters.get("cuit", "")),
+        ("search", "email", filters.get("email", "")),
+        ("eq", "estado", filters.get("estado")),
+    ])
+
+@timed(rows_in=rows_arg(0))
 def write_proveedores_df(df: pd.DataFrame) -> None:
-    d = df.copy()
-    if "proveedor_id" in d.columns and "id" in d.columns:
-        empties = d["proveedor_id"].isna() | (d["proveedor_id"].astype(str).str.strip() == "")
-        d.loc[empties, "proveedor_id"] = d.loc[empties, "id"]
-    d = _ensure_cols(d, _PROVEEDORES_BASE_COLS)
-    _write_xlsx(PROVEEDORES_XLSX, d, "proveedores")
+    _write_xlsx(PROVEEDORES_XLSX, _migrate_proveedores(df), "proveedores",
+                schema_version=_PROVEEDORES_SCHEMA_VERSION)
 
+@timed
 def get_proveedor_by_id(pid: Any) -> Dict[str, Any]:
-    df = load_proveedores({})
-    pid_int = _to_int(pid)
-    idx = (
-        (pd.to_numeric(df["id"], errors="coerce") == pid_int)
-        if pid_int is not None else (df["id"].astype(str) == str(pid))
-    )
-    row = df.loc[idx]
-    if row.empty and "proveedor_id" in df.columns:
-        idx2 = (
-            (pd.to_numeric(df["proveedor_id"], errors="coerce") == pid_int)
-            if pid_int is not None else (df["proveedor_id"].astype(str) == str(pid))
-        )
-        row = df.loc[idx2]
-    return {} if row.empty else row.iloc[0].to_dict()
+    st = _proveedores()
+    return _row_dict(st, _pk_positions(st, pid, first_match=True))
 
-def upsert_proveedor(data: Dict[str, Any]) -> int:
-    df = load_proveedores({})
+def _plan_proveedor(st: _TableState, data: Dict[str, Any], exists, new_id) -> Tuple[int, Dict[str, Any]]:
     d = {k: data.get(k, "") for k in _PROVEEDORES_BASE_COLS}
 
     raw_id = d.get("id") or d.get("proveedor_id")
     pid = _to_int(raw_id)
 
     if pid is None:
-        new_id = int(pd.to_numeric(df["id"], errors="coerce").max() or 0) + 1
-        d["id"] = new_id
-        d["proveedor_id"] = new_id
-        d["estado"] = "Activo"
-        df = pd.concat([df, pd.DataFrame([d])], ignore_index=True)
-        pid = new_id
+        pid = new_id()
+        changes = d
+        changes["estado"] = "Activo"
+    elif exists(pid):
+        changes = {col: d[col] for col in _PROVEEDORES_BASE_COLS if d[col] != ""}
     else:
-        idx = df.index[
-            (pd.to_numeric(df["id"], errors="coerce") == pid) |
-            (pd.to_numeric(df.get("proveedor_id", pd.Series([None]*len(df))), errors="coerce") == pid)
-        ]
-        if len(idx):
-            for col in _PROVEEDORES_BASE_COLS:
-                if col in d and d[col] != "":
-                    df.loc[idx, col] = d[col]
-            df.loc[idx, "id"] = pid
-            df.loc[idx, "proveedor_id"] = pid
-        else:
-            d["id"] = pid
-            d["proveedor_id"] = pid
-            if not str(d.get("estado", "")).strip():
-                d["estado"] = "Activo"
-            df = pd.concat([df, pd.DataFrame([d])], ignore_index=True)
+        changes = d
+        if not str(d.get("estado", "")).strip():
+            changes["estado"] = "Activo"
+    changes["id"] = pid
+    changes["proveedor_id"] = pid
+    return pid, changes
 
-    write_proveedores_df(df)
-    return int(pid)
+@timed(rows_in=rows_arg(0))
+def upsert_proveedores_many(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """upsert_proveedor para muchas filas con una sola escritura (mismo resultado por fila)."""
+    return _upsert_batch(PROVEEDORES_XLSX, _proveedores, rows, _plan_proveedor, write_proveedores_df)
 
+@timed(rows_in=single_row)
+def upsert_proveedor(data: Dict[str, Any]) -> int:
+    return _single(upsert_proveedores_many([data]))
+
+@timed(rows_in=single_row)
 def save_proveedor(data: Dict[str, Any]) -> int:
     """Alias de upsert_proveedor para compatibilidad con la UI."""
     return upsert_proveedor(data)
@@ -454,56 +1711,100 @@ _FACTURAS_BASE_COLS: List[str] = [
     "cae", "vto_cae",
 ]
 
+# fecha y vto_cae quedan como vinieron (fechas de Excel o texto)
+_FACTURAS_SCHEMA: Dict[str, str] = {
+    "numero": "text", "cliente": "text", "cuit_dni_cliente": "text",
+    "vehiculo": "text", "patente": "text",
+    "tipo": "category", "pago": "category",
+    "subtotal": "float64", "iva": "float64", "total": "float64",
+    "cae": "text",
+}
+
+_FACTURAS_SCHEMA_VERSION = 1
+# Importes vacíos -> 0, tanto al migrar el libro como al aplicar el journal
+_FACTURAS_DEFAULTS: Dict[str, Any] = {"subtotal": 0.0, "iva": 0.0, "total": 0.0}
+
+def _migrate_facturas(df: pd.DataFrame) -> pd.DataFrame:
+    df = _ensure_cols(df, _FACTURAS_BASE_COLS)
+    # Aseguro tipos numéricos tolerantes (1.234,56 -> 1234.56; vacío -> 0)
+    for col in _FACTURAS_DEFAULTS:
+        df[col] = pd.to_numeric(df[col].apply(_to_float), errors="coerce").fillna(0.0)
+    return df
+
+def _facturas_base() -> pd.DataFrame:
+    df = _migrated(FACTURAS_XLSX, _FACTURAS_BASE_COLS, _migrate_facturas, _FACTURAS_SCHEMA_VERSION, "facturas")
+    return _apply_schema(df, _FACTURAS_SCHEMA)
+
+def _facturas() -> _TableState:
+    return _table(FACTURAS_XLSX, _facturas_base, [], _FACTURAS_DEFAULTS)
+
+@timed
 def load_facturas(filters: Dict[str, Any] | None = None) -> pd.DataFrame:
     filters = filters or {}
-    df = _read_xlsx(FACTURAS_XLSX, _FACTURAS_BASE_COLS)
-
-    # Aseguro tipos numéricos tolerantes
-    for col in ["subtotal", "iva", "total"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
-
-    # Filtros básicos
-    def contains(col: str, val: str):
-        nonlocal df
-        if not val:
-            return
-        v = _norm_text(val)
-        s = df[col].astype(str).map(_norm_text)
-        df = df[s.str.contains(v, regex=False, na=False)]
-
-    contains("cliente", filters.get("cliente", ""))
-    contains("vehiculo", filters.get("vehiculo", ""))
-
-    return _ensure_cols(df, _FACTURAS_BASE_COLS).reset_index(drop=True)
+    return _filter(_facturas(), [
+        ("contains", "cliente", filters.get("cliente", "")),
+        ("contains", "vehiculo", filters.get("vehiculo", "")),
+    ])
 
+@timed(rows_in=rows_arg(0))
 def write_facturas_df(df: pd.DataFrame) -> None:
-    d = _ensure_cols(df, _FACTURAS_BASE_COLS).copy()
-    for col in ["subtotal", "iva", "total"]:
-        if col in d.columns:
-            d[col] = d[col].apply(_to_float)
-    _write_xlsx(FACTURAS_XLSX, d, "facturas")
+    _write_xlsx(FACTURAS_XLSX, _migrate_facturas(df), "facturas", schema_version=_FACTURAS_SCHEMA_VERSION)
 
+@timed(rows_in=single_row)
 def append_factura(data: Dict[str, Any]) -> None:
     """
     Agrega una fila a facturas.xlsx garantizando columnas mínimas.
     Si faltan columnas nuevas (cae/vto_cae/fecha), se crean.
     """
-    df = load_facturas({})
     # normalizo claves a minúscula para mapear
     normalized = {str(k).lower(): v for k, v in data.items()}
-    # garantizo columnas
-    for col in _FACTURAS_BASE_COLS:
-        if col not in df.columns:
-            df[col] = None
     # importes a float
     for k in ("subtotal", "iva", "total"):
         if k in normalized:
             normalized[k] = _to_float(normalized[k])
 
     new_row = {col: normalized.get(col, None) for col in _FACTURAS_BASE_COLS}
-    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-    write_facturas_df(df)
+    # 'unique': si el registro se aplica dos veces, la factura no se duplica
+    record = {"op": "append", "unique": "numero", "set": new_row}
+    versions: List[Tuple] = []
+    _transact(FACTURAS_XLSX, _facturas, lambda st: ([record], None), write_facturas_df,
+              committed=lambda before, after: versions.extend((before, after)))
+    if new_row.get("numero"):
+        commit_numero_factura(str(new_row["numero"]), tuple(versions))
+
+# ============================================================================
+# Compactación de journals
+# ============================================================================
+def _journaled_tables() -> List[Tuple[Path, Callable[[], _TableState], Callable[[pd.DataFrame], None]]]:
+    return [
+        (CLIENTES_XLSX, _clientes, write_clientes_df),
+        (VEHICULOS_XLSX, _vehiculos, write_vehiculos_df),
+        (PROVEEDORES_XLSX, _proveedores, write_proveedores_df),
+        (FACTURAS_XLSX, _facturas, write_facturas_df),
+    ]
+
+@timed
+def journal_pending() -> Dict[str, int]:
+    """Registros del journal aún no volcados al Excel, por tabla."""
+    return {path.stem: state().pending for path, state, _ in _journaled_tables() if _journal_size(path)}
+
+@timed
+def compact_journals() -> Dict[str, int]:
+    """
+    Vuelca cada journal pendiente a su Excel (una escritura por tabla) y lo
+    borra. Pensado para llamarse al salir o con la app ociosa.
+    Devuelve los registros volcados por tabla.
+    """
+    done: Dict[str, int] = {}
+    for path, state, write in _journaled_tables():
+        if not _journal_size(path):
+            continue
+        # Con el lock tomado nadie agrega al journal entre leerlo y borrarlo
+        with _file_lock(path):
+            st = state()
+            write(st.df)
+        done[path.stem] = st.pending
+    return done
 
 def _parse_numero(numero: str) -> Tuple[str, int] | None:
     """
@@ -520,29 +1821,180 @@ def _parse_numero(numero: str) -> Tuple[str, int] | None:
     except Exception:
         return None
 
-def get_ultimo_numero_factura(punto_venta: str = "0001") -> str:
+# ============================================================================
+# Numeración de facturas: secuencia persistida por punto de venta
+# ============================================================================
+# <carpeta del Excel>/.seq/facturas.json guarda, por punto de venta, el último
+# número confirmado, los reservados (con su hora), los autorizados por ARCA que
+# todavía no se registraron y los liberados. Todo cambio se hace con el lock de
+# la secuencia tomado, así dos puestos emitiendo a la vez no se pisan. El flujo
+# de emisión es:
+#     numero = reserve_numero_factura(pv)
+#     ... ARCA ...  (si falla) release_numero_factura(numero)
+#     authorize_numero_factura(numero)  # con CAE: ya no se libera nunca
+#     append_factura({... "numero": numero ...})  # confirma
+# Los liberados se reutilizan primero, para no dejar huecos. Solo vence una
+# reserva que no llegó a autorizarse; un autorizado sin registrar queda ahí
+# (authorized_numeros_factura) hasta que se registre o se concilie a mano. La secuencia se
+# reconstruye desde facturas.xlsx solo si falta, está dañada o el archivo de
+# facturas cambió por fuera de la app. Las altas propias no cuentan como
+# cambio: append_factura pasa la versión de facturas de antes y de después de
+# su escritura y la secuencia avanza de una a la otra sin releer nada.
+_SEQ_TTL_S = 15 * 60  # una reserva sin autorizar más vieja que esto se libera
+
+def _seq_path() -> Path:
+    return FACTURAS_XLSX.parent / ".seq" / "facturas.json"
+
+def _seq_version(version: Tuple | None = None) -> List[Any]:
+    """Versión de facturas (la actual si no se pasa) tal como se guarda en el JSON."""
+    stamp, jsize = version if version is not None else _table_version(FACTURAS_XLSX)
+    return [list(stamp) if stamp else None, jsize]
+
+def _seq_scan() -> Dict[str, Tuple[int, set]]:
+    """{pto_venta: (máximo, números usados)} según facturas.xlsx + journal."""
+    s = _facturas().df["numero"].astype(str).str.strip()
+    parts = s.str.extract(r"^(.{4})-(.{8})$")
+    nums = pd.to_numeric(parts[1], errors="coerce")
+    valid = nums.notna()
+    scan: Dict[str, Tuple[int, set]] = {}
+    for pv, group in nums[valid].astype("int64").groupby(parts[0][valid]):
+        scan[str(pv)] = (int(group.max()), set(group.tolist()))
+    return scan
+
+def _seq_load() -> Dict[str, Any]:
+    try:
+        with open(_seq_path(), encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and isinstance(data.get("puntos"), dict):
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"version": None, "puntos": {}}
+
+def _seq_point(data: Dict[str, Any], pv: str) -> Dict[str, Any]:
+    """Estado del punto de venta; si facturas cambió por fuera, se revalida contra el Excel."""
+    version = _seq_version()
+    if data.get("version") != version or pv not in data["puntos"]:
+        scan = _seq_scan()
+        for key in set(data["puntos"]) | {pv}:
+            point = data["puntos"].setdefault(key, {"ultimo": 0, "reservados": {}, "liberados": []})
+            point.setdefault("autorizados", {})
+            top, used = scan.get(key, (0, set()))
+            # Nunca retrocedo: un número ya emitido no se vuelve a usar
+            point["ultimo"] = max(int(point["ultimo"]), top)
+            point["liberados"] = sorted(n for n in point["liberados"] if n not in used)
+            for n in [n for n in point["autorizados"] if int(n) in used]:
+                del point["autorizados"][n]  # ya registrado (por otro puesto o a mano)
+        data["version"] = version
+    point = data["puntos"][pv]
+    point.setdefault("autorizados", {})
+    # Reservas vencidas (el puesto que las tomó se cerró antes de pedir el CAE)
+    now = time.time()
+    for n, ts in list(point["reservados"].items()):
+        if now - float(ts) > _SEQ_TTL_S:
+            del point["reservados"][n]
+            point["liberados"] = sorted(set(point["liberados"]) | {int(n)})
+    return point
+
+def _seq_next(point: Dict[str, Any]) -> int:
+    if point["liberados"]:
+        return min(point["liberados"])
+    taken = [int(n) for n in point["reservados"]] + [int(n) for n in point["autorizados"]]
+    return max([int(point["ultimo"])] + taken) + 1
+
+def _fmt_numero(pv: str, n: int) -> str:
+    return f"{pv}-{str(n).zfill(8)}"
+
+@timed
+def reserve_numero_factura(punto_venta: str = "0001") -> str:
+    """Reserva el próximo número 'PPPP-NNNNNNNN' (confirmar con append_factura o liberar)."""
+    pv = str(punto_venta).zfill(4)
+    with _file_lock(_seq_path()):
+        data = _seq_load()
+        point = _seq_point(data, pv)
+        n = _seq_next(point)
+        point["liberados"] = [x for x in point["liberados"] if x != n]
+        point["reservados"][str(n)] = time.time()
+        _write_json_atomic(_seq_path(), data)
+    return _fmt_numero(pv, n)
+
+@timed
+def commit_numero_factura(numero: str, versions: Tuple = ()) -> None:
     """
-    Devuelve el próximo número correlativo 'PPPP-NNNNNNNN' para el punto de venta dado.
-    - Si el Excel está vacío, arranca en 'PPPP-00000001'.
-    - Si hay números en otro formato, los ignora para el cómputo.
-    - Calcula el máximo por pto. de venta (no solo el último row).
+    Marca el número como usado (append_factura lo llama solo).
+    versions = (antes, después) de la escritura de la factura: si la secuencia
+    estaba al día con 'antes', pasa a 'después' sin revalidar contra el Excel.
     """
-    df = load_facturas({})
+    parsed = _parse_numero(numero)
+    if not parsed:
+        return
+    pv, n = parsed
+    with _file_lock(_seq_path()):
+        data = _seq_load()
+        if len(versions) == 2 and data.get("version") == _seq_version(versions[0]):
+            data["version"] = _seq_version(versions[1])
+        # Si además escribió otro (u otro puesto), acá se revalida
+        point = _seq_point(data, pv)
+        point["reservados"].pop(str(n), None)
+        point["autorizados"].pop(str(n), None)
+        point["liberados"] = [x for x in point["liberados"] if x != n]
+        point["ultimo"] = max(int(point["ultimo"]), n)
+        _write_json_atomic(_seq_path(), data)
+
+@timed
+def authorize_numero_factura(numero: str) -> None:
+    """
+    Marca el número como autorizado por ARCA (llamar apenas llega el CAE).
+    Desde acá no vence ni se puede liberar: queda tomado aunque la factura no
+    llegue a registrarse, hasta que append_factura lo confirme.
+    """
+    parsed = _parse_numero(numero)
+    if not parsed:
+        return
+    pv, n = parsed
+    with _file_lock(_seq_path()):
+        data = _seq_load()
+        point = _seq_point(data, pv)
+        point["reservados"].pop(str(n), None)
+        point["liberados"] = [x for x in point["liberados"] if x != n]
+        point["autorizados"][str(n)] = time.time()
+        _write_json_atomic(_seq_path(), data)
+
+@timed
+def release_numero_factura(numero: str) -> None:
+    """Devuelve un número reservado que no se usó; el próximo en reservar lo reutiliza (un autorizado no)."""
+    parsed = _parse_numero(numero)
+    if not parsed:
+        return
+    pv, n = parsed
+    with _file_lock(_seq_path()):
+        data = _seq_load()
+        point = _seq_point(data, pv)
+        if point["reservados"].pop(str(n), None) is not None:
+            point["liberados"] = sorted(set(point["liberados"]) | {n})
+            _write_json_atomic(_seq_path(), data)
+
+@timed
+def authorized_numeros_factura(punto_venta: str = "0001") -> List[str]:
+    """Números autorizados por ARCA que todavía no se registraron (para conciliar a mano)."""
     pv = str(punto_venta).zfill(4)
+    with _file_lock(_seq_path()):
+        point = _seq_point(_seq_load(), pv)
+    return [_fmt_numero(pv, n) for n in sorted(int(k) for k in point["autorizados"])]
 
-    if df.empty or df["numero"].isna().all():
-        return f"{pv}-00000001"
-
-    # Filtra por punto de venta y toma máximo numérico válido
-    candidatos = []
-    for n in df["numero"].astype(str).tolist():
-        parsed = _parse_numero(n)
-        if parsed and parsed[0] == pv:
-            candidatos.append(parsed[1])
-
-    if not candidatos:
-        # no hay números para ese PV todavía
-        return f"{pv}-00000001"
-
-    nxt = max(candidatos) + 1
-    return f"{pv}-{str(nxt).zfill(8)}"
+@timed
+def get_ultimo_numero_factura(punto_venta: str = "0001") -> str:
+    """
+    Devuelve el próximo número correlativo 'PPPP-NNNNNNNN' para el punto de venta dado,
+    sin reservarlo (para emitir, usar reserve_numero_factura).
+    - Si no hay facturas de ese punto de venta, arranca en 'PPPP-00000001'.
+    - Los números en otro formato no cuentan.
+    """
+    pv = str(punto_venta).zfill(4)
+    with _file_lock(_seq_path()):
+        data = _seq_load()
+        before = json.dumps(data, sort_keys=True)
+        point = _seq_point(data, pv)
+        if json.dumps(data, sort_keys=True) != before:
+            _write_json_atomic(_seq_path(), data)
+    return _fmt_numero(pv, _seq_next(point))
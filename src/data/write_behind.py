@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+# ============================================================================
+# Escritura diferida ("write-behind") en un hilo propio
+# ============================================================================
+# Los guardados se encolan y vuelven enseguida; un único hilo los graba en
+# orden. Los guardados seguidos de una misma tabla se juntan en una sola
+# llamada a upsert_<tabla>_many (una sola escritura). Garantías:
+#   - flush(tabla) espera a que se grabe lo pendiente de esa tabla; el facade
+#     storage lo llama antes de cada load_* / get_*_by_id (flush-before-read)
+#   - close() graba todo lo pendiente y detiene el hilo (flush-on-exit)
+# El resultado de cada guardado llega por callback(id, error) desde el hilo
+# de escritura; la UI lo pasa a señales Qt (src/ui/write_queue.py).
+
+QUEUE_SIZE = 256
+
+_log = logging.getLogger("gestion.write_behind")
+
+Callback = Callable[[Any, str], None]  # (id o None, mensaje de error o "")
+
+# tabla -> función del backend que graba un lote
+_BATCH_FUNCS: Dict[str, str] = {
+    "clientes": "upsert_clientes_many",
+    "vehiculos": "upsert_vehiculos_many",
+    "proveedores": "upsert_proveedores_many",
+}
+
+class WriteBehind:
+    def __init__(self, backend: ModuleType, maxsize: int = QUEUE_SIZE):
+        self._backend = backend
+        self._queue: "queue.Queue[Tuple[str, str, Any, Callback | None] | None]" = queue.Queue(maxsize)
+        self._pending: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    # ---------- API ----------
+    def save(self, table: str, data: Dict[str, Any], callback: Callback | None = None) -> None:
+        """Encola un upsert de clientes/vehiculos/proveedores."""
+        if table not in _BATCH_FUNCS:
+            raise ValueError(f"Tabla sin guardado diferido: {table}")
+        self._put(table, "upsert", dict(data), callback)
+
+    def append_factura(self, data: Dict[str, Any], callback: Callback | None = None) -> None:
+        self._put("facturas", "append", dict(data), callback)
+
+    def compact(self, callback: Callback | None = None) -> None:
+        """Encola el volcado de los journals (se junta con otros compact seguidos)."""
+        self._put("*", "compact", None, callback)
+
+    def pending(self, table: str | None = None) -> int:
+        with self._cond:
+            if table is None:
+                return sum(self._pending.values())
+            return self._pending.get(table, 0) + self._pending.get("*", 0)
+
+    def flush(self, table: str | None = None, timeout: float | None = None) -> bool:
+        """Espera a que se grabe lo pendiente (de 'table' o de todo). False si venció el timeout."""
+        if threading.current_thread() is self._thread:
+            return True  # desde un callback: lo anterior ya está grabado
+        with self._cond:
+            return self._cond.wait_for(lambda: self.pending(table) == 0, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Graba lo pendiente y detiene el hilo."""
+        with self._cond:
+            if self._closed:
+                return True
+            self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    # ---------- Hilo de escritura ----------
+    def _put(self, table: str, op: str, data: Any, callback: Callback | None) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("La cola de escritura ya está cerrada")
+            self._pending[table] = self._pending.get(table, 0) + 1
+        # Cola acotada: si el disco no da abasto, quien guarda espera acá
+        self._queue.put((table, op, data, callback))
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            items = [item]
+            stop = False
+            # Junto todo lo que ya esté esperando
+            while True:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                items.append(nxt)
+            for group in self._groups(items):
+                self._write(group)
+            if stop:
+                return
+
+    @staticmethod
+    def _groups(items: List[Tuple[str, str, Any, Callback | None]]) -> List[List[Tuple[str, str, Any, Callback | None]]]:
+        """Corta en tramos consecutivos de la misma tabla y operación (el orden se respeta)."""
+        groups: List[List[Tuple[str, str, Any, Callback | None]]] = []
+        for it in items:
+            if groups and groups[-1][0][:2] == it[:2] and it[1] != "append":
+                groups[-1].append(it)
+            else:
+                groups.append([it])
+        return groups
+
+    def _write(self, group: List[Tuple[str, str, Any, Callback | None]]) -> None:
+        table, op = group[0][0], group[0][1]
+        results: List[Tuple[Any, str]]
+        try:
+            if op == "upsert":
+                outcomes = getattr(self._backend, _BATCH_FUNCS[table])([it[2] for it in group])
+                results = [(o["id"], o["error"]) for o in outcomes]
+            elif op == "append":
+                self._backend.append_factura(group[0][2])
+                results = [(group[0][2].get("numero"), "")]
+            else:
+                done = self._backend.compact_journals()
+                results = [(done, "")] * len(group)
+        except Exception as e:
+            results = [(None, str(e) or e.__class__.__name__)] * len(group)
+        with self._cond:
+            self._pending[table] -= len(group)
+            self._cond.notify_all()
+        for (_, _, _, callback), (result, error) in zip(group, results):
+            if callback is not None:
+                try:
+                    callback(result, error)
+                except Exception:
+                    # El dato ya está grabado (o el error ya se informó): solo falló quien escucha
+                    _log.exception("Falló el callback de un guardado de %s", table)
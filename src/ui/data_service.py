@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+# ============================================================================
+# Lecturas en segundo plano para las páginas de listado
+# ============================================================================
+# Las búsquedas (ux.load_*) corren en un QThreadPool propio y el resultado
+# vuelve como señal al hilo de la UI. Cada página pide con su propia clave;
+# cada pedido nuevo sube la generación de esa clave y lo que llegue de un
+# pedido anterior se descarta (si todavía no empezó, ni siquiera se ejecuta).
+#
+#     data_service().request("clientes", ux.load_clientes, filters,
+#                            on_result=self._on_data, on_error=self._on_error)
+#     data_service().busy_changed.connect(lambda clave, ocupado: ...)
+
+MAX_THREADS = 2
+
+class _Load(QRunnable):
+    def __init__(self, service: "DataService", key: str, gen: int, fn: Callable[..., Any], args: Tuple):
+        super().__init__()
+        self._service = service
+        self._key = key
+        self._gen = gen
+        self._fn = fn
+        self._args = args
+
+    def run(self) -> None:
+        if not self._service.is_current(self._key, self._gen):
+            return  # lo reemplazó un pedido más nuevo antes de arrancar
+        try:
+            result, error = self._fn(*self._args), ""
+        except Exception as e:
+            result, error = None, str(e) or e.__class__.__name__
+        self._service._done.emit(self._key, self._gen, result, error)
+
+
+class DataService(QObject):
+    busy_changed = Signal(str, bool)          # clave, ocupado
+    _done = Signal(str, int, object, str)     # clave, generación, resultado, error (desde el pool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(MAX_THREADS)
+        self._gens: Dict[str, int] = {}
+        self._callbacks: Dict[str, tuple] = {}
+        # Conexión encolada: el slot corre en el hilo de la UI
+        self._done.connect(self._on_done)
+
+    def request(self, key: str, fn: Callable[..., Any], *args: Any,
+                on_result: Callable[[Any], None] | None = None,
+                on_error: Callable[[str], None] | None = None) -> int:
+        """Corre fn(*args) en segundo plano; reemplaza al pedido anterior de 'key'."""
+        gen = self._gens.get(key, 0) + 1
+        self._gens[key] = gen
+        was_busy = key in self._callbacks
+        self._callbacks[key] = (gen, on_result, on_error)
+        self._pool.start(_Load(self, key, gen, fn, args))
+        if not was_busy:
+            self.busy_changed.emit(key, True)
+        return gen
+
+    def cancel(self, key: str) -> None:
+        """Descarta el pedido en curso de 'key' (si ya está corriendo, se ignora su resultado)."""
+        self._gens[key] = self._gens.get(key, 0) + 1
+        if self._callbacks.pop(key, None) is not None:
+            self.busy_changed.emit(key, False)
+
+    def is_current(self, key: str, gen: int) -> bool:
+        return self._gens.get(key) == gen
+
+    def busy(self, key: str) -> bool:
+        return key in self._callbacks
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Espera a que terminen las lecturas en curso (al salir)."""
+        return self._pool.waitForDone(msecs)
+
+    @Slot(str, int, object, str)
+    def _on_done(self, key: str, gen: int, result: Any, error: str) -> None:
+        pending = self._callbacks.get(key)
+        if pending is None or pending[0] != gen:
+            return  # pedido viejo o cancelado
+        del self._callbacks[key]
+        _, on_result, on_error = pending
+        self.busy_changed.emit(key, False)
+        callback, arg = (on_error, error) if error else (on_result, result)
+        if callback is not None:
+            try:
+                callback(arg)
+            except RuntimeError:
+                pass  # la página que pidió los datos ya no existe
+
+
+_SERVICE: DataService | None = None
+
+def data_service() -> DataService:
+    """Instancia única, creada en el hilo de la UI."""
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = DataService()
+    return _SERVICE
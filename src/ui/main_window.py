@@ -1,5 +1,5 @@
-from PySide6.QtWidgets import QMainWindow, QWidget, QStackedWidget, QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSizePolicy
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QStackedWidget, QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSizePolicy
+from PySide6.QtCore import Qt, QTimer, QEvent
 from .pages.dashboard import DashboardPage
 from .pages.clientes.clientes_main import ClientesMain
 from .pages.proveedores.proveedores_main import ProveedoresMain
@@ -8,6 +8,10 @@ from .pages.facturacion import FacturacionMain
 from .pages.reportes import ReportesPage
 from .pages.configuracion import ConfiguracionPage
 from src.ui.notify import NotifyPopup
+from src.ui.write_queue import write_queue
+from src.ui.data_service import data_service
+from src.data import settings as app_settings
+from src.data import metrics
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -73,6 +77,48 @@ class MainWindow(QMainWindow):
         self._toast_timer = QTimer(self); self._toast_timer.setSingleShot(True)
         self._toast_timer.timeout.connect(lambda: self._toast.setVisible(False))
 
+        # Journals: se vuelcan al Excel cuando no hay actividad por un rato y al salir
+        self._idle_timer = QTimer(self); self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(getattr(app_settings, "JOURNAL_IDLE_MS", 60000))
+        self._idle_timer.timeout.connect(self._compact_journals)
+        write_queue().failed.connect(self._on_write_failed)
+        write_queue().saved.connect(self._on_write_saved)
+        self._compact_warned = False  # un solo aviso mientras el volcado siga fallando
+        QApplication.instance().installEventFilter(self)
+        self._idle_timer.start()
+
+    # Actividad del usuario: reinicia la cuenta para compactar
+    def eventFilter(self, obj, ev):
+        if ev.type() in (QEvent.KeyPress, QEvent.MouseButtonPress, QEvent.Wheel):
+            self._idle_timer.start()
+        return super().eventFilter(obj, ev)
+
+    def _compact_journals(self):
+        # En el hilo de escritura, para no congelar la ventana
+        write_queue().compact()
+        if metrics.enabled():
+            metrics.dump()
+
+    def _on_write_failed(self, tabla: str, msg: str):
+        if tabla == "*" and not self._compact_warned:
+            # Los cambios siguen a salvo en el journal; se reintenta más tarde
+            self._compact_warned = True
+            self.notify(f"No se pudieron volcar los cambios a los Excel: {msg}\n"
+                        "Quedan guardados y se reintenta más tarde.", "warning")
+
+    def _on_write_saved(self, tabla: str, _result):
+        if tabla == "*":
+            self._compact_warned = False
+
+    def closeEvent(self, ev):
+        self._idle_timer.stop()
+        # Graba lo que quede en la cola y vuelca los journals antes de salir
+        queue = write_queue()
+        queue.compact()
+        queue.close()
+        data_service().wait(2000)  # búsquedas que hayan quedado corriendo
+        super().closeEvent(ev)
+
     # Navegación interna
     def navigate_to(self, widget: QWidget):
         self._page_history.append(self.stack.currentWidget())
@@ -2,7 +2,8 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QFormLayout, QLineEdit,
     QPushButton, QHBoxLayout, QComboBox
 )
-from src.data import util_excel as ux
+from src.data import storage as ux
+from src.ui.write_queue import write_queue
 
 class ClienteEditar(QWidget):
     """
@@ -89,8 +90,13 @@ class ClienteEditar(QWidget):
             "direccion": self.direccion.text().strip(),
             "estado": self.estado.currentText(),
         }
-        cid = ux.save_cliente(payload)
-        self._id = cid
-        self._notify("Guardado correctamente.")
-        self._on_saved(cid)
+        # Se graba en segundo plano; al terminar aviso y refresco a quien abrió el editor
+        notify, on_saved = self._notify, self._on_saved
+
+        def saved(cid):
+            notify("Guardado correctamente.")
+            on_saved(cid)
+
+        write_queue().save("clientes", payload, on_saved=saved,
+                           on_error=lambda msg: notify(f"No se pudo guardar el cliente: {msg}"))
         self._navigate_back()
@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QLineEdit, QPushButton, QHBoxLayout, QMessageBox, QLabel
-from src.data import util_excel as ux
+from src.data import storage as ux
 
 class ClientePerfil(QDialog):
     def __init__(self, parent=None, cliente_id: int | None = None):
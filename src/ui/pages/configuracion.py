@@ -1,5 +1,7 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFormLayout, QLineEdit, QPushButton
-from src.data.settings import CLIENTES_XLSX, VEHICULOS_XLSX
+from src.data.settings import CLIENTES_XLSX, VEHICULOS_XLSX, SQLITE_PATH
+from src.data import storage
+from src.data.util_excel import xlsx_engine
 
 class ConfiguracionPage(QWidget):
     def __init__(self, parent=None):
@@ -17,11 +19,21 @@ class ConfiguracionPage(QWidget):
         self.path_vehiculos.setReadOnly(True)
         form.addRow("Ruta clientes.xlsx:", self.path_clientes)
         form.addRow("Ruta vehiculos.xlsx:", self.path_vehiculos)
+        self.storage = QLineEdit(
+            f"SQLite ({SQLITE_PATH})" if storage.BACKEND_NAME == "sqlite" else "Excel"
+        )
+        self.storage.setReadOnly(True)
+        form.addRow("Almacenamiento:", self.storage)
+        self.engine = QLineEdit(xlsx_engine())
+        self.engine.setReadOnly(True)
+        form.addRow("Lector de Excel:", self.engine)
         lay.addLayout(form)
 
         self.btn = QPushButton("Guardar cambios")
         self.btn.setEnabled(False)
         lay.addWidget(self.btn)
 
-        hint = QLabel("Por ahora las rutas son fijas. Más adelante podremos editarlas y usar MySQL en la nube.", self)
+        hint = QLabel("Por ahora las rutas son fijas. Para usar SQLite: APP_STORAGE=sqlite y "
+                      "python -m src.data.storage_sqlite import. El lector de Excel se elige con "
+                      "APP_XLSX_ENGINE (auto, calamine u openpyxl).", self)
         lay.addWidget(hint)
@@ -14,8 +14,9 @@ try:
 except Exception:
     _HAS_MPL = False
 
-from src.data import util_excel as ux
+from src.data import storage as ux
 from src.data.settings import DATA_DIR
+from src.data.util_excel import xlsx_engine
 
 
 UPCOMING_DAYS = 7  # ventana de "próximos a vencer"
@@ -351,7 +352,7 @@ class DashboardPage(QWidget):
         if not path.exists():
             return pd.DataFrame()
         try:
-            df = pd.read_excel(path)
+            df = pd.read_excel(path, engine=xlsx_engine())
             for c in ["id","cliente_id","vehiculo_id","estado","total","subtotal","impuestos","fecha","vencimiento"]:
                 if c not in df.columns:
                     df[c] = None
@@ -366,7 +367,7 @@ class DashboardPage(QWidget):
         if not path.exists():
             return pd.DataFrame()
         try:
-            df = pd.read_excel(path)
+            df = pd.read_excel(path, engine=xlsx_engine())
             for c in ["id","factura_id","numero","vencimiento","monto","estado"]:
                 if c not in df.columns:
                     df[c] = None
@@ -3,10 +3,11 @@ from PySide6.QtWidgets import (
     QLineEdit, QPushButton, QComboBox, QMessageBox, QCompleter,
     QListView, QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, QRect, QSize
+from PySide6.QtCore import Qt, QRect, QSize, QTimer
 from PySide6.QtGui import QFont, QFontMetrics, QPainter, QColor
-from src.data import util_excel as ux
+from src.data import storage as ux
 from src.data import settings as app_settings
+from src.ui.write_queue import write_queue
 import unicodedata
 import pandas as pd
 import math
@@ -15,6 +16,8 @@ from datetime import date, timedelta
 
 LABEL_STRETCH = 1
 FIELD_STRETCH = 3
+APPEND_RETRY_MS = 5000  # reintento de grabar una factura que ya tiene CAE
+APPEND_RETRIES = 5      # después de estos intentos se avisa para registrarla a mano
 
 
 def normalizar(texto: str) -> str:
@@ -545,48 +548,8 @@ class FacturacionMain(QWidget):
                 return
 
             pv = app_settings.PUNTO_VENTA
-            numero = ux.get_ultimo_numero_factura(pv)
-
-            payload = {
-                "numero": numero,
-                "fecha": date.today().isoformat(),
-                "tipo": self.f_tipo.currentText(),
-                "pago": self.f_pago.currentText(),
-                "punto_venta": pv,
-                "cliente": {
-                    "nombre": self.f_nombre.text().strip(),
-                    "apellido": self.f_apellido.text().strip(),
-                    "cuit_dni": self.f_cuit.text().strip(),
-                    "direccion": self.f_direccion.text().strip(),
-                },
-                "detalle": {
-                    "vehiculo": f"{self.f_marca.text().strip()} {self.f_modelo.text().strip()}".strip(),
-                    "patente": self.f_patente.text().strip(),
-                    "nro_cuadro": self.f_nro_cuadro.text().strip(),
-                    "precio": subtotal,
-                },
-                "totales": {"subtotal": subtotal, "iva": iva, "total": total},
-            }
-
-            resp = self._arca_emit(payload)
-            cae = resp.get("cae", "---")
-            venc = resp.get("vencimiento", "---")
-
-            ux.append_factura({
-                "numero": numero,
-                "fecha": payload["fecha"],
-                "cliente": f"{payload['cliente']['nombre']} {payload['cliente']['apellido']}".strip(),
-                "cuit_dni_cliente": payload["cliente"]["cuit_dni"],
-                "vehiculo": payload["detalle"]["vehiculo"],
-                "patente": payload["detalle"]["patente"],
-                "tipo": payload["tipo"],
-                "pago": payload["pago"],
-                "subtotal": subtotal,
-                "iva": iva,
-                "total": total,
-                "cae": cae,
-                "vto_cae": venc,
-            })
+            numero = ux.reserve_numero_factura(pv)
+            cae, venc = self._emitir_con_numero(numero, pv, subtotal, iva, total)
 
             self.lbl_cae.setText(f"CAE: {cae}")
             self.lbl_venc.setText(f"Vencimiento: {venc}")
@@ -595,6 +558,103 @@ class FacturacionMain(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error al emitir", f"Ocurrió un error al emitir la factura:\n{e}")
 
+    def _emitir_con_numero(self, numero: str, pv: str, subtotal: float, iva: float, total: float):
+        """
+        Pide el CAE y encola el registro de la factura (se graba en segundo plano;
+        append_factura confirma el número reservado). El número se libera solo si
+        ARCA no lo autorizó: con CAE ya es un comprobante emitido y se marca
+        autorizado en la secuencia (no vence ni se reutiliza). Si la grabación
+        falla APPEND_RETRIES veces se avisa para cargarla a mano.
+        """
+        try:
+            payload = self._payload(numero, pv, subtotal, iva, total)
+            resp = self._arca_emit(payload)
+        except Exception:
+            # Sin CAE el número no se usó: vuelve a la secuencia para la próxima emisión
+            ux.release_numero_factura(numero)
+            raise
+        cae = resp.get("cae", "---")
+        venc = resp.get("vencimiento", "---")
+
+        notify = self._notify
+        try:
+            ux.authorize_numero_factura(numero)
+        except Exception as e:
+            # La factura se encola igual: al grabarse confirma el número
+            notify(f"No se pudo marcar autorizada la factura {numero} en la numeración: {e}")
+        factura = {
+            "numero": numero,
+            "fecha": payload["fecha"],
+            "cliente": f"{payload['cliente']['nombre']} {payload['cliente']['apellido']}".strip(),
+            "cuit_dni_cliente": payload["cliente"]["cuit_dni"],
+            "vehiculo": payload["detalle"]["vehiculo"],
+            "patente": payload["detalle"]["patente"],
+            "tipo": payload["tipo"],
+            "pago": payload["pago"],
+            "subtotal": subtotal,
+            "iva": iva,
+            "total": total,
+            "cae": cae,
+            "vto_cae": venc,
+        }
+
+        intentos = 0
+
+        def enqueue():
+            try:
+                write_queue().append_factura(factura, on_error=failed)
+            except RuntimeError:
+                # La cola ya cerró (la app se está cerrando): se graba acá mismo
+                try:
+                    ux.append_factura(factura)
+                except Exception as e:
+                    unrecorded(str(e))
+
+        def failed(msg: str):
+            # Con CAE el número ya está emitido (autorizado en la secuencia): no se
+            # libera, se reintenta la grabación (append_factura no duplica si el
+            # intento anterior llegó a escribir)
+            nonlocal intentos
+            intentos += 1
+            if intentos >= APPEND_RETRIES:
+                unrecorded(msg)
+                return
+            QTimer.singleShot(APPEND_RETRY_MS, enqueue)
+            notify(f"No se pudo registrar la factura {numero}: {msg}. Se reintenta en {APPEND_RETRY_MS // 1000} s.")
+
+        def unrecorded(msg: str):
+            # Sin padre: la página puede ya no existir cuando llega el error
+            QMessageBox.critical(
+                None, "Factura sin registrar",
+                f"La factura {numero} tiene CAE {cae} (vto. {venc}) pero no se pudo registrar:\n{msg}\n\n"
+                "El número queda tomado en la numeración. Cargá la factura a mano.",
+            )
+
+        enqueue()
+        return cae, venc
+
+    def _payload(self, numero: str, pv: str, subtotal: float, iva: float, total: float) -> dict:
+        return {
+            "numero": numero,
+            "fecha": date.today().isoformat(),
+            "tipo": self.f_tipo.currentText(),
+            "pago": self.f_pago.currentText(),
+            "punto_venta": pv,
+            "cliente": {
+                "nombre": self.f_nombre.text().strip(),
+                "apellido": self.f_apellido.text().strip(),
+                "cuit_dni": self.f_cuit.text().strip(),
+                "direccion": self.f_direccion.text().strip(),
+            },
+            "detalle": {
+                "vehiculo": f"{self.f_marca.text().strip()} {self.f_modelo.text().strip()}".strip(),
+                "patente": self.f_patente.text().strip(),
+                "nro_cuadro": self.f_nro_cuadro.text().strip(),
+                "precio": subtotal,
+            },
+            "totales": {"subtotal": subtotal, "iva": iva, "total": total},
+        }
+
     def _arca_emit(self, payload: dict) -> dict:
         """Simulación de integración con ARCA. En producción: reemplazar por cliente homologado."""
         if not payload.get("cliente", {}).get("cuit_dni"):
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFormLayout, QPushButton, QHBoxLayout, QGroupBox
 from PySide6.QtCore import Qt
-from src.data import util_excel as ux
+from src.data import storage as ux
 from .proveedores_editar import ProveedorEditar
 
 
@@ -1,6 +1,7 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QFormLayout, QLineEdit, QPushButton, QHBoxLayout, QComboBox
-from src.data import util_excel as ux
+from src.data import storage as ux
 from src.ui.notify import NotifyPopup
+from src.ui.write_queue import write_queue
 
 class ProveedorEditar(QWidget):
     def __init__(self, parent=None, proveedor_id: int | None = None, notify=None, navigate=None, navigate_back=None, on_saved=None, back_steps_after_delete:int=2):
@@ -102,9 +103,14 @@ class ProveedorEditar(QWidget):
             "estado": self.cmb_estado.currentText().strip() if self._id is not None else "Activo",
         }
 
-        pid = ux.upsert_proveedor(payload)
+        # Se graba en segundo plano; al terminar aviso y refresco a quien abrió el editor
+        notify, on_saved = self._notify, self._on_saved
 
-        self._notify("Proveedor guardado correctamente", "success")
-        if self._on_saved:
-            self._on_saved(pid)
+        def saved(pid):
+            notify("Proveedor guardado correctamente", "success")
+            if on_saved:
+                on_saved(pid)
+
+        write_queue().save("proveedores", payload, on_saved=saved,
+                           on_error=lambda msg: notify(f"No se pudo guardar el proveedor: {msg}", "error"))
         self._navigate_back()
@@ -4,11 +4,13 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 import pandas as pd
-from src.data import util_excel as ux
+from src.data import storage as ux
 from .proveedores_tabla import ProveedoresTabla
 from .proveedores_detalle import ProveedorDetalle
 from .proveedores_editar import ProveedorEditar
 from src.ui.widgets.paginator import TablePaginator  # ← Importamos el paginador
+from src.ui.data_service import data_service
+from src.ui.widgets.live_search import LiveSearch
 
 LABEL_STRETCH = 1
 FIELD_STRETCH = 3
@@ -21,6 +23,7 @@ class ProveedoresMain(QWidget):
         self._navigate_back = navigate_back or (lambda: None)
         self._filter_cols = None
         self._first_show = True
+        self._last_filters = None
         lay = QVBoxLayout(self)
 
         # --- Filtros ---
@@ -74,6 +77,12 @@ class ProveedoresMain(QWidget):
         self.btn_agregar.clicked.connect(self.open_new)
         self.tabla.perfil_clicked.connect(self.on_click_perfil)
 
+        # Búsqueda mientras se escribe (Buscar sigue buscando al instante)
+        self.live_search = LiveSearch(
+            [self.f_nombre, self.f_cuit, self.f_email, self.f_estado],
+            self._search_live, parent=self,
+        )
+
     def showEvent(self, event):
         super().showEvent(event)
         empty_df = pd.DataFrame(columns=[
@@ -128,9 +137,7 @@ class ProveedoresMain(QWidget):
         self.f_estado.setCurrentText("Activo")
         self._notify("Filtros limpiados.")
 
-    def load_data(self):
-        if self._first_show:
-            self._first_show = False
+    def _filters(self) -> dict:
         estado_value = self.f_estado.currentText()
         filters = {
             "nombre": self.f_nombre.text().strip(),
@@ -138,9 +145,36 @@ class ProveedoresMain(QWidget):
             "email":  self.f_email.text().strip(),
             "estado": None if estado_value == "Todos" else estado_value,
         }
-        filters = {k: v for k, v in filters.items() if v}
-        df = ux.load_proveedores(filters)
-        self.paginator.set_dataframe(df)  # ← usamos el paginador
+        return {k: v for k, v in filters.items() if v}
+
+    def load_data(self):
+        self.live_search.cancel()
+        self._search(self._filters(), busy=True)
+
+    def _search_live(self):
+        # Mientras se escribe: sin "Buscando..." y solo si los filtros cambiaron
+        filters = self._filters()
+        if filters != self._last_filters:
+            self._search(filters, busy=False)
+
+    def _search(self, filters: dict, busy: bool):
+        if self._first_show:
+            self._first_show = False
+        self._last_filters = filters
+        # La búsqueda corre en segundo plano; si se vuelve a buscar antes de que
+        # termine, el resultado viejo se descarta
+        if busy:
+            self.paginator.set_busy(True)
+        data_service().request("proveedores", ux.load_proveedores, filters,
+                               on_result=self._on_data, on_error=self._on_load_error)
+
+    def _on_data(self, df):
+        self.paginator.set_busy(False)
+        self.paginator.set_dataframe(df)
+
+    def _on_load_error(self, msg: str):
+        self.paginator.set_busy(False)
+        self._notify(f"No se pudieron cargar los proveedores: {msg}")
 
     def on_click_perfil(self, row: int):
         pid = self.tabla.model.get_row_id(row)
@@ -1,10 +1,10 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableView, QAbstractItemView, QPushButton,
-    QHBoxLayout, QHeaderView
+    QWidget, QVBoxLayout, QTableView, QAbstractItemView, QHeaderView
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal
+from src.ui.widgets.action_delegate import ActionButtonDelegate
 from .proveedores_model import ProveedoresModel
-from src.data import util_excel as ux
+from src.data import storage as ux
 
 
 class ProveedoresTabla(QWidget):
@@ -17,6 +17,11 @@ class ProveedoresTabla(QWidget):
 
         self.view = QTableView(self)
         self.view.setModel(self.model)
+        # Columna "Perfil": un delegate pinta el botón en todas las filas
+        self.perfil_delegate = ActionButtonDelegate(
+            self.view, self.model.column_index("perfil"), "🔍", "Ver perfil"
+        )
+        self.perfil_delegate.clicked.connect(self.perfil_clicked.emit)
         self.view.setSelectionBehavior(QTableView.SelectRows)
         self.view.setSelectionMode(QTableView.SingleSelection)
         self.view.setAlternatingRowColors(True)
@@ -41,22 +46,8 @@ class ProveedoresTabla(QWidget):
     def set_dataframe(self, df):
         self.model.setDataFrame(df)
         self._configure_columns()
-        self._install_perfil_buttons()
 
     # ---------- Helpers de UI ----------
-    def _make_perfil_button(self):
-        btn = QPushButton("🔍", self.view)
-        btn.setCursor(Qt.PointingHandCursor)
-        btn.setToolTip("Ver perfil")
-        btn.setFixedSize(30, 30)
-        btn.setStyleSheet("QPushButton { padding: 0; font-size: 14px; border-radius: 6px; }")
-        btn.setFocusPolicy(Qt.NoFocus)
-        return btn
-
-    def _perfil_col_width(self) -> int:
-        tmp_btn = self._make_perfil_button()
-        return tmp_btn.sizeHint().width() + 12
-
     def _configure_columns(self):
         header: QHeaderView = self.view.horizontalHeader()
         header.setStretchLastSection(False)
@@ -65,25 +56,8 @@ class ProveedoresTabla(QWidget):
         for c in range(self.model.columnCount()):
             if c == last_col:
                 header.setSectionResizeMode(c, QHeaderView.Fixed)
-                self.view.setColumnWidth(c, max(42, self._perfil_col_width()))
+                self.view.setColumnWidth(c, max(42, self.perfil_delegate.column_width()))
             else:
                 header.setSectionResizeMode(c, QHeaderView.Stretch)
         vh = self.view.verticalHeader()
         vh.setDefaultSectionSize(max(vh.defaultSectionSize(), 36))
-
-    def _install_perfil_buttons(self):
-        last_col = self.model.columnCount() - 1
-        if last_col < 0 or self.model.rowCount() == 0:
-            return
-        for row in range(self.model.rowCount()):
-            index = self.model.index(row, last_col)
-            container = QWidget(self.view)
-            hbox = QHBoxLayout(container)
-            hbox.setContentsMargins(6, 2, 6, 2)
-            hbox.setSpacing(0)
-            btn = self._make_perfil_button()
-            btn.clicked.connect(lambda _, r=row: self.perfil_clicked.emit(r))
-            hbox.addStretch(1)
-            hbox.addWidget(btn)
-            hbox.addStretch(1)
-            self.view.setIndexWidget(index, container)
@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QGroupBox
 )
 from PySide6.QtCore import Qt
-from src.data import util_excel as ux
+from src.data import storage as ux
 from src.data.util_format import format_currency
 from .vehiculos_editar import VehiculoEditar
 
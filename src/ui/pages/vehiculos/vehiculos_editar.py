@@ -1,8 +1,9 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QLineEdit, QPushButton, QHBoxLayout
 )
-from src.data import util_excel as ux
+from src.data import storage as ux
 from src.ui.notify import NotifyPopup
+from src.ui.write_queue import write_queue
 
 
 class VehiculoEditar(QWidget):
@@ -104,9 +105,14 @@ class VehiculoEditar(QWidget):
             "estado": self.txt_estado.text().strip(),
         }
 
-        vid = ux.upsert_vehiculo(payload)
+        # Se graba en segundo plano; al terminar aviso y refresco a quien abrió el editor
+        notify, on_saved = self._notify, self._on_saved
 
-        self._notify("Vehículo guardado correctamente", "success")
-        if self._on_saved:
-            self._on_saved(vid)
+        def saved(vid):
+            notify("Vehículo guardado correctamente", "success")
+            if on_saved:
+                on_saved(vid)
+
+        write_queue().save("vehiculos", payload, on_saved=saved,
+                           on_error=lambda msg: notify(f"No se pudo guardar el vehículo: {msg}", "error"))
         self._navigate_back()
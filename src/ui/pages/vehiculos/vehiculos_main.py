@@ -1,13 +1,17 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QGridLayout, QLabel,
-    QLineEdit, QPushButton, QHBoxLayout, QWidget as _QWidget, QComboBox
+    QLineEdit, QPushButton, QHBoxLayout, QWidget as _QWidget, QComboBox,
+    QApplication, QFileDialog, QMessageBox, QProgressDialog
 )
 from PySide6.QtCore import Qt
-from src.data import util_excel as ux
+from src.data import storage as ux
+from src.data.remitos import importar_remito
 from .vehiculos_tabla import VehiculosTabla
 from .vehiculos_detalle import VehiculoDetalle
 from .vehiculos_editar import VehiculoEditar
 from src.ui.widgets.paginator import TablePaginator  # ← Importamos el paginador
+from src.ui.data_service import data_service
+from src.ui.widgets.live_search import LiveSearch
 import pandas as pd
 
 LABEL_STRETCH = 1
@@ -21,6 +25,7 @@ class VehiculosMain(QWidget):
         self._navigate_back = navigate_back or (lambda: None)
         self._filter_cols = None
         self._first_show = True
+        self._last_filters = None
         lay = QVBoxLayout(self)
 
         # --- Filtros ---
@@ -48,10 +53,12 @@ class VehiculosMain(QWidget):
         self._buttons_bar = QHBoxLayout()
         self.btn_buscar  = QPushButton("Buscar");  self.btn_buscar.setObjectName("Primary")
         self.btn_limpiar = QPushButton("Limpiar")
+        self.btn_importar = QPushButton("Importar remito")
         self.btn_agregar = QPushButton("Agregar vehículo"); self.btn_agregar.setObjectName("Primary")
         self._buttons_bar.addWidget(self.btn_buscar)
         self._buttons_bar.addWidget(self.btn_limpiar)
         self._buttons_bar.addStretch(1)
+        self._buttons_bar.addWidget(self.btn_importar)
         self._buttons_bar.addWidget(self.btn_agregar)
 
         self._btn_container = _QWidget(); self._btn_container.setObjectName("btnContainer")
@@ -72,8 +79,15 @@ class VehiculosMain(QWidget):
         self.btn_buscar.clicked.connect(self.load_data)
         self.btn_limpiar.clicked.connect(self.clear_filters)
         self.btn_agregar.clicked.connect(self.open_new)
+        self.btn_importar.clicked.connect(self.import_remito)
         self.tabla.perfil_clicked.connect(self.on_click_perfil)
 
+        # Búsqueda mientras se escribe (Buscar sigue buscando al instante)
+        self.live_search = LiveSearch(
+            [self.f_marca, self.f_modelo, self.f_anio, self.f_cuadro, self.f_motor, self.f_estado],
+            self._search_live, parent=self,
+        )
+
     def showEvent(self, event):
         super().showEvent(event)
         empty_df = pd.DataFrame(columns=[
@@ -132,9 +146,7 @@ class VehiculosMain(QWidget):
         self.f_estado.setCurrentText("Todos")
         self._notify("Filtros limpiados.")
 
-    def load_data(self):
-        if self._first_show:
-            self._first_show = False
+    def _filters(self) -> dict:
         filters = {
             "marca":       self.f_marca.text().strip(),
             "modelo":      self.f_modelo.text().strip(),
@@ -146,9 +158,36 @@ class VehiculosMain(QWidget):
         if filters["estado"] == "Todos":
             filters["estado"] = None
 
-        filters = {k: v for k, v in filters.items() if v}
-        df = ux.load_vehiculos(filters)
-        self.paginator.set_dataframe(df)  # ← ahora usamos el paginador
+        return {k: v for k, v in filters.items() if v}
+
+    def load_data(self):
+        self.live_search.cancel()
+        self._search(self._filters(), busy=True)
+
+    def _search_live(self):
+        # Mientras se escribe: sin "Buscando..." y solo si los filtros cambiaron
+        filters = self._filters()
+        if filters != self._last_filters:
+            self._search(filters, busy=False)
+
+    def _search(self, filters: dict, busy: bool):
+        if self._first_show:
+            self._first_show = False
+        self._last_filters = filters
+        # La búsqueda corre en segundo plano; si se vuelve a buscar antes de que
+        # termine, el resultado viejo se descarta
+        if busy:
+            self.paginator.set_busy(True)
+        data_service().request("vehiculos", ux.load_vehiculos, filters,
+                               on_result=self._on_data, on_error=self._on_load_error)
+
+    def _on_data(self, df):
+        self.paginator.set_busy(False)
+        self.paginator.set_dataframe(df)
+
+    def _on_load_error(self, msg: str):
+        self.paginator.set_busy(False)
+        self._notify(f"No se pudieron cargar los vehículos: {msg}")
 
     def on_click_perfil(self, row: int):
         vid = self.tabla.model.get_row_id(row)
@@ -169,3 +208,48 @@ class VehiculosMain(QWidget):
 
     def _after_new_saved(self, vid: int):
         self.load_data()
+
+    # ---------- Importar remito de proveedor ----------
+    def import_remito(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Importar remito", "", "Remitos (*.xlsx *.csv);;Todos los archivos (*)"
+        )
+        if not path:
+            return
+
+        dlg = QProgressDialog("Importando remito...", "Cancelar", 0, 0, self)
+        dlg.setWindowTitle("Importar remito")
+        dlg.setWindowModality(Qt.WindowModal)
+        dlg.setMinimumDuration(0)
+        dlg.show()
+
+        def progress(done: int, total: int) -> bool:
+            if total:
+                dlg.setMaximum(total)
+                dlg.setValue(min(done, total))
+            dlg.setLabelText(f"Importando remito... {done} filas leídas")
+            QApplication.processEvents()
+            return not dlg.wasCanceled()
+
+        try:
+            res = importar_remito(path, batch_size=200, progress=progress)
+        except Exception as e:
+            dlg.close()
+            QMessageBox.critical(self, "Importar remito", f"No se pudo importar el remito:\n{e}")
+            return
+        dlg.close()
+
+        resumen = (
+            f"Filas leídas: {res['leidas']}\n"
+            f"Vehículos agregados: {res['altas']}\n"
+            f"Ya existentes (cuadro/motor): {res['duplicadas']}\n"
+            f"Con errores: {len(res['errores'])}"
+        )
+        if res["errores"]:
+            detalle = "\n".join(f"Fila {linea}: {motivo}" for linea, motivo in res["errores"][:10])
+            resumen += f"\n\n{detalle}"
+        if res["cancelado"]:
+            resumen = "Importación cancelada.\n\n" + resumen
+        QMessageBox.information(self, "Importar remito", resumen)
+        self._notify(f"Remito importado: {res['altas']} vehículos nuevos.")
+        self.load_data()
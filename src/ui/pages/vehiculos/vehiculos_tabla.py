@@ -1,8 +1,8 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableView, QAbstractItemView, QPushButton,
-    QHBoxLayout, QHeaderView
+    QWidget, QVBoxLayout, QTableView, QAbstractItemView, QHeaderView
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal
+from src.ui.widgets.action_delegate import ActionButtonDelegate
 from .vehiculos_model import VehiculosModel
 
 class VehiculosTabla(QWidget):
@@ -14,6 +14,11 @@ class VehiculosTabla(QWidget):
 
         self.view = QTableView(self)
         self.view.setModel(self.model)
+        # Columna "Perfil": un delegate pinta el botón en todas las filas
+        self.perfil_delegate = ActionButtonDelegate(
+            self.view, self.model.column_index("perfil"), "🔍", "Ver perfil"
+        )
+        self.perfil_delegate.clicked.connect(self.perfil_clicked.emit)
         self.view.setSelectionBehavior(QTableView.SelectRows)
         self.view.setSelectionMode(QTableView.SingleSelection)
         self.view.setAlternatingRowColors(True)
@@ -26,22 +31,8 @@ class VehiculosTabla(QWidget):
     def set_dataframe(self, df):
         self.model.setDataFrame(df)
         self._configure_columns()
-        self._install_perfil_buttons()
 
     # Helpers
-    def _make_perfil_button(self):
-        btn = QPushButton("🔍", self.view)
-        btn.setCursor(Qt.PointingHandCursor)
-        btn.setToolTip("Ver perfil")
-        btn.setFixedSize(30, 30)
-        btn.setStyleSheet("QPushButton { padding: 0; font-size: 14px; border-radius: 6px; }")
-        btn.setFocusPolicy(Qt.NoFocus)
-        return btn
-
-    def _perfil_col_width(self) -> int:
-        tmp = self._make_perfil_button()
-        return tmp.sizeHint().width() + 12
-
     def _configure_columns(self):
         header: QHeaderView = self.view.horizontalHeader()
         header.setStretchLastSection(False)
@@ -53,7 +44,7 @@ class VehiculosTabla(QWidget):
         for c in range(self.model.columnCount()):
             if c == col_perfil:
                 header.setSectionResizeMode(c, QHeaderView.Fixed)
-                self.view.setColumnWidth(c, max(42, self._perfil_col_width()))
+                self.view.setColumnWidth(c, max(42, self.perfil_delegate.column_width()))
             elif c == col_id and col_id >= 0:
                 # ocultar ID interno
                 self.view.setColumnHidden(c, True)
@@ -62,18 +53,3 @@ class VehiculosTabla(QWidget):
 
         vh = self.view.verticalHeader()
         vh.setDefaultSectionSize(max(vh.defaultSectionSize(), 36))
-
-    def _install_perfil_buttons(self):
-        col_perfil = self.model.column_index("perfil")
-        if col_perfil < 0 or self.model.rowCount() == 0:
-            return
-        for row in range(self.model.rowCount()):
-            index = self.model.index(row, col_perfil)
-            container = QWidget(self.view)
-            hbox = QHBoxLayout(container)
-            hbox.setContentsMargins(6, 2, 6, 2)
-            hbox.setSpacing(0)
-            btn = self._make_perfil_button()
-            btn.clicked.connect(lambda _, r=row: self.perfil_clicked.emit(r))
-            hbox.addStretch(1); hbox.addWidget(btn); hbox.addStretch(1)
-            self.view.setIndexWidget(index, container)
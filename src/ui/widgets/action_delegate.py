@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QEvent, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem, QToolTip
+
+from src.ui.theme import PALETTE
+
+# ============================================================================
+# Columna de acción pintada por delegate (botón "🔍 Perfil" de las tablas)
+# ============================================================================
+# Un solo delegate por tabla pinta el botón en cada celda de la columna; no hay
+# un QWidget por fila. Hover / presionado se siguen con un filtro de eventos
+# sobre el viewport y el click se resuelve por posición (indexAt + rect del
+# botón), así que cambiar de página o hacer fetchMore no crea nada.
+#
+#     self.perfil_delegate = ActionButtonDelegate(self.view, col, "🔍", "Ver perfil")
+#     self.perfil_delegate.clicked.connect(self.perfil_clicked.emit)
+
+BUTTON_SIZE = 30
+RADIUS = 6
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    clicked = Signal(int)  # fila visible
+
+    def __init__(self, view, column: int, text: str = "🔍", tooltip: str = "", size: int = BUTTON_SIZE):
+        super().__init__(view)
+        self._view = view
+        self._column = column
+        self._text = text
+        self._tooltip = tooltip
+        self._size = size
+        self._hover_row = -1
+        self._pressed_row = -1
+
+        view.setItemDelegateForColumn(column, self)
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def column_width(self) -> int:
+        return self._size + 12
+
+    # ---------- Geometría ----------
+    def button_rect(self, cell: QRect) -> QRect:
+        side = max(0, min(self._size, cell.width() - 4, cell.height() - 4))
+        rect = QRect(0, 0, side, side)
+        rect.moveCenter(cell.center())
+        return rect
+
+    def _hit(self, pos) -> int:
+        """Fila cuyo botón está bajo 'pos' (coordenadas del viewport), o -1."""
+        index = self._view.indexAt(pos)
+        if not index.isValid() or index.column() != self._column:
+            return -1
+        return index.row() if self.button_rect(self._view.visualRect(index)).contains(pos) else -1
+
+    def _repaint(self, row: int) -> None:
+        model = self._view.model()
+        if row < 0 or model is None or row >= model.rowCount():
+            return
+        self._view.viewport().update(self._view.visualRect(model.index(row, self._column)))
+
+    def _set_hover(self, row: int) -> None:
+        if row == self._hover_row:
+            return
+        old, self._hover_row = self._hover_row, row
+        self._repaint(old)
+        self._repaint(row)
+        if row >= 0:
+            self._view.viewport().setCursor(Qt.PointingHandCursor)
+        else:
+            self._view.viewport().unsetCursor()
+
+    # ---------- Eventos ----------
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if kind == QEvent.Leave:
+            self._set_hover(-1)
+            return False
+        if kind not in (QEvent.MouseMove, QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            return False
+
+        row = self._hit(event.position().toPoint())
+        if kind == QEvent.MouseMove:
+            self._set_hover(row)
+            return False
+        if event.button() != Qt.LeftButton:
+            return False
+        if kind == QEvent.MouseButtonPress and row >= 0:
+            self._pressed_row = row
+            self._repaint(row)
+            return True
+        if kind == QEvent.MouseButtonRelease and self._pressed_row >= 0:
+            pressed, self._pressed_row = self._pressed_row, -1
+            self._repaint(pressed)
+            # Igual que un botón: cuenta solo si se suelta sobre el mismo botón
+            if row == pressed:
+                self.clicked.emit(row)
+            return True
+        return kind == QEvent.MouseButtonDblClick and row >= 0
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip and self._tooltip and self.button_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), self._tooltip, view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+    # ---------- Pintado ----------
+    def sizeHint(self, option, index):
+        return QSize(self.column_width(), self._size + 6)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else self._view.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        row = index.row()
+        if row == self._pressed_row:
+            background = PALETTE["border"]
+        elif row == self._hover_row:
+            background = PALETTE["bg"]
+        else:
+            background = PALETTE["white"]
+
+        rect = self.button_rect(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(PALETTE["border"])))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), RADIUS, RADIUS)
+        font = QFont(option.font)
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.setPen(QColor(PALETTE["ink"]))
+        painter.drawText(rect, Qt.AlignCenter, self._text)
+        painter.restore()
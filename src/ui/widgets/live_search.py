@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QComboBox, QLineEdit
+
+# ============================================================================
+# Búsqueda mientras se escribe
+# ============================================================================
+# Junta los cambios de los campos de filtro y llama a la búsqueda una sola vez
+# cuando se deja de tipear DEBOUNCE_MS; los combos (estado) buscan enseguida.
+# Cada tecla sale barata por la capa de datos: la tabla está en memoria
+# (chequeada por versión) y si la consulta estrecha la anterior ("hon" ->
+# "hond") solo se vuelve a filtrar el resultado anterior.
+#
+#     self.live_search = LiveSearch([self.f_marca, self.f_estado], self._search_live, parent=self)
+#     self.live_search.cancel()   # el botón Buscar busca al instante
+
+DEBOUNCE_MS = 150
+
+class LiveSearch(QObject):
+    def __init__(self, fields: Iterable, on_search: Callable[[], None],
+                 delay_ms: int = DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self._on_search = on_search
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._fire)
+
+        for field in fields:
+            if isinstance(field, QLineEdit):
+                field.textChanged.connect(self.schedule)
+            elif isinstance(field, QComboBox):
+                field.currentIndexChanged.connect(self.now)
+
+    def schedule(self, *_):
+        """Reinicia la espera: la búsqueda sale DEBOUNCE_MS después de la última tecla."""
+        self._timer.start()
+
+    def now(self, *_):
+        self._timer.stop()
+        self._fire()
+
+    def cancel(self):
+        self._timer.stop()
+
+    def pending(self) -> bool:
+        return self._timer.isActive()
+
+    def _fire(self):
+        try:
+            self._on_search()
+        except RuntimeError:
+            pass  # la página ya no existe
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# ============================================================================
+# Modelo de tabla paginado / virtual
+# ============================================================================
+# Guarda el resultado completo una sola vez (sin copiarlo) y la vista ve una
+# ventana sobre él:
+#   - páginas: set_window(inicio, filas). Cambiar de página solo emite
+#     layoutChanged; si la ventana nueva tiene otra cantidad de filas (última
+#     página, otro tamaño de página) se agregan / quitan solo las del final.
+#   - scroll infinito: set_infinite(). La vista pide más filas con
+#     canFetchMore / fetchMore a medida que se baja.
+# Las subclases declaran BASE_COLS, HEADERS, RIGHT_ALIGNED, ALIASES y, si hace
+# falta, cómo se formatea cada columna (FORMATTERS).
+#
+# Los textos que se muestran se calculan una sola vez por resultado, en arrays
+# por columna: al pintar una celda por primera vez se formatea (vectorizado)
+# el bloque de TEXT_BLOCK filas que la contiene; después data() solo indexa.
+#
+# El orden lo decide quien maneja la tabla (TablePaginator): set_order() recibe
+# una permutación del resultado completo (sort_order) y la ventana se mueve
+# sobre ese orden.
+#
+#     model.setDataFrame(df)        # resultado nuevo: un solo reset
+#     model.set_window(20, 10)      # página 3 de a 10
+#     model.get_row_id(0)           # id de la primera fila visible
+
+FETCH_CHUNK = 100
+TEXT_BLOCK = 1024
+
+# Qt.DisplayRole y compañía se resuelven en cada acceso (varios µs); data() se
+# llama por celda y por rol, así que se guardan una vez
+_DISPLAY_ROLE = Qt.DisplayRole
+_ALIGN_ROLE = Qt.TextAlignmentRole
+
+# ---------- Formato de columnas (vectorizado) ----------
+def _numbers(s: pd.Series) -> np.ndarray:
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+def text_column(s: pd.Series) -> np.ndarray:
+    """Texto de cada celda; vacío para NaN / None / NA."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # Se formatean solo las categorías; el código -1 (nulo) cae en el "" del final
+        cats = np.asarray(s.cat.categories.astype(str), dtype=object)
+        return np.append(cats, "")[s.cat.codes.to_numpy()]
+    out = s.astype(str).to_numpy(dtype=object)
+    out[s.isna().to_numpy()] = ""
+    return out
+
+def int_column(s: pd.Series) -> np.ndarray:
+    """Enteros sin decimales ("2020", no "2020.0"); lo que no es número queda como texto."""
+    out = text_column(s)
+    vals = _numbers(s)
+    ok = np.isfinite(vals) & (np.abs(vals) < 2 ** 63)
+    if ok.any():
+        out[ok] = vals[ok].astype(np.int64).astype(str)
+    return out
+
+def currency_column(s: pd.Series) -> np.ndarray:
+    """Moneda "$ 1.234,56"; el texto que no es número sale con "$ " adelante (si no lo tenía)."""
+    out = text_column(s)
+    vals = _numbers(s)
+    ok = np.isfinite(vals)
+    texto = ~ok & (out != "")
+    if texto.any():
+        out[texto] = [t if t.startswith("$") else f"$ {t}" for t in out[texto]]
+    if ok.any():
+        cents = np.round(np.abs(vals[ok]) * 100).astype(np.int64)
+        enteros = pd.Series(cents // 100).astype(str).str.replace(r"\B(?=(\d{3})+(?!\d))", ".", regex=True)
+        decimales = pd.Series(cents % 100).astype(str).str.zfill(2)
+        signo = pd.Series(np.where(vals[ok] < 0, "-", ""))
+        out[ok] = ("$ " + signo + enteros + "," + decimales).to_numpy(dtype=object)
+    return out
+
+# ---------- Orden ----------
+def sort_order(s: pd.Series, descending: bool = False) -> np.ndarray:
+    """Permutación estable que ordena 's' entera; nulos y vacíos siempre al final."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # Las categorías no tienen por qué estar en orden alfabético (altas nuevas al
+        # final); el código -1 (nulo) cae en el "" agregado al final
+        codes = s.cat.codes.to_numpy().astype(np.int64)
+        cats = np.append(np.asarray(s.cat.categories.astype(str), dtype=object), "")
+        rank = np.empty(len(cats), dtype=np.int64)
+        rank[np.argsort(cats, kind="stable")] = np.arange(len(cats))
+        keys = rank[codes]
+        null = (cats == "")[codes]
+    elif pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype):
+        keys = s.to_numpy(dtype="float64", na_value=np.nan)
+        null = np.isnan(keys)
+    else:
+        try:
+            keys, uniques = pd.factorize(s, sort=True)
+        except TypeError:  # tipos mezclados: se compara como texto
+            keys, uniques = pd.factorize(s.astype(str), sort=True)
+        null = keys < 0
+        if len(uniques) and uniques[0] == "":
+            null |= keys == 0
+
+    idx = np.flatnonzero(~null)
+    k = keys[idx]
+    if descending:
+        # Orden estable al revés: empates en el orden original
+        order = idx[::-1][np.argsort(k[::-1], kind="stable")][::-1]
+    else:
+        order = idx[np.argsort(k, kind="stable")]
+    return np.concatenate([order, np.flatnonzero(null)])
+
+class PagedTableModel(QAbstractTableModel):
+    BASE_COLS: List[str] = []
+    HEADERS: Dict[str, str] = {}
+    RIGHT_ALIGNED: set = set()
+    ALIASES: Dict[str, str] = {}  # columna vieja -> columna base (p. ej. "cliente_id" -> "id")
+    FORMATTERS: Dict[str, Callable[[pd.Series], np.ndarray]] = {}  # columna -> formato (text_column por defecto)
+    ACTION_COL = "perfil"
+
+    def __init__(self, df: pd.DataFrame | None = None, parent=None):
+        super().__init__(parent)
+        self._columns = list(self.BASE_COLS) + [self.ACTION_COL]
+        self._align = [
+            int((Qt.AlignRight if c in self.RIGHT_ALIGNED else Qt.AlignLeft) | Qt.AlignVCenter)
+            for c in self._columns
+        ]
+        self._start = 0
+        self._count = 0
+        self._page_size: int | None = None  # None: todas las filas
+        self._infinite = False
+        self._order: np.ndarray | None = None  # permutación del resultado (None: orden original)
+        self._load(pd.DataFrame(columns=self.BASE_COLS) if df is None else df)
+        self._count = self._initial_count()
+
+    # ---------- Datos ----------
+    def _load(self, df: pd.DataFrame) -> None:
+        for old, new in self.ALIASES.items():
+            if old in df.columns and new not in df.columns:
+                df = df.rename(columns={old: new})
+        # No se copia: el DF es el resultado de la búsqueda y nadie más lo toca
+        self._df = df
+        self._col_pos = [df.columns.get_loc(c) if c in df.columns else -1 for c in self.BASE_COLS]
+        self._text: List[np.ndarray | None] = [None] * len(self._columns)
+
+    def _cell_text(self, c: int, at: int) -> str:
+        """Texto de la celda (posición 'at' en el orden actual, columna c); formatea su bloque si falta."""
+        arr = self._text[c]
+        if arr is None:
+            arr = self._text[c] = np.empty(len(self._df), dtype=object)
+        text = arr[at]
+        if text is None:
+            lo = at - at % TEXT_BLOCK
+            hi = min(lo + TEXT_BLOCK, len(self._df))
+            pos = self._col_pos[c]
+            if pos < 0:
+                arr[lo:hi] = ""
+            else:
+                rows = slice(lo, hi) if self._order is None else self._order[lo:hi]
+                fmt = self.FORMATTERS.get(self._columns[c], text_column)
+                arr[lo:hi] = fmt(self._df.iloc[rows, pos])
+            text = arr[at]
+        return text
+
+    def _initial_count(self) -> int:
+        total = len(self._df)
+        if self._infinite:
+            return min(FETCH_CHUNK, total)
+        return total if self._page_size is None else min(self._page_size, total)
+
+    def setDataFrame(self, df: pd.DataFrame):
+        """Resultado nuevo: se guarda entero y la ventana vuelve al principio."""
+        self.beginResetModel()
+        self._load(df)
+        self._order = None
+        self._start = 0
+        self._count = self._initial_count()
+        self.endResetModel()
+
+    def dataframe(self) -> pd.DataFrame:
+        return self._df
+
+    def total_rows(self) -> int:
+        return len(self._df)
+
+    def column_values(self, colname: str) -> pd.Series | None:
+        """Columna entera del resultado (sin orden ni ventana), o None si no vino."""
+        try:
+            pos = self._col_pos[self.BASE_COLS.index(colname)]
+        except ValueError:
+            return None
+        return None if pos < 0 else self._df.iloc[:, pos]
+
+    def set_order(self, order: np.ndarray | None) -> None:
+        """Orden de las filas: permutación del resultado completo (sort_order) o None para el original."""
+        self.layoutAboutToBeChanged.emit()
+        self._order = order
+        # Los textos están guardados por posición: con otro orden se rehacen a medida que se pintan
+        self._text = [None] * len(self._columns)
+        self.layoutChanged.emit()
+
+    # ---------- Ventana ----------
+    def set_window(self, start: int, size: int) -> None:
+        """Modo páginas: muestra las filas [start, start + size) del resultado."""
+        self._infinite = False
+        self._page_size = size
+        start = max(0, min(start, len(self._df)))
+        self._move(start, max(0, min(size, len(self._df) - start)))
+
+    def set_infinite(self) -> None:
+        """Modo scroll infinito: arranca con FETCH_CHUNK filas y crece con fetchMore."""
+        self._infinite = True
+        self._page_size = None
+        self._move(0, min(FETCH_CHUNK, len(self._df)))
+
+    def _move(self, start: int, count: int) -> None:
+        old = self._count
+        if count < old:
+            self.beginRemoveRows(QModelIndex(), count, old - 1)
+            self._count = count
+            self.endRemoveRows()
+        if start != self._start:
+            self.layoutAboutToBeChanged.emit()
+            self._start = start
+            self.layoutChanged.emit()
+        if count > old:
+            self.beginInsertRows(QModelIndex(), old, count - 1)
+            self._count = count
+            self.endInsertRows()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._infinite and self._start + self._count < len(self._df)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        extra = min(FETCH_CHUNK, len(self._df) - self._start - self._count)
+        self.beginInsertRows(QModelIndex(), self._count, self._count + extra - 1)
+        self._count += extra
+        self.endInsertRows()
+
+    def source_row(self, row: int) -> int:
+        """Fila visible -> fila del resultado completo."""
+        at = self._start + row
+        return at if self._order is None else int(self._order[at])
+
+    # ---------- util ----------
+    def columns(self):
+        return list(self._columns)
+
+    def column_index(self, name: str) -> int:
+        try:
+            return self._columns.index(name)
+        except ValueError:
+            return -1
+
+    def value(self, row: int, colname: str) -> Any:
+        """Valor crudo de la fila visible 'row' ("" si la columna no vino)."""
+        try:
+            pos = self._col_pos[self.BASE_COLS.index(colname)]
+        except ValueError:
+            return None
+        if pos < 0:
+            return ""
+        return self._df.iat[self.source_row(row), pos]
+
+    def get_row_id(self, row: int) -> int | None:
+        try:
+            return int(self.value(row, "id"))
+        except Exception:
+            return None
+
+    # ---------- Qt ----------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        c = index.column()
+
+        if role == _DISPLAY_ROLE:
+            if self._columns[c] == self.ACTION_COL:
+                return ""
+            return self._cell_text(c, self._start + index.row())
+
+        if role == _ALIGN_ROLE:
+            return self._align[c]
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            colname = self._columns[section]
+            return self.HEADERS.get(colname, colname.capitalize())
+        return super().headerData(section, orientation, role)
@@ -1,8 +1,16 @@
 # src/ui/widgets/paginator.py
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QLabel, QComboBox
+from typing import Dict, Tuple
+
 from PySide6.QtCore import Qt
+import numpy as np
 import pandas as pd
 
+from src.ui.widgets.paged_model import sort_order
+
+# "Todos": scroll infinito, el modelo va sumando filas a medida que se baja
+ALL_ROWS = "Todos"
+
 
 class TablePaginator(QWidget):
     def __init__(self, table_widget, on_page_change=None, parent=None):
@@ -13,6 +21,15 @@ class TablePaginator(QWidget):
         self.df_full = pd.DataFrame()
         self.current_page = 1
         self.rows_per_page = 10
+        self._busy = False
+        self._infinite = False
+
+        # Orden sobre el resultado completo: (columna, descendente) o None.
+        # Las permutaciones se guardan por (versión del resultado, columna, orden),
+        # así cambiar de página o volver a un orden ya usado no reordena nada.
+        self._version = 0
+        self._sort: Tuple[str, bool] | None = None
+        self._orders: Dict[Tuple[int, str, bool], np.ndarray | None] = {}
 
         # --- Layout ---
         layout = QHBoxLayout(self)
@@ -21,9 +38,9 @@ class TablePaginator(QWidget):
 
         # --- Combo filas ---
         self.cmb_rows = QComboBox()
-        self.cmb_rows.addItems(["10", "25", "50"])
+        self.cmb_rows.addItems(["10", "25", "50", ALL_ROWS])
         self.cmb_rows.setCurrentText("10")
-        self.cmb_rows.setFixedWidth(70)
+        self.cmb_rows.setFixedWidth(80)
         self.cmb_rows.setFixedHeight(28)
         self.cmb_rows.setStyleSheet("""
             QComboBox {
@@ -77,50 +94,150 @@ class TablePaginator(QWidget):
         self.btn_next.clicked.connect(self.next_page)
         self.cmb_rows.currentIndexChanged.connect(self.change_rows_per_page)
 
-    def set_dataframe(self, df: pd.DataFrame):
-        if df is None or df.empty:
-            self.df_full = pd.DataFrame()
-            self.current_page = 1
-            self._update_table()
+        # El modelo arranca ya en modo páginas, así el primer resultado no se muestra entero
+        self.table.model.set_window(0, self.rows_per_page)
+
+        # Click en el encabezado: ascendente -> descendente -> orden original
+        view = getattr(self.table, "view", None)
+        if view is not None:
+            header = view.horizontalHeader()
+            header.setSectionsClickable(True)
+            header.setSortIndicatorShown(False)
+            header.sectionClicked.connect(self._on_header_clicked)
+
+    def set_busy(self, busy: bool):
+        """Estado "buscando": tabla y controles deshabilitados mientras llega el resultado."""
+        if busy == self._busy:
             return
-        self.df_full = df.reset_index(drop=True)
+        self._busy = busy
+        self.table.setEnabled(not busy)
+        self.cmb_rows.setEnabled(not busy)
+        if busy:
+            self.table.setCursor(Qt.BusyCursor)
+            self._info_text = self.lbl_info.text()
+            self.lbl_info.setText("Buscando...")
+            self.btn_prev.setEnabled(False)
+            self.btn_next.setEnabled(False)
+        else:
+            self.table.unsetCursor()
+            self.lbl_info.setText(self._info_text)
+            self._update_buttons()
+
+    def _total_pages(self) -> int:
+        return max(1, -(-len(self.df_full) // self.rows_per_page))
+
+    def _update_buttons(self):
+        paged = not self._infinite and len(self.df_full) > 0
+        self.btn_prev.setEnabled(paged and self.current_page > 1)
+        self.btn_next.setEnabled(paged and self.current_page < self._total_pages())
+
+    def set_dataframe(self, df: pd.DataFrame):
+        """Resultado nuevo: el modelo lo recibe entero una sola vez; después solo se mueve la ventana."""
+        if df is None:
+            df = pd.DataFrame()
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+            df = df.reset_index(drop=True)
+        self.df_full = df
         self.current_page = 1
+        self._version += 1
+        self._orders.clear()
+        self.table.set_dataframe(df)
+        if self._sort is not None:
+            # Un resultado nuevo sale con el mismo orden que el anterior
+            self.table.model.set_order(self._order_for(*self._sort))
         self._update_table()
 
+    # ---------- Orden ----------
+    def _order_for(self, column: str, descending: bool) -> np.ndarray | None:
+        key = (self._version, column, descending)
+        order = self._orders.get(key)
+        if order is None:
+            values = self.table.model.column_values(column)
+            order = sort_order(values, descending) if values is not None else None
+            self._orders[key] = order
+        return order
+
+    def sort_by(self, column: str | None, descending: bool = False):
+        """Ordena el resultado completo por 'column' (None: orden original) sin moverse de página."""
+        model = self.table.model
+        self._sort = (column, descending) if column else None
+        model.set_order(self._order_for(column, descending) if column else None)
+        self._sync_sort_indicator()
+        self._update_table()
+
+    def _sync_sort_indicator(self):
+        view = getattr(self.table, "view", None)
+        if view is None:
+            return
+        header = view.horizontalHeader()
+        header.blockSignals(True)
+        if self._sort is None:
+            header.setSortIndicatorShown(False)
+        else:
+            column, descending = self._sort
+            header.setSortIndicatorShown(True)
+            header.setSortIndicator(
+                self.table.model.column_index(column), Qt.DescendingOrder if descending else Qt.AscendingOrder
+            )
+        header.blockSignals(False)
+
+    def _on_header_clicked(self, section: int):
+        model = self.table.model
+        columns = model.columns()
+        column = columns[section] if 0 <= section < len(columns) else None
+        if column is None or model.column_values(column) is None:
+            # Columna de acción (o que no vino en el resultado): no se ordena
+            self._sync_sort_indicator()
+            return
+        if self._sort is None or self._sort[0] != column:
+            self.sort_by(column)
+        elif not self._sort[1]:
+            self.sort_by(column, True)
+        else:
+            self.sort_by(None)
+
     def _update_table(self):
+        model = self.table.model
+        view = getattr(self.table, "view", None)
+        if view is not None:
+            view.clearSelection()
+            view.scrollToTop()
+
         total_rows = len(self.df_full)
-        if total_rows == 0:
-            self.table.set_dataframe(pd.DataFrame(columns=self.df_full.columns))
+        if self._infinite:
+            model.set_infinite()
+            self.lbl_info.setText(f"{total_rows} filas")
+        elif total_rows == 0:
+            model.set_window(0, self.rows_per_page)
             self.lbl_info.setText("Página 0/0")
-            self.btn_prev.setEnabled(False)
-            self.btn_next.setEnabled(False)
+            self._update_buttons()
             return
+        else:
+            start = (self.current_page - 1) * self.rows_per_page
+            model.set_window(start, self.rows_per_page)
+            self.lbl_info.setText(f"Página {self.current_page}/{self._total_pages()}")
 
-        total_pages = max(1, -(-total_rows // self.rows_per_page))
-        start = (self.current_page - 1) * self.rows_per_page
-        end = start + self.rows_per_page
-        page_df = self.df_full.iloc[start:end]
-
-        self.table.set_dataframe(page_df)
-        self.lbl_info.setText(f"Página {self.current_page}/{total_pages}")
-
-        self.btn_prev.setEnabled(self.current_page > 1)
-        self.btn_next.setEnabled(self.current_page < total_pages)
-
+        self._update_buttons()
         self.on_page_change()
 
     def change_rows_per_page(self):
-        self.rows_per_page = int(self.cmb_rows.currentText())
+        text = self.cmb_rows.currentText()
+        self._infinite = text == ALL_ROWS
+        if not self._infinite:
+            self.rows_per_page = int(text)
         self.current_page = 1
         self._update_table()
 
     def next_page(self):
-        total_pages = max(1, -(-len(self.df_full) // self.rows_per_page))
-        if self.current_page < total_pages:
+        if self._infinite:
+            return
+        if self.current_page < self._total_pages():
             self.current_page += 1
             self._update_table()
 
     def prev_page(self):
+        if self._infinite:
+            return
         if self.current_page > 1:
             self.current_page -= 1
             self._update_table()
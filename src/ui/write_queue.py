@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from src.data import storage as ux
+
+# ============================================================================
+# Guardados sin congelar la ventana
+# ============================================================================
+# Envoltorio Qt de storage.write_behind(): el guardado vuelve enseguida y el
+# resultado llega como señal en el hilo de la UI.
+#
+#     write_queue().save("clientes", payload, on_saved=self._on_saved)
+#     write_queue().failed.connect(lambda tabla, msg: ...)
+
+class WriteQueue(QObject):
+    saved = Signal(str, object)    # tabla, id
+    failed = Signal(str, str)      # tabla, mensaje
+    _done = Signal(int, str, object, str)  # ticket, tabla, resultado, error (desde el hilo de escritura)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._writer = ux.write_behind()
+        self._callbacks: Dict[int, tuple] = {}
+        self._ticket = 0
+        # Conexión encolada: el slot corre en el hilo de este objeto (la UI)
+        self._done.connect(self._on_done)
+
+    def _track(self, table: str, on_saved, on_error) -> Callable[[Any, str], None]:
+        self._ticket += 1
+        ticket = self._ticket
+        self._callbacks[ticket] = (on_saved, on_error)
+        return lambda result, error: self._done.emit(ticket, table, result, error)
+
+    def save(self, table: str, data: Dict[str, Any],
+             on_saved: Callable[[Any], None] | None = None,
+             on_error: Callable[[str], None] | None = None) -> None:
+        """Upsert diferido de clientes / vehiculos / proveedores."""
+        self._writer.save(table, data, self._track(table, on_saved, on_error))
+
+    def append_factura(self, data: Dict[str, Any],
+                       on_saved: Callable[[Any], None] | None = None,
+                       on_error: Callable[[str], None] | None = None) -> None:
+        self._writer.append_factura(data, self._track("facturas", on_saved, on_error))
+
+    def compact(self) -> None:
+        self._writer.compact(self._track("*", None, None))
+
+    def pending(self) -> int:
+        return self._writer.pending()
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Graba todo lo pendiente (al salir)."""
+        return self._writer.close(timeout)
+
+    @Slot(int, str, object, str)
+    def _on_done(self, ticket: int, table: str, result: Any, error: str) -> None:
+        on_saved, on_error = self._callbacks.pop(ticket, (None, None))
+        callback, args = (on_error, (error,)) if error else (on_saved, (result,))
+        if error:
+            self.failed.emit(table, error)
+        else:
+            self.saved.emit(table, result)
+        if callback is not None:
+            try:
+                callback(*args)
+            except RuntimeError:
+                pass  # la página que pidió el guardado ya no existe
+
+
+_QUEUE: WriteQueue | None = None
+
+def write_queue() -> WriteQueue:
+    """Instancia única, creada en el hilo de la UI."""
+    global _QUEUE
+    if _QUEUE is None:
+        _QUEUE = WriteQueue()
+    return _QUEUE
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import os
+import tempfile
+
+# Carpeta de datos propia antes de importar src (settings lee el entorno al importarse)
+_DIR = tempfile.mkdtemp(prefix="gestion_tests_")
+os.environ["APP_EXCEL_DIR"] = _DIR
+os.environ["APP_SQLITE_PATH"] = os.path.join(_DIR, "gestion.db")
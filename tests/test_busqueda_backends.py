@@ -0,0 +1,92 @@
+"""
+Los dos backends (Excel y SQLite) tienen que encontrar las mismas filas para
+los mismos filtros: DNI / CUIT y Nº de cuadro / motor, completos o fragmentos.
+
+Uso (desde la raíz del repo):
+    python -m pytest -q
+"""
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from benchmarks import datasets
+from src.data import storage_sqlite as sq
+from src.data import util_excel as ux
+
+N = 300
+
+
+@pytest.fixture(scope="module")
+def data():
+    data = datasets.dataset(N, seed=7)
+    veh = data["vehiculos"]
+    # Un cuadro que es prefijo de otro: el completo tiene que traer solo el suyo
+    extra = veh.iloc[:2].copy()
+    extra["id"] = [N + 1, N + 2]
+    extra["nro_cuadro"] = ["9ABC1234", "9ABC12345"]
+    extra["nro_motor"] = ["XM000001", "XM0000012"]
+    data["vehiculos"] = pd.concat([veh, extra], ignore_index=True)
+    ux.write_clientes_df(data["clientes"])
+    ux.write_vehiculos_df(data["vehiculos"])
+    ux.write_proveedores_df(data["proveedores"])
+    ux.write_facturas_df(data["facturas"])
+    sq.import_from_excel()
+    return data
+
+
+def _ids(df: pd.DataFrame) -> list:
+    return sorted(int(float(v)) for v in df["id"])
+
+
+def _dotted(dni: str) -> str:
+    return f"{int(dni):,}".replace(",", ".")
+
+
+def _cases(data):
+    cli = data["clientes"]
+    veh = data["vehiculos"]
+    prov = data["proveedores"]
+    dni = str(cli["dni"].iloc[10])
+    cuit = next(c for c in cli["cuit"] if c)
+    cuadro = str(veh["nro_cuadro"].iloc[20])
+    motor = str(veh["nro_motor"].iloc[30])
+    return [
+        ("clientes", {"dni": dni}),
+        ("clientes", {"dni": _dotted(dni)}),
+        ("clientes", {"dni": dni[:4]}),
+        ("clientes", {"cuit": cuit}),
+        ("clientes", {"cuit": cuit.replace("-", "")}),
+        ("clientes", {"cuit": cuit[:5]}),
+        ("vehiculos", {"nro_cuadro": cuadro}),
+        ("vehiculos", {"nro_cuadro": cuadro.lower()}),
+        ("vehiculos", {"nro_cuadro": cuadro[4:11]}),
+        ("vehiculos", {"nro_cuadro": "9ABC1234"}),
+        ("vehiculos", {"nro_cuadro": "9abc123"}),
+        ("vehiculos", {"nro_motor": motor}),
+        ("vehiculos", {"nro_motor": "XM000001"}),
+        ("vehiculos", {"nro_motor": motor[:8]}),
+        ("proveedores", {"cuit": str(prov["cuit"].iloc[5])}),
+        ("proveedores", {"cuit": str(prov["cuit"].iloc[5]).replace("-", "")}),
+    ]
+
+
+def test_mismas_filas_en_los_dos_backends(data):
+    loaders = {
+        "clientes": (ux.load_clientes, sq.load_clientes),
+        "vehiculos": (ux.load_vehiculos, sq.load_vehiculos),
+        "proveedores": (ux.load_proveedores, sq.load_proveedores),
+    }
+    for table, filters in _cases(data):
+        load_excel, load_sqlite = loaders[table]
+        excel = _ids(load_excel(filters))
+        sqlite = _ids(load_sqlite(filters))
+        assert excel, (table, filters)
+        assert excel == sqlite, (table, filters)
+
+
+def test_codigo_completo_es_exacto(data):
+    for load in (ux.load_vehiculos, sq.load_vehiculos):
+        assert _ids(load({"nro_cuadro": "9ABC1234"})) == [N + 1]
+        assert _ids(load({"nro_motor": "xm000001"})) == [N + 1]
+        assert _ids(load({"nro_cuadro": "9ABC123"})) == [N + 1, N + 2]
@@ -0,0 +1,34 @@
+"""
+Numeración de facturas en los dos backends: una reserva sin CAE vence, un
+número autorizado por ARCA no vence ni se libera hasta registrarse.
+"""
+from __future__ import annotations
+
+import pytest
+
+from src.data import storage_sqlite as sq
+from src.data import util_excel as ux
+
+PV = "0009"
+
+
+@pytest.fixture(params=["excel", "sqlite"])
+def backend(request, monkeypatch):
+    # Toda reserva sin autorizar ya está vencida
+    monkeypatch.setattr(ux, "_SEQ_TTL_S", -1)
+    return ux if request.param == "excel" else sq
+
+
+def test_autorizado_no_vence_ni_se_libera(backend):
+    autorizado = backend.reserve_numero_factura(PV)
+    backend.authorize_numero_factura(autorizado)
+    backend.release_numero_factura(autorizado)
+    pendiente = backend.reserve_numero_factura(PV)
+    assert pendiente != autorizado
+    # La reserva sin CAE sí vence: el próximo la reutiliza
+    assert backend.reserve_numero_factura(PV) == pendiente
+    assert backend.authorized_numeros_factura(PV) == [autorizado]
+
+    backend.append_factura({"numero": autorizado, "fecha": "2025-01-01", "total": 1000.0})
+    assert backend.authorized_numeros_factura(PV) == []
+    assert backend.reserve_numero_factura(PV) == pendiente